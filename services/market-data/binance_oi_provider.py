@@ -131,39 +131,44 @@ class BinanceOIProvider(BaseExchangeOIProvider):
                 ticker_data = await ticker_response.json()
                 funding_data = await funding_response.json()
             
-            # Extract data
-            oi_tokens = float(oi_data['openInterest'])
-            price = float(ticker_data['lastPrice'])
-            volume_24h = float(ticker_data['volume'])
-            funding_rate = float(funding_data['lastFundingRate'])
-            
-            # Calculate USD values
-            oi_usd = oi_tokens * price  # Linear: tokens × price
-            volume_24h_usd = volume_24h * price
-            
-            return MarketOIData(
-                exchange="binance",
-                symbol=symbol,
-                base_symbol=base_symbol,
-                market_type=market_type,
-                oi_tokens=oi_tokens,
-                oi_usd=oi_usd,
-                price=price,
-                funding_rate=funding_rate,
-                volume_24h=volume_24h,
-                volume_24h_usd=volume_24h_usd,
-                timestamp=datetime.now(),
-                api_source=f"FAPI:{symbol}",
-                calculation_method=f"linear: {oi_tokens:,.0f} × ${price:,.2f}",
-                price_validated=False,
-                calculation_validated=False,
-                api_validated=False
-            )
+            return self._build_fapi_market(base_symbol, market_type, symbol, oi_data, ticker_data, funding_data)
             
         except Exception as e:
             logger.error(f"❌ Binance FAPI {market_type.value} error: {str(e)}")
             return None
     
+    def _build_fapi_market(self, base_symbol: str, market_type: MarketType, symbol: str,
+                           oi_data: Dict, ticker_data: Dict, funding_data: Dict) -> MarketOIData:
+        """Build a linear market from openInterest, ticker/24hr and premiumIndex rows"""
+        # Extract data
+        oi_tokens = float(oi_data['openInterest'])
+        price = float(ticker_data['lastPrice'])
+        volume_24h = float(ticker_data['volume'])
+        funding_rate = float(funding_data.get('lastFundingRate', 0.0) or 0.0)
+        
+        # Calculate USD values
+        oi_usd = oi_tokens * price  # Linear: tokens × price
+        volume_24h_usd = volume_24h * price
+        
+        return MarketOIData(
+            exchange="binance",
+            symbol=symbol,
+            base_symbol=base_symbol,
+            market_type=market_type,
+            oi_tokens=oi_tokens,
+            oi_usd=oi_usd,
+            price=price,
+            funding_rate=funding_rate,
+            volume_24h=volume_24h,
+            volume_24h_usd=volume_24h_usd,
+            timestamp=datetime.now(),
+            api_source=f"FAPI:{symbol}",
+            calculation_method=f"linear: {oi_tokens:,.0f} × ${price:,.2f}",
+            price_validated=False,
+            calculation_validated=False,
+            api_validated=False
+        )
+    
     async def _fetch_dapi_market(self, base_symbol: str, market_type: MarketType) -> Optional[MarketOIData]:
         """Fetch DAPI market data (USD inverse contracts)"""
         try:
@@ -187,46 +192,109 @@ class BinanceOIProvider(BaseExchangeOIProvider):
                 if isinstance(funding_data, list) and len(funding_data) > 0:
                     funding_data = funding_data[0]
             
-            # Extract data with validation
-            oi_contracts = float(oi_data['openInterest'])  # Contract units
-            price = float(ticker_data['lastPrice'])
-            volume_24h_contracts = float(ticker_data['volume'])
-            funding_rate = float(funding_data['lastFundingRate'])
-            
-            # DAPI Inverse Contract Calculation
-            # Each contract = $100 USD worth of BTC
-            # OI in tokens = (contracts × $100) / price
-            contract_value_usd = 100.0  # $100 per contract
-            oi_usd = oi_contracts * contract_value_usd
-            oi_tokens = oi_usd / price
-            
-            # Volume calculation
-            volume_24h_usd = volume_24h_contracts * contract_value_usd
-            volume_24h = volume_24h_usd / price
-            
-            return MarketOIData(
-                exchange="binance",
-                symbol=symbol,
-                base_symbol=base_symbol,
-                market_type=market_type,
-                oi_tokens=oi_tokens,
-                oi_usd=oi_usd,
-                price=price,
-                funding_rate=funding_rate,
-                volume_24h=volume_24h,
-                volume_24h_usd=volume_24h_usd,
-                timestamp=datetime.now(),
-                api_source=f"DAPI:{symbol}",
-                calculation_method=f"inverse: {oi_contracts:,.0f} contracts × $100 ÷ ${price:,.2f}",
-                price_validated=False,
-                calculation_validated=False,
-                api_validated=False
-            )
+            return self._build_dapi_market(base_symbol, market_type, symbol, oi_data, ticker_data, funding_data)
             
         except Exception as e:
             logger.error(f"❌ Binance DAPI {market_type.value} error: {str(e)}")
             return None
     
+    def _build_dapi_market(self, base_symbol: str, market_type: MarketType, symbol: str,
+                           oi_data: Dict, ticker_data: Dict, funding_data: Dict) -> MarketOIData:
+        """Build an inverse market from openInterest, ticker/24hr and premiumIndex rows"""
+        # Extract data with validation
+        oi_contracts = float(oi_data['openInterest'])  # Contract units
+        price = float(ticker_data['lastPrice'])
+        volume_24h_contracts = float(ticker_data['volume'])
+        funding_rate = float(funding_data.get('lastFundingRate', 0.0) or 0.0)
+        
+        # DAPI Inverse Contract Calculation
+        # Each contract = $100 USD worth of BTC
+        # OI in tokens = (contracts × $100) / price
+        contract_value_usd = 100.0  # $100 per contract
+        oi_usd = oi_contracts * contract_value_usd
+        oi_tokens = oi_usd / price
+        
+        # Volume calculation
+        volume_24h_usd = volume_24h_contracts * contract_value_usd
+        volume_24h = volume_24h_usd / price
+        
+        return MarketOIData(
+            exchange="binance",
+            symbol=symbol,
+            base_symbol=base_symbol,
+            market_type=market_type,
+            oi_tokens=oi_tokens,
+            oi_usd=oi_usd,
+            price=price,
+            funding_rate=funding_rate,
+            volume_24h=volume_24h,
+            volume_24h_usd=volume_24h_usd,
+            timestamp=datetime.now(),
+            api_source=f"DAPI:{symbol}",
+            calculation_method=f"inverse: {oi_contracts:,.0f} contracts × $100 ÷ ${price:,.2f}",
+            price_validated=False,
+            calculation_validated=False,
+            api_validated=False
+        )
+    
+    async def get_oi_data_bulk(self, base_symbols: List[str], max_concurrency: int = 8) -> Dict[str, ExchangeOIResult]:
+        """
+        Get OI data for many base symbols from shared listings
+        
+        ticker/24hr and premiumIndex come from shared all-symbol snapshots
+        (funding defaults to 0 when premiumIndex is unavailable).
+        Binance has no all-symbol open interest endpoint, so openInterest is
+        still requested per contract - only for contracts the ticker listing
+        shows exist.
+        """
+        session = await self.get_session()
+        listings, listing_errors = await self.get_snapshots({
+            name: (lambda name=name: self._fetch_listing(self.endpoints[name]))
+            for name in ('fapi_ticker', 'fapi_funding', 'dapi_ticker', 'dapi_funding')
+        }, optional=('fapi_funding', 'dapi_funding'))
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch_market(base_symbol: str, market_type: MarketType) -> Optional[MarketOIData]:
+            api = 'dapi' if market_type == MarketType.USD else 'fapi'
+            symbol = self.format_symbol(base_symbol, market_type)
+            ticker_data = listings[f'{api}_ticker'].get(symbol)
+            if ticker_data is None:
+                return None  # Contract not listed
+            
+            try:
+                async with semaphore:
+                    async with session.get(f"{self.endpoints[f'{api}_oi']}?symbol={symbol}") as response:
+                        oi_data = await response.json()
+                
+                funding_data = listings[f'{api}_funding'].get(symbol, {})
+                build = self._build_dapi_market if api == 'dapi' else self._build_fapi_market
+                return build(base_symbol, market_type, symbol, oi_data, ticker_data, funding_data)
+            except Exception as e:
+                logger.error(f"❌ Binance {api.upper()} {symbol} error: {str(e)}")
+                return None
+        
+        market_types = self.get_supported_market_types()
+        per_symbol = await asyncio.gather(*(
+            asyncio.gather(*(fetch_market(base_symbol, market_type) for market_type in market_types))
+            for base_symbol in base_symbols
+        ))
+        
+        return {
+            base_symbol: self.build_exchange_result(base_symbol, [m for m in markets if m is not None],
+                                                    list(listing_errors))
+            for base_symbol, markets in zip(base_symbols, per_symbol)
+        }
+    
+    async def _fetch_listing(self, url: str) -> Dict[str, Dict]:
+        """All-symbol listing keyed by symbol"""
+        session = await self.get_session()
+        async with session.get(url) as response:
+            rows = await response.json()
+        if not isinstance(rows, list):
+            raise ValueError(f"Unexpected listing response: {rows}")
+        return {row['symbol']: row for row in rows}
+    
     def _calculate_inverse_usd(self, oi_tokens: float, price: float) -> float:
         """Binance-specific inverse calculation (already handled in _fetch_dapi_market)"""
         # For DAPI, this is already calculated correctly in _fetch_dapi_market
@@ -5,7 +5,6 @@ Based on the exact working code from crypto-assistant-perf that was verified
 """
 
 import asyncio
-import aiohttp
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from loguru import logger
@@ -27,8 +26,8 @@ class BitgetOIProviderWorking(BaseExchangeOIProvider):
         super().__init__("bitget")
         
         # Bitget API configuration from Agent 2's working system
-        self.bitget_oi_url = "https://api.bitget.com/api/mix/v1/market/open-interest"
-        self.bitget_ticker_url = "https://api.bitget.com/api/mix/v1/market/ticker"
+        self.bitget_tickers_url = "https://api.bitget.com/api/mix/v1/market/tickers"
+        self.product_types = {'USDT': 'umcbl', 'USD': 'dmcbl'}  # Settlement -> V1 Mix productType
     
     def get_supported_market_types(self) -> List[MarketType]:
         """Bitget supports USDT linear and USD inverse (no USDC)"""
@@ -59,13 +58,11 @@ class BitgetOIProviderWorking(BaseExchangeOIProvider):
                 'USD': f'{base_symbol.upper()}USD_DMCBL'       # Inverse USD (Coin-margined)
             }
             
-            session = await self.get_session()
-            
             # Fetch both settlement types in parallel (Agent 2's proven approach)
             tasks = []
             for settlement, bitget_symbol in bitget_symbols.items():
                 market_type = MarketType.USDT if settlement == 'USDT' else MarketType.USD
-                tasks.append(self._fetch_bitget_settlement(session, base_symbol, bitget_symbol, settlement, market_type))
+                tasks.append(self._fetch_bitget_settlement(base_symbol, bitget_symbol, settlement, market_type))
             
             settlement_results = await asyncio.gather(*tasks, return_exceptions=True)
             
@@ -114,98 +111,120 @@ class BitgetOIProviderWorking(BaseExchangeOIProvider):
         
         return result
     
-    async def _fetch_bitget_settlement(self, session: aiohttp.ClientSession, base_symbol: str, bitget_symbol: str, settlement: str, market_type: MarketType) -> Optional[MarketOIData]:
-        """Fetch Bitget OI data for a specific settlement currency - Agent 2's WORKING implementation"""
+    async def _fetch_bitget_settlement(self, base_symbol: str, bitget_symbol: str, settlement: str, market_type: MarketType) -> Optional[MarketOIData]:
+        """Fetch Bitget OI data for a specific settlement currency from the shared product-wide tickers snapshot"""
         try:
-            # Step 1: Get Open Interest data (Agent 2's exact approach)
-            params = {'symbol': bitget_symbol}
-            
-            async with session.get(self.bitget_oi_url, params=params) as response:
-                if response.status != 200:
-                    logger.debug(f"Bitget OI API HTTP {response.status} for {bitget_symbol}")
-                    return None
-                
-                oi_response = await response.json()
-                
-                if oi_response.get('code') != '00000':
-                    logger.debug(f"Bitget OI API error for {bitget_symbol}: {oi_response.get('msg')}")
-                    return None
-                
-                oi_data = oi_response.get('data')
-                if not oi_data:
-                    logger.debug(f"Bitget OI no data for {bitget_symbol}")
-                    return None
-                
-                # Extract OI data (CORRECTED field usage based on actual API)
-                open_interest = float(oi_data.get('amount', 0))  # API returns 'amount' not 'openInterest'
-                open_interest_usd = 0  # Calculate from amount × price
+            tickers = await self._product_tickers(settlement)
             
-            # Step 2: Get additional market data from ticker endpoint (Agent 2's approach)
-            ticker_params = {'symbol': bitget_symbol}
-            
-            async with session.get(self.bitget_ticker_url, params=ticker_params) as ticker_response:
-                if ticker_response.status != 200:
-                    logger.debug(f"Bitget ticker API HTTP {ticker_response.status} for {bitget_symbol}")
-                    return None
-                
-                ticker_data_response = await ticker_response.json()
-                if ticker_data_response.get('code') != '00000':
-                    logger.debug(f"Bitget ticker API error for {bitget_symbol}: {ticker_data_response.get('msg')}")
-                    return None
-                
-                ticker = ticker_data_response.get('data')
-                if not ticker:
-                    logger.debug(f"Bitget ticker no data for {bitget_symbol}")
-                    return None
-                
-                price = float(ticker.get('last', 0))
-                # Fix: Use baseVolume for BTC volume, not usdtVol
-                base_volume_24h = float(ticker.get('baseVolume', 0))  # 24h volume in BTC
-                volume_24h_usd = float(ticker.get('usdtVolume', 0))   # 24h volume in USD
-                funding_rate = float(ticker.get('fundingRate', 0))
-            
-            # Step 3: Calculate token amounts (CORRECTED calculation)
-            if settlement == 'USD':  # Inverse contracts
-                # For inverse contracts, amount is in contracts, convert to BTC
-                oi_tokens = open_interest  # Contract amount in BTC
-                oi_usd = oi_tokens * price
-                volume_24h = base_volume_24h  # Use base volume directly (already in BTC)
-                calculation_method = f"inverse: {oi_tokens:,.0f} BTC contracts × ${price:,.2f}"
-            else:  # Linear USDT
-                # For linear contracts, amount is in token units (BTC)
-                oi_tokens = open_interest  # Already in BTC
-                oi_usd = oi_tokens * price
-                volume_24h = base_volume_24h  # Use base volume directly (already in BTC)
-                calculation_method = f"linear: {oi_tokens:,.0f} BTC × ${price:,.2f}"
-            
-            if oi_tokens <= 0 or price <= 0:
-                logger.debug(f"Bitget {bitget_symbol}: Invalid OI ({oi_tokens}) or price ({price})")
+            ticker = tickers.get(bitget_symbol)
+            if not ticker:
+                logger.debug(f"Bitget ticker no data for {bitget_symbol}")
                 return None
             
-            logger.info(f"Bitget {bitget_symbol} ({settlement}): {oi_tokens:,.2f} tokens, ${oi_usd:,.2f} USD")
+            # The tickers listing carries open interest as holdingAmount
+            # (same units as the open-interest endpoint's amount)
+            open_interest = float(ticker.get('holdingAmount', 0))
             
-            return MarketOIData(
-                exchange="bitget",
-                symbol=bitget_symbol,
-                base_symbol=base_symbol,
-                market_type=market_type,
-                oi_tokens=oi_tokens,
-                oi_usd=oi_usd,
-                price=price,
-                funding_rate=funding_rate,
-                volume_24h=volume_24h,
-                volume_24h_usd=volume_24h_usd,
-                timestamp=datetime.now(),
-                api_source=f"V1-Mix-{settlement}:{bitget_symbol}",
-                calculation_method=calculation_method,
-                price_validated=False,
-                calculation_validated=False,
-                api_validated=False
-            )
+            return self._build_settlement_market(base_symbol, bitget_symbol, settlement, market_type, open_interest, ticker)
                 
         except Exception as e:
             logger.warning(f"Error fetching Bitget {settlement} for {base_symbol}: {e}")
             return None
+    
+    def _build_settlement_market(self, base_symbol: str, bitget_symbol: str, settlement: str, market_type: MarketType,
+                                 open_interest: float, ticker: Dict) -> Optional[MarketOIData]:
+        """Build a market from an open interest amount and a V1 Mix ticker row"""
+        price = float(ticker.get('last', 0))
+        # Fix: Use baseVolume for BTC volume, not usdtVol
+        base_volume_24h = float(ticker.get('baseVolume', 0))  # 24h volume in BTC
+        volume_24h_usd = float(ticker.get('usdtVolume', 0))   # 24h volume in USD
+        funding_rate = float(ticker.get('fundingRate', 0))
+        
+        # Step 3: Calculate token amounts (CORRECTED calculation)
+        if settlement == 'USD':  # Inverse contracts
+            # For inverse contracts, amount is in contracts, convert to BTC
+            oi_tokens = open_interest  # Contract amount in BTC
+            oi_usd = oi_tokens * price
+            volume_24h = base_volume_24h  # Use base volume directly (already in BTC)
+            calculation_method = f"inverse: {oi_tokens:,.0f} BTC contracts × ${price:,.2f}"
+        else:  # Linear USDT
+            # For linear contracts, amount is in token units (BTC)
+            oi_tokens = open_interest  # Already in BTC
+            oi_usd = oi_tokens * price
+            volume_24h = base_volume_24h  # Use base volume directly (already in BTC)
+            calculation_method = f"linear: {oi_tokens:,.0f} BTC × ${price:,.2f}"
+        
+        if oi_tokens <= 0 or price <= 0:
+            logger.debug(f"Bitget {bitget_symbol}: Invalid OI ({oi_tokens}) or price ({price})")
+            return None
+        
+        logger.info(f"Bitget {bitget_symbol} ({settlement}): {oi_tokens:,.2f} tokens, ${oi_usd:,.2f} USD")
+        
+        return MarketOIData(
+            exchange="bitget",
+            symbol=bitget_symbol,
+            base_symbol=base_symbol,
+            market_type=market_type,
+            oi_tokens=oi_tokens,
+            oi_usd=oi_usd,
+            price=price,
+            funding_rate=funding_rate,
+            volume_24h=volume_24h,
+            volume_24h_usd=volume_24h_usd,
+            timestamp=datetime.now(),
+            api_source=f"V1-Mix-{settlement}:{bitget_symbol}",
+            calculation_method=calculation_method,
+            price_validated=False,
+            calculation_validated=False,
+            api_validated=False
+        )
+    
+    async def get_oi_data_bulk(self, base_symbols: List[str], max_concurrency: int = 4) -> Dict[str, ExchangeOIResult]:
+        """Get OI data for many base symbols from the per-product-type tickers snapshots"""
+        listings, listing_errors = await self.get_snapshots({
+            settlement: (lambda product_type=product_type: self._fetch_product_tickers(product_type))
+            for settlement, product_type in self.product_types.items()
+        })
+        
+        market_types = {'USDT': MarketType.USDT, 'USD': MarketType.USD}
+        results = {}
+        for base_symbol in base_symbols:
+            markets = []
+            for settlement, market_type in market_types.items():
+                bitget_symbol = self.format_symbol(base_symbol, market_type)
+                ticker = listings[settlement].get(bitget_symbol)
+                if not ticker:
+                    continue
+                try:
+                    open_interest = float(ticker.get('holdingAmount', 0))
+                    market = self._build_settlement_market(base_symbol, bitget_symbol, settlement, market_type,
+                                                           open_interest, ticker)
+                except Exception as e:
+                    logger.warning(f"Error building Bitget {settlement} for {base_symbol}: {e}")
+                    continue
+                if market is not None:
+                    markets.append(market)
+            results[base_symbol] = self.build_exchange_result(base_symbol, markets, list(listing_errors),
+                                                              validation_passed=len(markets) > 0)
+        
+        return results
+    
+    async def _product_tickers(self, settlement: str) -> Dict[str, Dict]:
+        """Product-wide tickers for a settlement from the shared snapshot cache"""
+        product_type = self.product_types[settlement]
+        return await self.get_snapshot(settlement, lambda: self._fetch_product_tickers(product_type))
+    
+    async def _fetch_product_tickers(self, product_type: str) -> Dict[str, Dict]:
+        """Every ticker of a product type keyed by symbol"""
+        session = await self.get_session()
+        async with session.get(self.bitget_tickers_url, params={'productType': product_type}) as response:
+            if response.status != 200:
+                raise ValueError(f"HTTP {response.status}")
+            tickers_response = await response.json()
+        if tickers_response.get('code') != '00000':
+            raise ValueError(f"code {tickers_response.get('code')}: {tickers_response.get('msg')}")
+        return {t.get('symbol'): t for t in tickers_response.get('data') or []}
+
 
 # Testing function
 async def test_bitget_working():
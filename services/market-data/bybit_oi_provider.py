@@ -123,125 +123,170 @@ class BybitOIProvider(BaseExchangeOIProvider):
         try:
             symbol = self.format_symbol(base_symbol, market_type)
             category = self.categories[market_type]
-            session = await self.get_session()
             
-            # Use ticker API which includes OI data (OI endpoint requires IntervalTime param)
-            ticker_params = {"category": category, "symbol": symbol}
-            async with session.get(self.endpoints['ticker'], params=ticker_params) as response:
-                ticker_response = await response.json()
+            # Use ticker API which includes OI data (OI endpoint requires IntervalTime param),
+            # resolved from the shared category-wide snapshot
+            tickers = await self._category_tickers(category)
             
             # Extract ticker data (includes OI, price, volume, funding)
-            if (ticker_response.get('retCode') != 0 or 
-                not ticker_response.get('result', {}).get('list')):
+            ticker_data = tickers.get(symbol)
+            if not ticker_data:
                 logger.warning(f"⚠️ Bybit {market_type.value} ticker data unavailable")
                 return None
                 
-            ticker_data = ticker_response['result']['list'][0]
-            
-            # Extract all data from ticker API
-            oi_tokens = float(ticker_data['openInterest'])
-            price = float(ticker_data['lastPrice'])
-            volume_24h = float(ticker_data['volume24h'])
-            funding_rate = float(ticker_data.get('fundingRate', 0.0))
-            
-            # Calculate USD values (Linear: tokens × price)
-            oi_usd = oi_tokens * price
-            volume_24h_usd = volume_24h * price
-            
-            return MarketOIData(
-                exchange="bybit",
-                symbol=symbol,
-                base_symbol=base_symbol,
-                market_type=market_type,
-                oi_tokens=oi_tokens,
-                oi_usd=oi_usd,
-                price=price,
-                funding_rate=funding_rate,
-                volume_24h=volume_24h,
-                volume_24h_usd=volume_24h_usd,
-                timestamp=datetime.now(),
-                api_source=f"V5-Linear:{symbol}",
-                calculation_method=f"linear: {oi_tokens:,.0f} × ${price:,.2f}",
-                price_validated=False,
-                calculation_validated=False,
-                api_validated=False
-            )
+            return self._build_linear_market(base_symbol, market_type, symbol, ticker_data)
             
         except Exception as e:
             logger.error(f"❌ Bybit Linear {market_type.value} error: {str(e)}")
             return None
     
+    def _build_linear_market(self, base_symbol: str, market_type: MarketType, symbol: str,
+                             ticker_data: Dict) -> MarketOIData:
+        """Build a linear market from a V5 tickers row (includes OI, price, volume, funding)"""
+        # Extract all data from ticker API
+        oi_tokens = float(ticker_data['openInterest'])
+        price = float(ticker_data['lastPrice'])
+        volume_24h = float(ticker_data['volume24h'])
+        funding_rate = float(ticker_data.get('fundingRate', 0.0))
+        
+        # Calculate USD values (Linear: tokens × price)
+        oi_usd = oi_tokens * price
+        volume_24h_usd = volume_24h * price
+        
+        return MarketOIData(
+            exchange="bybit",
+            symbol=symbol,
+            base_symbol=base_symbol,
+            market_type=market_type,
+            oi_tokens=oi_tokens,
+            oi_usd=oi_usd,
+            price=price,
+            funding_rate=funding_rate,
+            volume_24h=volume_24h,
+            volume_24h_usd=volume_24h_usd,
+            timestamp=datetime.now(),
+            api_source=f"V5-Linear:{symbol}",
+            calculation_method=f"linear: {oi_tokens:,.0f} × ${price:,.2f}",
+            price_validated=False,
+            calculation_validated=False,
+            api_validated=False
+        )
+    
     async def _fetch_inverse_market(self, base_symbol: str, market_type: MarketType) -> Optional[MarketOIData]:
         """Fetch inverse market data (USD coin-margined)"""
         try:
             symbol = self.format_symbol(base_symbol, market_type)
             category = self.categories[market_type]
-            session = await self.get_session()
             
-            # Use ticker API which includes all needed data
-            ticker_params = {"category": category, "symbol": symbol}
-            async with session.get(self.endpoints['ticker'], params=ticker_params) as response:
-                ticker_response = await response.json()
+            # Use ticker API which includes all needed data, from the shared category-wide snapshot
+            tickers = await self._category_tickers(category)
             
             # Extract ticker data
-            if (ticker_response.get('retCode') != 0 or 
-                not ticker_response.get('result', {}).get('list')):
+            ticker_data = tickers.get(symbol)
+            if not ticker_data:
                 logger.warning(f"⚠️ Bybit {market_type.value} ticker data unavailable")
                 return None
                 
-            ticker_data = ticker_response['result']['list'][0]
-            price = float(ticker_data['lastPrice'])
-            volume_24h = float(ticker_data['volume24h'])
-            funding_rate = float(ticker_data.get('fundingRate', 0.0))
-            
-            # Bybit Inverse Contract Calculation
-            # Ticker API provides both openInterest and openInterestValue
-            oi_raw = ticker_data.get('openInterest', '0')
-            oi_value = ticker_data.get('openInterestValue', '0')
-            
-            if float(oi_raw) > 0:
-                # Use openInterest (contract units) - correct for Bybit inverse
-                oi_contracts = float(oi_raw)
-                # For Bybit inverse: contracts represent USD notional, convert to tokens
-                oi_tokens = oi_contracts / price if price > 0 else 0
-                oi_usd = oi_tokens * price  # Standard calculation
-                calculation_method = f"inverse: {oi_contracts:,.0f} contracts ÷ ${price:,.2f}"
-            elif float(oi_value) > 0:
-                # Fallback: Use openInterestValue (already in token terms for inverse)
-                oi_tokens = float(oi_value)
-                oi_usd = oi_tokens * price
-                calculation_method = f"inverse: oi_value {oi_tokens:,.0f} tokens × ${price:,.2f}"
-            else:
-                logger.warning(f"⚠️ Bybit {market_type.value} no valid OI data")
-                return None
-            
-            # Volume calculation (similar approach)
-            volume_24h_usd = volume_24h  # Volume already in USD for inverse
-            volume_24h = volume_24h_usd / price if price > 0 else volume_24h
-            
-            return MarketOIData(
-                exchange="bybit",
-                symbol=symbol,
-                base_symbol=base_symbol,
-                market_type=market_type,
-                oi_tokens=oi_tokens,
-                oi_usd=oi_usd,
-                price=price,
-                funding_rate=funding_rate,
-                volume_24h=volume_24h,
-                volume_24h_usd=volume_24h_usd,
-                timestamp=datetime.now(),
-                api_source=f"V5-Inverse:{symbol}",
-                calculation_method=calculation_method,
-                price_validated=False,
-                calculation_validated=False,
-                api_validated=False
-            )
+            return self._build_inverse_market(base_symbol, market_type, symbol, ticker_data)
             
         except Exception as e:
             logger.error(f"❌ Bybit Inverse {market_type.value} error: {str(e)}")
             return None
     
+    def _build_inverse_market(self, base_symbol: str, market_type: MarketType, symbol: str,
+                              ticker_data: Dict) -> Optional[MarketOIData]:
+        """Build an inverse market from a V5 tickers row"""
+        price = float(ticker_data['lastPrice'])
+        volume_24h = float(ticker_data['volume24h'])
+        funding_rate = float(ticker_data.get('fundingRate', 0.0))
+        
+        # Bybit Inverse Contract Calculation
+        # Ticker API provides both openInterest and openInterestValue
+        oi_raw = ticker_data.get('openInterest', '0')
+        oi_value = ticker_data.get('openInterestValue', '0')
+        
+        if float(oi_raw) > 0:
+            # Use openInterest (contract units) - correct for Bybit inverse
+            oi_contracts = float(oi_raw)
+            # For Bybit inverse: contracts represent USD notional, convert to tokens
+            oi_tokens = oi_contracts / price if price > 0 else 0
+            oi_usd = oi_tokens * price  # Standard calculation
+            calculation_method = f"inverse: {oi_contracts:,.0f} contracts ÷ ${price:,.2f}"
+        elif float(oi_value) > 0:
+            # Fallback: Use openInterestValue (already in token terms for inverse)
+            oi_tokens = float(oi_value)
+            oi_usd = oi_tokens * price
+            calculation_method = f"inverse: oi_value {oi_tokens:,.0f} tokens × ${price:,.2f}"
+        else:
+            logger.warning(f"⚠️ Bybit {market_type.value} no valid OI data")
+            return None
+        
+        # Volume calculation (similar approach)
+        volume_24h_usd = volume_24h  # Volume already in USD for inverse
+        volume_24h = volume_24h_usd / price if price > 0 else volume_24h
+        
+        return MarketOIData(
+            exchange="bybit",
+            symbol=symbol,
+            base_symbol=base_symbol,
+            market_type=market_type,
+            oi_tokens=oi_tokens,
+            oi_usd=oi_usd,
+            price=price,
+            funding_rate=funding_rate,
+            volume_24h=volume_24h,
+            volume_24h_usd=volume_24h_usd,
+            timestamp=datetime.now(),
+            api_source=f"V5-Inverse:{symbol}",
+            calculation_method=calculation_method,
+            price_validated=False,
+            calculation_validated=False,
+            api_validated=False
+        )
+    
+    async def get_oi_data_bulk(self, base_symbols: List[str], max_concurrency: int = 4) -> Dict[str, ExchangeOIResult]:
+        """Get OI data for many base symbols from the linear and inverse tickers snapshots"""
+        listings, listing_errors = await self.get_snapshots({
+            category: (lambda category=category: self._fetch_category_tickers(category))
+            for category in ('linear', 'inverse')
+        })
+        
+        results = {}
+        for base_symbol in base_symbols:
+            markets = []
+            for market_type in self.get_supported_market_types():
+                symbol = self.format_symbol(base_symbol, market_type)
+                category = self.categories[market_type]
+                ticker_data = listings[category].get(symbol)
+                if ticker_data is None:
+                    continue
+                try:
+                    if category == 'inverse':
+                        market = self._build_inverse_market(base_symbol, market_type, symbol, ticker_data)
+                    else:
+                        market = self._build_linear_market(base_symbol, market_type, symbol, ticker_data)
+                except Exception as e:
+                    logger.error(f"❌ Bybit {symbol} error: {str(e)}")
+                    continue
+                if market is not None:
+                    markets.append(market)
+            results[base_symbol] = self.build_exchange_result(base_symbol, markets, list(listing_errors))
+        
+        return results
+    
+    async def _category_tickers(self, category: str) -> Dict[str, Dict]:
+        """Category-wide tickers from the shared snapshot cache"""
+        return await self.get_snapshot(category, lambda: self._fetch_category_tickers(category))
+    
+    async def _fetch_category_tickers(self, category: str) -> Dict[str, Dict]:
+        """Every ticker of a V5 category keyed by symbol"""
+        session = await self.get_session()
+        async with session.get(self.endpoints['ticker'], params={"category": category}) as response:
+            ticker_response = await response.json()
+        if ticker_response.get('retCode') != 0:
+            raise ValueError(f"retCode {ticker_response.get('retCode')}: {ticker_response.get('retMsg')}")
+        return {row['symbol']: row for row in ticker_response.get('result', {}).get('list', [])}
+    
     def _calculate_inverse_usd(self, oi_tokens: float, price: float) -> float:
         """Bybit-specific inverse calculation (handled in _fetch_inverse_market)"""
         return oi_tokens * price
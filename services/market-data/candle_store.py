@@ -0,0 +1,159 @@
+"""
+Shared OHLCV Candle Store for Crypto Trading Assistant
+Keeps a rolling in-memory window of candles per (exchange, symbol, timeframe)
+and refreshes it incrementally so analysis engines share one set of fetches
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from loguru import logger
+
+@dataclass
+class CandleSeries:
+    """Rolling window of OHLCV candles for one market"""
+    candles: List[list] = field(default_factory=list)
+    last_refresh: float = 0.0  # monotonic time of last successful refresh
+    history_exhausted: bool = False  # Last full download returned fewer candles than asked for
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+class CandleStore:
+    """
+    Process-wide OHLCV cache shared by all analysis engines
+
+    Candles are kept in ccxt format [timestamp, open, high, low, close, volume].
+    A refresh only requests candles from the last closed candle onwards, so
+    repeated calls cost one small request instead of a full history download.
+    Concurrent callers for the same key wait on a single refresh.
+    """
+
+    def __init__(self, exchanges: Dict, max_candles: int = 1000,
+                 min_fetch: int = 200, refresh_interval: float = 2.0):
+        self.exchanges = exchanges          # ExchangeManager.exchanges (name -> ccxt instance)
+        self.max_candles = max_candles      # Rolling window size per series
+        self.min_fetch = min_fetch          # Cold-start fetch size so later callers hit the cache
+        self.refresh_interval = refresh_interval  # Seconds a series is considered fresh
+        self.series: Dict[Tuple[str, str, str], CandleSeries] = {}
+        self.stats = {'hits': 0, 'incremental': 0, 'full': 0, 'passthrough': 0}
+
+    async def fetch_ohlcv(self, exchange: str, symbol: str, timeframe: str,
+                          limit: int = 100, since: Optional[int] = None) -> List[list]:
+        """
+        Drop-in replacement for ccxt fetch_ohlcv backed by the shared window
+
+        Args:
+            exchange: Exchange name as configured in ExchangeManager (e.g. 'binance_futures')
+            symbol: Trading pair (e.g. 'BTC/USDT')
+            timeframe: Candle timeframe ('15m', '1h', '4h')
+            limit: Number of candles to return
+            since: Optional start timestamp in ms for historical ranges
+        """
+        if exchange not in self.exchanges:
+            raise ValueError(f"Exchange {exchange} not configured")
+
+        ex = self.exchanges[exchange]
+
+        if limit > self.max_candles:
+            self.stats['passthrough'] += 1
+            return await ex.fetch_ohlcv(symbol, timeframe, limit=limit, since=since)
+
+        key = (exchange, symbol, timeframe)
+        series = self.series.get(key)
+        if series is None:
+            series = self.series.setdefault(key, CandleSeries())
+
+        if since is not None and not self._covers(ex, series, timeframe, limit, since):
+            # Older than the window holds or a refresh would fetch: don't refresh for nothing
+            self.stats['passthrough'] += 1
+            return await ex.fetch_ohlcv(symbol, timeframe, limit=limit, since=since)
+
+        async with series.lock:
+            await self._refresh(ex, series, symbol, timeframe, limit)
+            candles = series.candles
+
+        if since is None:
+            return [list(c) for c in candles[-limit:]]
+
+        # Historical range: serve from the window only if it fully covers the request
+        if candles and (candles[0][0] <= since or series.history_exhausted):
+            window = [list(c) for c in candles if c[0] >= since]
+            if len(window) >= limit or window[-1:] == candles[-1:]:
+                return window[:limit]
+
+        self.stats['passthrough'] += 1
+        return await ex.fetch_ohlcv(symbol, timeframe, limit=limit, since=since)
+
+    def _covers(self, ex, series: CandleSeries, timeframe: str, limit: int, since: int) -> bool:
+        """Whether the window holds, or its refresh would fetch, candles back to `since`"""
+        candles = series.candles
+        if series.history_exhausted or (candles and candles[0][0] <= since):
+            return True
+        if candles and len(candles) >= limit:
+            return False  # Refreshes only extend the window forwards
+        timeframe_ms = ex.parse_timeframe(timeframe) * 1000
+        fetch_limit = min(max(limit, self.min_fetch), self.max_candles)
+        return since >= time.time() * 1000 - (fetch_limit - 1) * timeframe_ms
+
+    async def _refresh(self, ex, series: CandleSeries, symbol: str, timeframe: str, limit: int):
+        """Bring a series up to date, fetching only what is missing"""
+        now = time.monotonic()
+        candles = series.candles
+        deep_enough = len(candles) >= limit or series.history_exhausted
+
+        if candles and deep_enough and now - series.last_refresh < self.refresh_interval:
+            self.stats['hits'] += 1
+            return
+
+        if not candles or not deep_enough:
+            # Cold start or deeper history requested: full download
+            await self._full_fetch(ex, series, symbol, timeframe, limit, now)
+            logger.debug(f"CandleStore full fetch {symbol} {timeframe}: {len(series.candles)} candles")
+            return
+
+        # The last candle is still forming - refetch from it onwards
+        since = candles[-1][0]
+        timeframe_ms = ex.parse_timeframe(timeframe) * 1000
+        gap = int((time.time() * 1000 - since) // timeframe_ms) + 2
+        if gap > self.max_candles:
+            await self._full_fetch(ex, series, symbol, timeframe, limit, now)
+            return
+
+        new_candles = await ex.fetch_ohlcv(symbol, timeframe, since=since, limit=gap)
+        series.candles = self._merge(candles, new_candles)
+        series.last_refresh = now
+        self.stats['incremental'] += 1
+
+    async def _full_fetch(self, ex, series: CandleSeries, symbol: str, timeframe: str, limit: int, now: float):
+        """Replace the window with the latest candles"""
+        fetch_limit = min(max(limit, self.min_fetch), self.max_candles)
+        series.candles = await ex.fetch_ohlcv(symbol, timeframe, limit=fetch_limit)
+        # A short answer means the market has no older history: don't redownload it every call
+        series.history_exhausted = len(series.candles) < fetch_limit
+        series.last_refresh = now
+        self.stats['full'] += 1
+
+    def _merge(self, candles: List[list], new_candles: List[list]) -> List[list]:
+        """Replace overlapping candles with fresh ones and trim to the window size"""
+        if not new_candles:
+            return candles
+
+        first_new = new_candles[0][0]
+        keep = len(candles)
+        while keep > 0 and candles[keep - 1][0] >= first_new:
+            keep -= 1
+
+        merged = candles[:keep] + new_candles
+        if len(merged) > self.max_candles:
+            merged = merged[-self.max_candles:]
+        return merged
+
+    def invalidate(self, exchange: str = None, symbol: str = None):
+        """Drop cached series, optionally filtered by exchange and/or symbol"""
+        for key in list(self.series.keys()):
+            if (exchange is None or key[0] == exchange) and (symbol is None or key[1] == symbol):
+                del self.series[key]
+
+# Example usage:
+# store = CandleStore(exchange_manager.exchanges)
+# candles = await store.fetch_ohlcv('binance', 'BTC/USDT', '15m', limit=96)
@@ -5,7 +5,6 @@ Based on the exact working code that was verified in crypto-assistant-perf
 """
 
 import asyncio
-import aiohttp
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from loguru import logger
@@ -59,15 +58,13 @@ class GateIOOIProviderWorking(BaseExchangeOIProvider):
         errors = []
         
         try:
-            session = await self.get_session()
-            
             # Fetch all three settlement types in parallel (proven working)
             tasks = []
-            for settlement, endpoint in self.gateio_endpoints.items():
+            for settlement in self.gateio_endpoints:
                 market_type = MarketType.USDT if settlement == 'USDT' else \
                              MarketType.USDC if settlement == 'USDC' else \
                              MarketType.USD
-                tasks.append(self._fetch_gateio_settlement(session, base_symbol, market_type, settlement, endpoint))
+                tasks.append(self._fetch_gateio_settlement(base_symbol, market_type, settlement))
             
             settlement_results = await asyncio.gather(*tasks, return_exceptions=True)
             
@@ -116,7 +113,7 @@ class GateIOOIProviderWorking(BaseExchangeOIProvider):
         
         return result
     
-    async def _fetch_gateio_settlement(self, session: aiohttp.ClientSession, base_symbol: str, market_type: MarketType, settlement: str, endpoint: str) -> Optional[MarketOIData]:
+    async def _fetch_gateio_settlement(self, base_symbol: str, market_type: MarketType, settlement: str) -> Optional[MarketOIData]:
         """Fetch Gate.io OI data for a specific settlement currency - Agent 2's WORKING implementation"""
         try:
             base_token = base_symbol.upper()
@@ -129,66 +126,103 @@ class GateIOOIProviderWorking(BaseExchangeOIProvider):
             else:  # USD (inverse)
                 gateio_symbol = f"{base_token}_USD"
             
-            # Fetch ticker data (proven working)
-            async with session.get(endpoint) as response:
-                if response.status != 200:
-                    return None
-                
-                data = await response.json()
-                
-                # Find our symbol in the tickers list (proven working logic)
-                ticker = None
-                for t in data:
-                    if t.get('contract') == gateio_symbol:
-                        ticker = t
-                        break
-                
-                if not ticker:
-                    logger.debug(f"Gate.io symbol {gateio_symbol} not found in {settlement} market")
-                    return None
-                
-                # Extract data (proven working) - CORRECTED FIELD USAGE
-                price = float(ticker.get('last', 0))
-                funding_rate = float(ticker.get('funding_rate', 0))
-                volume_24h_usd = float(ticker.get('volume_24h', 0))  # This is in USD
-                
-                # CRITICAL FIX: Use total_size with quanto_multiplier conversion
-                total_size = float(ticker.get('total_size', 0))  # This is in contract units
-                quanto_multiplier = float(ticker.get('quanto_multiplier', 0.0001))  # Default 0.0001 for most contracts
-                
-                # Convert contract units to BTC using quanto_multiplier
-                oi_tokens = total_size * quanto_multiplier
-                calculation_method = f"contracts: {total_size:,.0f} × {quanto_multiplier} = {oi_tokens:,.0f} BTC"
-                
-                oi_usd = oi_tokens * price
-                volume_24h = volume_24h_usd / price if price > 0 else 0
-                
-                if oi_tokens <= 0 or price <= 0:
-                    logger.debug(f"Gate.io {gateio_symbol}: Invalid OI ({oi_tokens}) or price ({price})")
-                    return None
-                
-                return MarketOIData(
-                    exchange="gateio",
-                    symbol=gateio_symbol,
-                    base_symbol=base_symbol,
-                    market_type=market_type,
-                    oi_tokens=oi_tokens,
-                    oi_usd=oi_usd,
-                    price=price,
-                    funding_rate=funding_rate,
-                    volume_24h=volume_24h,
-                    volume_24h_usd=volume_24h_usd,
-                    timestamp=datetime.now(),
-                    api_source=f"V4-{settlement}:{gateio_symbol}",
-                    calculation_method=calculation_method,
-                    price_validated=False,
-                    calculation_validated=False,
-                    api_validated=False
-                )
+            # Ticker data from the shared settlement-wide snapshot
+            tickers = await self._settlement_tickers(settlement)
+            
+            ticker = tickers.get(gateio_symbol)
+            if not ticker:
+                logger.debug(f"Gate.io symbol {gateio_symbol} not found in {settlement} market")
+                return None
+            
+            return self._build_settlement_market(base_symbol, market_type, settlement, gateio_symbol, ticker)
                 
         except Exception as e:
             logger.warning(f"Error fetching Gate.io {settlement} for {base_symbol}: {e}")
             return None
+    
+    async def _settlement_tickers(self, settlement: str) -> Dict[str, Dict]:
+        """Settlement-wide tickers from the shared snapshot cache"""
+        return await self.get_snapshot(settlement, lambda: self._fetch_settlement_tickers(self.gateio_endpoints[settlement]))
+    
+    async def _fetch_settlement_tickers(self, endpoint: str) -> Dict[str, Dict]:
+        """Every ticker of a settlement keyed by contract"""
+        session = await self.get_session()
+        async with session.get(endpoint) as response:
+            if response.status != 200:
+                raise ValueError(f"HTTP {response.status}")
+            data = await response.json()
+        return {t.get('contract'): t for t in data}
+    
+    def _build_settlement_market(self, base_symbol: str, market_type: MarketType, settlement: str,
+                                 gateio_symbol: str, ticker: Dict) -> Optional[MarketOIData]:
+        """Build a market from a Gate.io futures tickers row"""
+        # Extract data (proven working) - CORRECTED FIELD USAGE
+        price = float(ticker.get('last', 0))
+        funding_rate = float(ticker.get('funding_rate', 0))
+        volume_24h_usd = float(ticker.get('volume_24h', 0))  # This is in USD
+        
+        # CRITICAL FIX: Use total_size with quanto_multiplier conversion
+        total_size = float(ticker.get('total_size', 0))  # This is in contract units
+        quanto_multiplier = float(ticker.get('quanto_multiplier', 0.0001))  # Default 0.0001 for most contracts
+        
+        # Convert contract units to BTC using quanto_multiplier
+        oi_tokens = total_size * quanto_multiplier
+        calculation_method = f"contracts: {total_size:,.0f} × {quanto_multiplier} = {oi_tokens:,.0f} BTC"
+        
+        oi_usd = oi_tokens * price
+        volume_24h = volume_24h_usd / price if price > 0 else 0
+        
+        if oi_tokens <= 0 or price <= 0:
+            logger.debug(f"Gate.io {gateio_symbol}: Invalid OI ({oi_tokens}) or price ({price})")
+            return None
+        
+        return MarketOIData(
+            exchange="gateio",
+            symbol=gateio_symbol,
+            base_symbol=base_symbol,
+            market_type=market_type,
+            oi_tokens=oi_tokens,
+            oi_usd=oi_usd,
+            price=price,
+            funding_rate=funding_rate,
+            volume_24h=volume_24h,
+            volume_24h_usd=volume_24h_usd,
+            timestamp=datetime.now(),
+            api_source=f"V4-{settlement}:{gateio_symbol}",
+            calculation_method=calculation_method,
+            price_validated=False,
+            calculation_validated=False,
+            api_validated=False
+        )
+    
+    async def get_oi_data_bulk(self, base_symbols: List[str], max_concurrency: int = 4) -> Dict[str, ExchangeOIResult]:
+        """Get OI data for many base symbols from the per-settlement tickers snapshots"""
+        listings, listing_errors = await self.get_snapshots({
+            settlement: (lambda settlement=settlement: self._fetch_settlement_tickers(self.gateio_endpoints[settlement]))
+            for settlement in self.gateio_endpoints
+        })
+        
+        market_types = {'USDT': MarketType.USDT, 'USDC': MarketType.USDC, 'USD': MarketType.USD}
+        results = {}
+        for base_symbol in base_symbols:
+            markets = []
+            for settlement, market_type in market_types.items():
+                gateio_symbol = self.format_symbol(base_symbol, market_type)
+                ticker = listings[settlement].get(gateio_symbol)
+                if not ticker:
+                    continue
+                try:
+                    market = self._build_settlement_market(base_symbol, market_type, settlement, gateio_symbol, ticker)
+                except Exception as e:
+                    logger.warning(f"Error building Gate.io {settlement} for {base_symbol}: {e}")
+                    continue
+                if market is not None:
+                    markets.append(market)
+            # Same rule as the per-symbol path: any market found counts as a pass
+            results[base_symbol] = self.build_exchange_result(base_symbol, markets, list(listing_errors),
+                                                              validation_passed=len(markets) > 0)
+        
+        return results
 
 # Testing function
 async def test_gateio_working():
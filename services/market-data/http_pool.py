@@ -0,0 +1,83 @@
+"""
+Shared HTTP Connection Pool for exchange REST calls
+One keep-alive aiohttp session per upstream exchange, created once per process
+and closed at app shutdown instead of opening a session (and TLS handshake) per request.
+Every pooled request is scheduled through the shared rate limiter
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+import aiohttp
+from loguru import logger
+try:
+    from .rate_limiter import get_rate_limiter
+except ImportError:
+    from rate_limiter import get_rate_limiter
+
+class HTTPSessionPool:
+    """Process-wide pooled aiohttp sessions keyed by upstream name (e.g. 'binance')"""
+
+    def __init__(self, limit_per_host: int = 16, dns_ttl: int = 300,
+                 keepalive_timeout: float = 60.0, total_timeout: float = 30.0):
+        self.limit_per_host = limit_per_host        # Bounded concurrency per upstream host
+        self.dns_ttl = dns_ttl                      # Seconds to cache DNS lookups
+        self.keepalive_timeout = keepalive_timeout  # Seconds idle connections stay open
+        self.total_timeout = total_timeout
+        self.sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._lock = asyncio.Lock()
+
+    async def get_session(self, upstream: str) -> aiohttp.ClientSession:
+        """Get the shared session for an upstream, creating it on first use"""
+        session = self.sessions.get(upstream)
+        if session is not None and not session.closed:
+            return session
+
+        async with self._lock:
+            session = self.sessions.get(upstream)
+            if session is None or session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=self.dns_ttl,
+                    use_dns_cache=True,
+                    keepalive_timeout=self.keepalive_timeout,
+                    enable_cleanup_closed=True
+                )
+                session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=self.total_timeout),
+                    trace_configs=[get_rate_limiter().trace_config()]
+                )
+                self.sessions[upstream] = session
+                logger.info(f"Opened pooled HTTP session for {upstream}")
+            return session
+
+    async def close(self):
+        """Close every pooled session"""
+        sessions, self.sessions = self.sessions, {}
+        for upstream, session in sessions.items():
+            if not session.closed:
+                await session.close()
+        if sessions:
+            logger.info(f"Closed pooled HTTP sessions: {list(sessions.keys())}")
+
+_pool: Optional[HTTPSessionPool] = None
+
+def get_http_pool() -> HTTPSessionPool:
+    """Get the process-wide pool, creating it lazily"""
+    global _pool
+    if _pool is None:
+        _pool = HTTPSessionPool()
+    return _pool
+
+async def close_http_pool():
+    """Close the process-wide pool (called at app shutdown)"""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+@asynccontextmanager
+async def pooled_session(upstream: str):
+    """Drop-in for `async with aiohttp.ClientSession()` that reuses the shared pool"""
+    yield await get_http_pool().get_session(upstream)
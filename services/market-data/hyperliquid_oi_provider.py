@@ -66,73 +66,45 @@ class HyperliquidOIProvider(BaseExchangeOIProvider):
         logger.info(f"🟣 Fetching Hyperliquid OI for {base_symbol}")
         
         try:
-            session = await self.get_session()
+            # Asset contexts (includes OI, volume, price, funding) from the shared snapshot
+            asset_contexts = await self._asset_contexts()
+            
+            target_symbol = base_symbol.upper()
+            asset_data = asset_contexts.get(target_symbol)
+            if asset_data is None:
+                logger.error(f"Hyperliquid: Asset {target_symbol} not found in universe")
+                return None
+            
+            # Extract perpetual data for this asset
+            market_data = await self._process_perpetual_data(asset_data, base_symbol, target_symbol)
+            
+            if not market_data:
+                logger.error(f"Failed to process Hyperliquid {target_symbol} data")
+                return None
+            
+            # Create exchange result
+            total_oi_tokens = market_data.oi_tokens
+            total_oi_usd = market_data.oi_usd
+            total_volume_24h = market_data.volume_24h
+            total_volume_24h_usd = market_data.volume_24h_usd
+            
+            logger.info(f"✅ Hyperliquid {target_symbol}: {total_oi_tokens:,.0f} {target_symbol} (${total_oi_usd/1e9:.1f}B)")
+            
+            return ExchangeOIResult(
+                exchange="hyperliquid",
+                base_symbol=base_symbol,
+                markets=[market_data],
+                total_oi_tokens=total_oi_tokens,
+                total_oi_usd=total_oi_usd,
+                total_volume_24h=total_volume_24h,
+                total_volume_24h_usd=total_volume_24h_usd,
+                usdt_markets=[],  # No USDT markets
+                usdc_markets=[market_data],  # Native USDC settlement
+                usd_markets=[],   # No inverse markets
+                validation_passed=True,
+                validation_errors=[]
+            )
             
-            # Get asset contexts (includes OI, volume, price, funding)
-            async with session.post(self.endpoints['info'], 
-                                  json={"type": "metaAndAssetCtxs"}) as response:
-                if response.status != 200:
-                    logger.error(f"Hyperliquid API error: HTTP {response.status}")
-                    return None
-                
-                data = await response.json()
-                
-                if not isinstance(data, list) or len(data) < 2:
-                    logger.error("Hyperliquid API: Invalid response structure")
-                    return None
-                
-                meta, asset_contexts = data[0], data[1]
-                
-                # Find asset index by symbol in universe
-                universe = meta.get('universe', [])
-                asset_index = None
-                
-                target_symbol = base_symbol.upper()
-                for i, asset in enumerate(universe):
-                    if asset.get('name') == target_symbol:
-                        asset_index = i
-                        break
-                
-                if asset_index is None:
-                    logger.error(f"Hyperliquid: Asset {target_symbol} not found in universe")
-                    return None
-                
-                if asset_index >= len(asset_contexts):
-                    logger.error(f"Hyperliquid: Asset context for {target_symbol} not available")
-                    return None
-                
-                asset_data = asset_contexts[asset_index]
-                
-                # Extract perpetual data for this asset
-                market_data = await self._process_perpetual_data(asset_data, base_symbol, target_symbol)
-                
-                if not market_data:
-                    logger.error(f"Failed to process Hyperliquid {target_symbol} data")
-                    return None
-                
-                # Create exchange result
-                total_oi_tokens = market_data.oi_tokens
-                total_oi_usd = market_data.oi_usd
-                total_volume_24h = market_data.volume_24h
-                total_volume_24h_usd = market_data.volume_24h_usd
-                
-                logger.info(f"✅ Hyperliquid {target_symbol}: {total_oi_tokens:,.0f} {target_symbol} (${total_oi_usd/1e9:.1f}B)")
-                
-                return ExchangeOIResult(
-                    exchange="hyperliquid",
-                    base_symbol=base_symbol,
-                    markets=[market_data],
-                    total_oi_tokens=total_oi_tokens,
-                    total_oi_usd=total_oi_usd,
-                    total_volume_24h=total_volume_24h,
-                    total_volume_24h_usd=total_volume_24h_usd,
-                    usdt_markets=[],  # No USDT markets
-                    usdc_markets=[market_data],  # Native USDC settlement
-                    usd_markets=[],   # No inverse markets
-                    validation_passed=True,
-                    validation_errors=[]
-                )
-                
         except Exception as e:
             logger.error(f"❌ Hyperliquid error: {str(e)}")
             return None
@@ -198,33 +170,63 @@ class HyperliquidOIProvider(BaseExchangeOIProvider):
             logger.error(f"❌ Hyperliquid {symbol_name} processing error: {str(e)}")
             return None
 
+    async def get_oi_data_bulk(self, base_symbols: List[str], max_concurrency: int = 4) -> Dict[str, Optional[ExchangeOIResult]]:
+        """
+        Fetch OI for many assets from the shared metaAndAssetCtxs snapshot
+        
+        Assets missing from the universe map to None, as in get_oi_data.
+        """
+        asset_contexts = await self._asset_contexts()
+        
+        results = {}
+        for base_symbol in base_symbols:
+            target_symbol = base_symbol.upper()
+            asset_data = asset_contexts.get(target_symbol)
+            if asset_data is None:
+                logger.debug(f"Hyperliquid: Asset {target_symbol} not found in universe")
+                results[base_symbol] = None
+                continue
+            
+            market_data = await self._process_perpetual_data(asset_data, base_symbol, target_symbol)
+            results[base_symbol] = self.build_exchange_result(base_symbol, [market_data], []) if market_data else None
+        
+        return results
+    
+    async def _asset_contexts(self) -> Dict[str, Dict[str, Any]]:
+        """Asset contexts keyed by universe name from the shared snapshot cache"""
+        return await self.get_snapshot('metaAndAssetCtxs', self._fetch_asset_contexts)
+    
+    async def _fetch_asset_contexts(self) -> Dict[str, Dict[str, Any]]:
+        """
+        One metaAndAssetCtxs call: [meta, asset_contexts], where
+        asset_contexts[i] belongs to meta['universe'][i]
+        """
+        session = await self.get_session()
+        
+        async with session.post(self.endpoints['info'], 
+                              json={"type": "metaAndAssetCtxs"}) as response:
+            if response.status != 200:
+                raise ValueError(f"Hyperliquid API error: HTTP {response.status}")
+            data = await response.json()
+        
+        if not isinstance(data, list) or len(data) < 2:
+            raise ValueError("Hyperliquid API: Invalid response structure")
+        
+        meta, asset_contexts = data[0], data[1]
+        return {asset.get('name'): asset_data for asset, asset_data in zip(meta.get('universe', []), asset_contexts)}
+    
     async def get_funding_rates(self, base_symbol: str) -> Dict[str, float]:
         """Get funding rates for specified Hyperliquid asset"""
         try:
-            session = await self.get_session()
+            asset_contexts = await self._asset_contexts()
             
-            async with session.post(self.endpoints['info'], 
-                                  json={"type": "metaAndAssetCtxs"}) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    if isinstance(data, list) and len(data) >= 2:
-                        meta, asset_contexts = data[0], data[1]
-                        
-                        # Find asset index by symbol in universe
-                        universe = meta.get('universe', [])
-                        target_symbol = base_symbol.upper()
-                        
-                        for i, asset in enumerate(universe):
-                            if asset.get('name') == target_symbol:
-                                if i < len(asset_contexts):
-                                    asset_data = asset_contexts[i]
-                                    funding_rate = float(asset_data.get('funding', 0))
-                                    
-                                    return {
-                                        f'{target_symbol}-PERP': funding_rate
-                                    }
-                                break
+            target_symbol = base_symbol.upper()
+            asset_data = asset_contexts.get(target_symbol)
+            if asset_data is not None:
+                funding_rate = float(asset_data.get('funding', 0))
+                return {
+                    f'{target_symbol}-PERP': funding_rate
+                }
             
             return {}
             
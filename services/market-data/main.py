@@ -1,8 +1,9 @@
 import asyncio
 import os
+import sys
 import ccxt.pro as ccxt
 import aiohttp
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
 import json
@@ -13,12 +14,28 @@ try:
     from .technical_indicators import TechnicalAnalysisService, TechnicalIndicators
     from .oi_analysis import OIAnalysisService
     from .profile_calculator import ProfileCalculator
+    from .candle_store import CandleStore
+    from .response_cache import ResponseCache, create_cache_middleware
+    from .http_pool import get_http_pool, close_http_pool
+    from .rate_limiter import INTERACTIVE, get_rate_limiter, create_priority_middleware, priority
 except ImportError:
     # For direct execution
     from volume_analysis import VolumeAnalysisEngine, VolumeSpike, CVDData
     from technical_indicators import TechnicalAnalysisService, TechnicalIndicators
     from oi_analysis import OIAnalysisService
     from profile_calculator import ProfileCalculator
+    from candle_store import CandleStore
+    from response_cache import ResponseCache, create_cache_middleware
+    from http_pool import get_http_pool, close_http_pool
+    from rate_limiter import INTERACTIVE, get_rate_limiter, create_priority_middleware, priority
+
+# Shared threshold engine lives at the repo root; /thresholds is disabled without it
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+try:
+    from shared.intelligence.dynamic_thresholds import DynamicThresholdEngine, DefaultMarketDataProvider, THRESHOLD_TYPES
+except ImportError:
+    DynamicThresholdEngine = None
+    THRESHOLD_TYPES = {}
 
 load_dotenv()
 
@@ -227,17 +244,27 @@ class PositionData:
 class ExchangeManager:
     def __init__(self):
         self.exchanges = {}
+        # Shared OHLCV window used by every analysis engine
+        self.candle_store = CandleStore(self.exchanges)
         # Will be initialized in async context
     
     async def _init_exchanges(self):
+        # ccxt shares the pooled sessions so the central rate limiter schedules its
+        # requests with every other upstream call (ccxt's per-instance throttle is off)
+        pool = get_http_pool()
+        binance_session = await pool.get_session('binance')
+        bybit_session = await pool.get_session('bybit')
+        
         # Always add Binance for public data (no API keys needed for price data)
         self.exchanges['binance'] = ccxt.binance({
-            'enableRateLimit': True,
+            'enableRateLimit': False,
+            'session': binance_session,
         })
         
         # Add Binance USD-M Futures for perpetual contracts
         self.exchanges['binance_futures'] = ccxt.binance({
-            'enableRateLimit': True,
+            'enableRateLimit': False,
+            'session': binance_session,
             'options': {
                 'defaultType': 'future',  # Use futures market
             }
@@ -249,14 +276,16 @@ class ExchangeManager:
                 'apiKey': os.getenv('BINANCE_API_KEY'),
                 'secret': os.getenv('BINANCE_SECRET_KEY'),
                 'sandbox': os.getenv('BINANCE_TESTNET', 'false').lower() == 'true',
-                'enableRateLimit': True,
+                'enableRateLimit': False,
+                'session': binance_session,
             })
             
             self.exchanges['binance_futures_auth'] = ccxt.binance({
                 'apiKey': os.getenv('BINANCE_API_KEY'),
                 'secret': os.getenv('BINANCE_SECRET_KEY'),
                 'sandbox': os.getenv('BINANCE_TESTNET', 'false').lower() == 'true',
-                'enableRateLimit': True,
+                'enableRateLimit': False,
+                'session': binance_session,
                 'options': {
                     'defaultType': 'future',  # Use futures market
                 }
@@ -264,7 +293,8 @@ class ExchangeManager:
         
         # Bybit public data
         self.exchanges['bybit'] = ccxt.bybit({
-            'enableRateLimit': True,
+            'enableRateLimit': False,
+            'session': bybit_session,
         })
         
         if os.getenv('BYBIT_API_KEY'):
@@ -272,7 +302,8 @@ class ExchangeManager:
                 'apiKey': os.getenv('BYBIT_API_KEY'),
                 'secret': os.getenv('BYBIT_SECRET_KEY'),
                 'sandbox': os.getenv('BYBIT_TESTNET', 'false').lower() == 'true',
-                'enableRateLimit': True,
+                'enableRateLimit': False,
+                'session': bybit_session,
             })
         
         logger.info(f"Initialized exchanges: {list(self.exchanges.keys())}")
@@ -390,9 +421,9 @@ class ExchangeManager:
                 ticker = await ex.fetch_ticker(spot_symbol)
                 
                 # Get 15m candles for enhanced calculations
-                candles_15m = await self._fetch_15m_data(ex, spot_symbol)
+                candles_15m = await self._fetch_15m_data(exchange, spot_symbol)
                 volume_15m, change_15m, delta_24h, delta_15m, atr_24h, atr_15m = await self._calculate_enhanced_metrics(
-                    candles_15m, ticker.get('baseVolume', 0), ex, spot_symbol
+                    candles_15m, ticker.get('baseVolume', 0), exchange, spot_symbol
                 )
                 logger.info(f"✅ Enhanced spot metrics: vol_15m={volume_15m}, change_15m={change_15m}")
                 
@@ -447,9 +478,9 @@ class ExchangeManager:
                                 pass
                             
                             # Get 15m candles for enhanced calculations
-                            candles_15m = await self._fetch_15m_data(futures_ex, perp_symbol)
+                            candles_15m = await self._fetch_15m_data('binance_futures', perp_symbol)
                             volume_15m, change_15m, delta_24h, delta_15m, atr_24h, atr_15m = await self._calculate_enhanced_metrics(
-                                candles_15m, ticker.get('baseVolume', 0), ex, perp_symbol
+                                candles_15m, ticker.get('baseVolume', 0), exchange, perp_symbol
                             )
                             logger.info(f"✅ Enhanced perp metrics: vol_15m={volume_15m}, change_15m={change_15m}")
                             
@@ -506,19 +537,19 @@ class ExchangeManager:
             logger.error(f"Error fetching combined price for {base_symbol}: {e}")
             raise
     
-    async def _fetch_15m_data(self, exchange, symbol: str):
+    async def _fetch_15m_data(self, exchange: str, symbol: str):
         """Fetch 15-minute OHLCV data for enhanced calculations"""
         try:
             # Fetch last 100 periods (25 hours of 15m data) for calculations
-            # Note: Using ccxt.pro so fetch_ohlcv is async
-            candles = await exchange.fetch_ohlcv(symbol, '15m', limit=100)
+            # Served from the shared candle store, only new candles hit the exchange
+            candles = await self.candle_store.fetch_ohlcv(exchange, symbol, '15m', limit=100)
             logger.info(f"✅ Fetched {len(candles)} 15m candles for {symbol}")
             return candles
         except Exception as e:
             logger.warning(f"Could not fetch 15m data for {symbol}: {e}")
             return []
     
-    async def _calculate_enhanced_metrics(self, candles_15m: list, volume_24h: float, exchange, symbol: str):
+    async def _calculate_enhanced_metrics(self, candles_15m: list, volume_24h: float, exchange: str, symbol: str):
         """Calculate enhanced metrics from 15m candlestick data"""
         try:
             if not candles_15m or len(candles_15m) < 2:
@@ -598,11 +629,11 @@ class ExchangeManager:
             logger.warning(f"Error calculating volume delta: {e}")
             return 0
     
-    async def _calculate_atr_24h(self, exchange, symbol):
+    async def _calculate_atr_24h(self, exchange: str, symbol: str):
         """Calculate 24h ATR using 6 periods of 4h data for recent daily volatility"""
         try:
             # Fetch 4-hour candlestick data (last 10 periods for buffer)
-            candles_4h = await exchange.fetch_ohlcv(symbol, '4h', limit=10)
+            candles_4h = await self.candle_store.fetch_ohlcv(exchange, symbol, '4h', limit=10)
             if not candles_4h or len(candles_4h) < 7:  # Need at least 7 for 6 periods
                 logger.warning(f"Insufficient 4h data for ATR calculation: {len(candles_4h) if candles_4h else 0} candles")
                 return None
@@ -661,26 +692,28 @@ class ExchangeManager:
             binance_symbol = symbol.replace('/USDT:USDT', 'USDT').replace('/', '')
             logger.debug(f"Fetching OI changes for {symbol} -> {binance_symbol}, current OI: {current_oi}")
             
-            async with aiohttp.ClientSession() as session:
-                # Fetch historical OI data in parallel
-                tasks = [
-                    self._fetch_binance_historical_oi(session, binance_symbol, "1d", 1),  # 24h ago
-                    self._fetch_binance_historical_oi(session, binance_symbol, "5m", 3)   # 15m ago (3 periods of 5m)
-                ]
-                
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                oi_24h_ago = results[0] if not isinstance(results[0], Exception) else None
-                oi_15m_ago = results[1] if not isinstance(results[1], Exception) else None
-                
-                logger.debug(f"OI historical data: 24h_ago={oi_24h_ago}, 15m_ago={oi_15m_ago}")
-                
-                changes = {
-                    'oi_change_24h': current_oi - oi_24h_ago if oi_24h_ago else None,
-                    'oi_change_15m': current_oi - oi_15m_ago if oi_15m_ago else None
-                }
-                
-                logger.info(f"✅ OI changes for {binance_symbol}: 24h={changes['oi_change_24h']}, 15m={changes['oi_change_15m']}")
-                return changes
+            # Shared keep-alive session, avoids a TLS handshake per request
+            session = await get_http_pool().get_session('binance')
+            
+            # Fetch historical OI data in parallel
+            tasks = [
+                self._fetch_binance_historical_oi(session, binance_symbol, "1d", 1),  # 24h ago
+                self._fetch_binance_historical_oi(session, binance_symbol, "5m", 3)   # 15m ago (3 periods of 5m)
+            ]
+            
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            oi_24h_ago = results[0] if not isinstance(results[0], Exception) else None
+            oi_15m_ago = results[1] if not isinstance(results[1], Exception) else None
+            
+            logger.debug(f"OI historical data: 24h_ago={oi_24h_ago}, 15m_ago={oi_15m_ago}")
+            
+            changes = {
+                'oi_change_24h': current_oi - oi_24h_ago if oi_24h_ago else None,
+                'oi_change_15m': current_oi - oi_15m_ago if oi_15m_ago else None
+            }
+            
+            logger.info(f"✅ OI changes for {binance_symbol}: 24h={changes['oi_change_24h']}, 15m={changes['oi_change_15m']}")
+            return changes
                 
         except Exception as e:
             logger.warning(f"Error fetching OI changes for {symbol}: {e}")
@@ -828,7 +861,10 @@ class MarketDataService:
         self.volume_engine = None  # Will be initialized after exchange_manager
         self.technical_service = None  # Will be initialized after exchange_manager
         self.oi_service = None  # Will be initialized after exchange_manager
+        self.oi_aggregator = None  # Long-lived, providers share pooled sessions
+        self.threshold_engine = None  # Created on first /thresholds request
         self._initialized = False
+        self._inflight: Dict[tuple, asyncio.Future] = {}  # Single-flight request coalescing
         logger.info("Market Data Service created")
     
     async def initialize(self):
@@ -841,6 +877,20 @@ class MarketDataService:
             self._initialized = True
             logger.info("Market Data Service initialized")
     
+    async def _single_flight(self, key: tuple, factory) -> Dict[str, Any]:
+        """Share one in-flight computation between concurrent identical requests"""
+        task = self._inflight.get(key)
+        if task is None:
+            # Interactive callers may join later: do not run the shared work at a background caller's priority
+            with priority(INTERACTIVE):
+                task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.debug(f"Coalescing concurrent request {key}")
+        # Shield so a cancelled caller does not cancel the shared work for the others
+        return await asyncio.shield(task)
+    
     async def handle_price_request(self, symbol: str, exchange: str = None) -> Dict[str, Any]:
         """Handle price request from Telegram bot"""
         try:
@@ -919,6 +969,11 @@ class MarketDataService:
     
     async def handle_combined_price_request(self, symbol: str, exchange: str = None) -> Dict[str, Any]:
         """Handle combined spot + perp price request"""
+        key = ('combined_price', (symbol or '').upper().replace('-', '/'), exchange)
+        return await self._single_flight(key, lambda: self._combined_price_request(symbol, exchange))
+    
+    async def _combined_price_request(self, symbol: str, exchange: str = None) -> Dict[str, Any]:
+        """Build combined spot + perp price response"""
         try:
             await self.initialize()
             combined_data = await self.exchange_manager.get_combined_price(symbol, exchange)
@@ -975,6 +1030,65 @@ class MarketDataService:
                 'error': str(e)
             }
     
+    async def handle_bulk_combined_price_request(self, symbols: List[str], exchange: str = None,
+                                                 max_concurrency: int = 8) -> Dict[str, Any]:
+        """Handle combined price request for many symbols in one response"""
+        try:
+            if not symbols:
+                return {'success': False, 'error': 'symbols list is required'}
+            
+            await self.initialize()
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def fetch(symbol: str):
+                async with semaphore:
+                    return symbol, await self.handle_combined_price_request(symbol, exchange)
+            
+            # Deduplicate while keeping request order
+            unique_symbols = list(dict.fromkeys(symbols))
+            results = await asyncio.gather(*(fetch(s) for s in unique_symbols))
+            
+            return {
+                'success': True,
+                'data': {symbol: result for symbol, result in results},
+                'failed': [symbol for symbol, result in results if not result.get('success')]
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    async def handle_thresholds_request(self, symbols: List[str], types: List[str] = None) -> Dict[str, Any]:
+        """Handle bulk dynamic threshold request (liquidation / volume / oi) for many symbols"""
+        try:
+            if DynamicThresholdEngine is None:
+                return {'success': False, 'error': 'Threshold engine not available in this deployment'}
+            if not symbols:
+                return {'success': False, 'error': 'symbols list is required'}
+            
+            types = [t for t in (types or list(THRESHOLD_TYPES)) if t in THRESHOLD_TYPES]
+            if self.threshold_engine is None:
+                # Reads combined prices in-process instead of calling our own HTTP endpoint
+                provider = DefaultMarketDataProvider('', fetch_combined_price=self.handle_combined_price_request)
+                self.threshold_engine = DynamicThresholdEngine(market_data_provider=provider)
+            
+            await self.threshold_engine.calculate_thresholds(symbols, types)
+            state = self.threshold_engine.export_state(symbols)
+            
+            return {
+                'success': True,
+                'types': types,
+                'data': state['data'],
+                'profiles': state['profiles'],
+                'missing': [s for s in symbols if s not in state['data']]
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
     async def handle_top_symbols_request(self, market_type: str = "spot", limit: int = 10, exchange: str = None) -> Dict[str, Any]:
         """Handle top symbols request"""
         try:
@@ -1068,11 +1182,18 @@ class MarketDataService:
                 'error': str(e)
             }
     
-    async def handle_volume_scan_request(self, timeframe: str = '15m', min_spike: float = 200) -> Dict[str, Any]:
+    async def handle_volume_scan_request(self, timeframe: str = '15m', min_spike: float = 200,
+                                         universe: str = 'major', max_symbols: int = None) -> Dict[str, Any]:
         """Handle volume spike scanning request"""
         try:
             await self.initialize()
-            spikes = await self.volume_engine.scan_volume_spikes(timeframe, min_spike)
+            if universe == 'perps':
+                # Every active USDT perpetual, ranked from a single tickers call
+                spikes = await self.volume_engine.scan_futures_volume_spikes(
+                    timeframe, min_spike, max_symbols=max_symbols
+                )
+            else:
+                spikes = await self.volume_engine.scan_volume_spikes(timeframe, min_spike)
             
             spike_data = []
             for spike in spikes:
@@ -1089,6 +1210,7 @@ class MarketDataService:
                 'success': True,
                 'data': {
                     'timeframe': timeframe,
+                    'universe': universe,
                     'min_spike_threshold': min_spike,
                     'spikes_found': len(spike_data),
                     'spikes': spike_data
@@ -1102,6 +1224,13 @@ class MarketDataService:
     
     async def handle_comprehensive_analysis_request(self, symbol: str, timeframe: str = '15m', exchange: str = None) -> Dict[str, Any]:
         """Handle comprehensive market analysis request"""
+        key = ('comprehensive_analysis', (symbol or '').upper().replace('-', '/'), timeframe, exchange)
+        return await self._single_flight(
+            key, lambda: self._comprehensive_analysis_request(symbol, timeframe, exchange)
+        )
+    
+    async def _comprehensive_analysis_request(self, symbol: str, timeframe: str = '15m', exchange: str = None) -> Dict[str, Any]:
+        """Build comprehensive market analysis response"""
         try:
             await self.initialize()
             
@@ -1195,47 +1324,54 @@ class MarketDataService:
                 'error': str(e)
             }
     
-    async def handle_multi_oi_request(self, base_symbol: str) -> Dict[str, Any]:
-        """Handle unified 13-market OI analysis request"""
-        try:
-            # Import the unified aggregator
+    def _get_oi_aggregator(self):
+        """Reuse one aggregator; its providers share the pooled HTTP sessions"""
+        if self.oi_aggregator is None:
             try:
                 from .unified_oi_aggregator import UnifiedOIAggregator
             except ImportError:
                 from unified_oi_aggregator import UnifiedOIAggregator
+            self.oi_aggregator = UnifiedOIAggregator()
+        return self.oi_aggregator
+    
+    @staticmethod
+    def _clean_oi_symbol(base_symbol: str) -> str:
+        """Extract the base symbol (remove quote suffixes)"""
+        clean_symbol = base_symbol.upper()
+        # Separator forms first so 'BTC-USDT' does not match plain 'USDT' and keep the '-'
+        for suffix in ['/USDT', '/USDC', '/USD', '-USDT', '-USDC', '-USD', 'USDT', 'USDC', 'USD']:
+            if clean_symbol.endswith(suffix):
+                clean_symbol = clean_symbol[:-len(suffix)]
+                break
+        return clean_symbol
+    
+    @staticmethod
+    def _format_multi_oi_response(unified_result) -> Dict[str, Any]:
+        """Convert a UnifiedOIResponse to the /multi_oi API response format"""
+        return {
+            'success': True,
+            'base_symbol': unified_result.base_symbol,
+            'timestamp': unified_result.timestamp.isoformat(),
+            'total_markets': unified_result.total_markets,
+            'aggregated_oi': unified_result.aggregated_oi,
+            'exchange_breakdown': unified_result.exchange_breakdown,
+            'market_categories': unified_result.market_categories,
+            'validation_summary': unified_result.validation_summary
+        }
+    
+    async def handle_multi_oi_request(self, base_symbol: str) -> Dict[str, Any]:
+        """Handle unified 13-market OI analysis request"""
+        try:
+            clean_symbol = self._clean_oi_symbol(base_symbol)
+            aggregator = self._get_oi_aggregator()
             
-            # Extract base symbol (remove suffixes)
-            clean_symbol = base_symbol.upper()
-            for suffix in ['USDT', 'USDC', 'USD', '/USDT', '/USDC', '/USD', '-USDT', '-USDC', '-USD']:
-                if clean_symbol.endswith(suffix):
-                    clean_symbol = clean_symbol.replace(suffix, '')
-                    break
+            # Get unified data
+            unified_result = await aggregator.get_unified_oi_data(clean_symbol)
+            response = self._format_multi_oi_response(unified_result)
             
-            # Initialize unified aggregator
-            aggregator = UnifiedOIAggregator()
+            logger.info(f"✅ Unified OI analysis completed for {clean_symbol}: {unified_result.total_markets} markets, {unified_result.aggregated_oi['total_tokens']:,.0f} {clean_symbol}")
             
-            try:
-                # Get unified data
-                unified_result = await aggregator.get_unified_oi_data(clean_symbol)
-                
-                # Convert to API response format
-                response = {
-                    'success': True,
-                    'base_symbol': unified_result.base_symbol,
-                    'timestamp': unified_result.timestamp.isoformat(),
-                    'total_markets': unified_result.total_markets,
-                    'aggregated_oi': unified_result.aggregated_oi,
-                    'exchange_breakdown': unified_result.exchange_breakdown,
-                    'market_categories': unified_result.market_categories,
-                    'validation_summary': unified_result.validation_summary
-                }
-                
-                logger.info(f"✅ Unified OI analysis completed for {clean_symbol}: {unified_result.total_markets} markets, {unified_result.aggregated_oi['total_tokens']:,.0f} {clean_symbol}")
-                
-                return response
-                
-            finally:
-                await aggregator.close()
+            return response
             
         except Exception as e:
             logger.error(f"Error in unified OI analysis for {base_symbol}: {e}")
@@ -1247,6 +1383,42 @@ class MarketDataService:
                 'base_symbol': base_symbol
             }
     
+    async def handle_bulk_multi_oi_request(self, base_symbols: List[str]) -> Dict[str, Any]:
+        """Handle unified OI request for many base symbols, one listing fetch per exchange endpoint"""
+        try:
+            if not base_symbols:
+                return {'success': False, 'error': 'base_symbols list is required'}
+            
+            # Requested symbol -> base symbol; deduplicate while keeping request order
+            clean_symbols = {symbol: self._clean_oi_symbol(symbol) for symbol in base_symbols}
+            unique_symbols = list(dict.fromkeys(clean_symbols.values()))
+            
+            unified_results = await self._get_oi_aggregator().get_unified_oi_data_bulk(unique_symbols)
+            
+            data = {}
+            for symbol, clean_symbol in clean_symbols.items():
+                unified_result = unified_results.get(clean_symbol)
+                if unified_result is None:
+                    data[symbol] = {'success': False, 'error': 'No data', 'base_symbol': symbol}
+                else:
+                    data[symbol] = self._format_multi_oi_response(unified_result)
+            
+            logger.info(f"✅ Bulk unified OI analysis completed for {len(unique_symbols)} symbols")
+            
+            return {
+                'success': True,
+                'data': data,
+                'failed': [symbol for symbol, result in data.items()
+                           if not result.get('success') or not result['aggregated_oi']['exchanges_count']]
+            }
+            
+        except Exception as e:
+            logger.error(f"Error in bulk unified OI analysis: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
     async def handle_test_exchange_oi_request(self, exchange: str, symbol: str) -> Dict[str, Any]:
         """Handle test exchange OI request for validation"""
         try:
@@ -1441,8 +1613,11 @@ class MarketDataService:
 from aiohttp import web, ClientSession
 
 async def create_app():
-    app = web.Application()
+    response_cache = ResponseCache()
+    # Priority first, so cache refreshes and handlers inherit the caller's class
+    app = web.Application(middlewares=[create_priority_middleware(), create_cache_middleware(response_cache)])
     market_service = MarketDataService()
+    profile_calculator = ProfileCalculator()
     
     async def price_handler(request):
         data = await request.json()
@@ -1472,6 +1647,9 @@ async def create_app():
     async def health_handler(request):
         return web.json_response({'status': 'healthy', 'service': 'market-data'})
     
+    async def rate_limits_handler(request):
+        return web.json_response({'success': True, 'buckets': get_rate_limiter().get_status()})
+    
     async def combined_price_handler(request):
         data = await request.json()
         symbol = data.get('symbol')
@@ -1479,6 +1657,20 @@ async def create_app():
         result = await market_service.handle_combined_price_request(symbol, exchange)
         return web.json_response(result)
     
+    async def combined_prices_handler(request):
+        data = await request.json()
+        symbols = data.get('symbols', [])
+        exchange = data.get('exchange')
+        result = await market_service.handle_bulk_combined_price_request(symbols, exchange)
+        return web.json_response(result)
+    
+    async def thresholds_handler(request):
+        data = await request.json()
+        symbols = data.get('symbols', [])
+        types = data.get('types')
+        result = await market_service.handle_thresholds_request(symbols, types)
+        return web.json_response(result)
+    
     async def top_symbols_handler(request):
         data = await request.json()
         market_type = data.get('market_type', 'spot')
@@ -1557,7 +1749,9 @@ async def create_app():
         data = await request.json()
         timeframe = data.get('timeframe', '15m')
         min_spike = data.get('min_spike', 200)
-        result = await market_service.handle_volume_scan_request(timeframe, min_spike)
+        universe = data.get('universe', 'major')
+        max_symbols = data.get('max_symbols')
+        result = await market_service.handle_volume_scan_request(timeframe, min_spike, universe, max_symbols)
         return web.json_response(result)
     
     async def comprehensive_analysis_handler(request):
@@ -1583,6 +1777,12 @@ async def create_app():
         result = await market_service.handle_multi_oi_request(base_symbol)
         return web.json_response(result)
     
+    async def multi_oi_bulk_handler(request):
+        data = await request.json()
+        base_symbols = data.get('base_symbols', [])
+        result = await market_service.handle_bulk_multi_oi_request(base_symbols)
+        return web.json_response(result)
+    
     async def test_exchange_oi_handler(request):
         data = await request.json()
         exchange = data.get('exchange')
@@ -1595,16 +1795,25 @@ async def create_app():
         symbol = data.get('symbol')
         exchange = data.get('exchange', 'binance')
         
-        calculator = ProfileCalculator()
-        try:
-            result = await calculator.calculate_all_profiles(symbol, exchange)
-            return web.json_response(result)
-        finally:
-            await calculator.close()
+        result = await profile_calculator.calculate_all_profiles(symbol, exchange)
+        return web.json_response(result)
+    
+    async def on_startup(app):
+        # Open pooled keep-alive sessions before the first request
+        pool = get_http_pool()
+        for upstream in ('binance', 'bybit', 'okx', 'gateio', 'bitget', 'hyperliquid'):
+            await pool.get_session(upstream)
+    
+    async def on_cleanup(app):
+        await profile_calculator.close()
+        await close_http_pool()
     
     app.router.add_get('/health', health_handler)
+    app.router.add_get('/rate_limits', rate_limits_handler)
     app.router.add_post('/price', price_handler)
     app.router.add_post('/combined_price', combined_price_handler)
+    app.router.add_post('/combined_prices', combined_prices_handler)
+    app.router.add_post('/thresholds', thresholds_handler)
     app.router.add_post('/top_symbols', top_symbols_handler)
     app.router.add_post('/debug_tickers', debug_tickers_handler)
     app.router.add_post('/volume_spike', volume_spike_handler)
@@ -1616,9 +1825,13 @@ async def create_app():
     app.router.add_post('/positions', positions_handler)
     app.router.add_post('/pnl', pnl_handler)
     app.router.add_post('/multi_oi', multi_oi_handler)
+    app.router.add_post('/multi_oi_bulk', multi_oi_bulk_handler)
     app.router.add_post('/test_exchange_oi', test_exchange_oi_handler)
     app.router.add_post('/market_profile', market_profile_handler)
     
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    
     return app
 
 async def main():
@@ -12,6 +12,10 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import statistics
 from loguru import logger
+try:
+    from .http_pool import pooled_session
+except ImportError:
+    from http_pool import pooled_session
 
 @dataclass
 class ExchangeOIData:
@@ -272,7 +276,7 @@ class OIAnalysisEngine:
                 ]
             
             # Try each contract format until we get valid OI data
-            async with aiohttp.ClientSession() as session:
+            async with pooled_session('bybit') as session:
                 for bybit_symbol, category in bybit_contracts:
                     try:
                         # Use tickers endpoint (more reliable than funding for OI)
@@ -354,7 +358,7 @@ class OIAnalysisEngine:
             results = []
             base_token = symbol.split('/')[0].upper()
             
-            async with aiohttp.ClientSession() as session:
+            async with pooled_session('gateio') as session:
                 # Fetch all three settlement types in parallel
                 tasks = []
                 for settlement, endpoint in self.gateio_endpoints.items():
@@ -457,7 +461,7 @@ class OIAnalysisEngine:
                 'USD': f'{base_token}USD_DMCBL'       # Inverse USD (Coin-margined)
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with pooled_session('bitget') as session:
                 # Fetch all three product types in parallel
                 tasks = []
                 for settlement, bitget_symbol in bitget_symbols.items():
@@ -569,7 +573,7 @@ class OIAnalysisEngine:
                 'USD': f'{base_token}-USD-SWAP'       # Inverse USD
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with pooled_session('okx') as session:
                 # Fetch all three settlement types in parallel
                 tasks = []
                 for settlement, okx_symbol in okx_symbols.items():
@@ -706,7 +710,7 @@ class OIAnalysisEngine:
                 'limit': 1
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with pooled_session('binance') as session:
                 results = {}
                 
                 for endpoint_name, url in endpoints.items():
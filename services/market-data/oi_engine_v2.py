@@ -7,13 +7,15 @@ Target: 13 markets across 5 exchanges with proper USD calculations
 
 import asyncio
 import aiohttp
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from abc import ABC, abstractmethod
 from enum import Enum
 import json
 from loguru import logger
+from http_pool import get_http_pool
+from ticker_snapshots import get_ticker_snapshots
 
 class MarketType(Enum):
     """Market settlement types for proper categorization"""
@@ -117,23 +119,80 @@ class BaseExchangeOIProvider(ABC):
         self.session: Optional[aiohttp.ClientSession] = None
     
     async def get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session"""
-        if self.session is None:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+        """Get the shared keep-alive session for this exchange"""
+        if self.session is None or self.session.closed:
+            self.session = await get_http_pool().get_session(self.exchange_name)
         return self.session
     
     async def close(self):
-        """Close HTTP session"""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """Release HTTP session (the pooled connection stays open for reuse)"""
+        self.session = None
     
     @abstractmethod
     async def get_oi_data(self, base_symbol: str) -> ExchangeOIResult:
         """Get OI data for all markets of a base symbol"""
         pass
     
+    async def get_oi_data_bulk(self, base_symbols: List[str], max_concurrency: int = 4) -> Dict[str, ExchangeOIResult]:
+        """
+        Get OI data for many base symbols
+
+        Default: per-symbol get_oi_data with bounded concurrency. Providers whose
+        exchange lists every instrument in one response override this to fetch
+        each listing once and resolve all symbols from it.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(base_symbol: str):
+            async with semaphore:
+                return await self.get_oi_data(base_symbol)
+
+        results = await asyncio.gather(*(fetch(s) for s in base_symbols), return_exceptions=True)
+        return dict(zip(base_symbols, results))
+
+    async def get_snapshot(self, name: str, fetch: Callable[[], Awaitable[Dict[str, Dict]]]) -> Dict[str, Dict]:
+        """Exchange-wide listing `name` from the shared ticker snapshot cache"""
+        return await get_ticker_snapshots().get(self.exchange_name, name, fetch)
+    
+    async def get_snapshots(self, fetchers: Dict[str, Callable[[], Awaitable[Dict[str, Dict]]]],
+                            optional: Tuple[str, ...] = ()) -> Tuple[Dict[str, Dict[str, Dict]], List[str]]:
+        """
+        Several listings at once; a failed listing resolves to {} and, unless
+        it is in `optional`, is reported in the returned error list
+        """
+        names = list(fetchers)
+        fetched = await asyncio.gather(*(self.get_snapshot(name, fetchers[name]) for name in names),
+                                       return_exceptions=True)
+        
+        listings: Dict[str, Dict[str, Dict]] = {}
+        errors = []
+        for name, result in zip(names, fetched):
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ {self.exchange_name} {name} listing failed: {str(result)}")
+                if name not in optional:
+                    errors.append(f"{name}: {str(result)}")
+                result = {}
+            listings[name] = result
+        return listings, errors
+    
+    def build_exchange_result(self, base_symbol: str, markets: List[MarketOIData], errors: List[str],
+                              validation_passed: Optional[bool] = None) -> ExchangeOIResult:
+        """Exchange totals and market-type split for a set of markets"""
+        return ExchangeOIResult(
+            exchange=self.exchange_name,
+            base_symbol=base_symbol,
+            markets=markets,
+            total_oi_tokens=sum(m.oi_tokens for m in markets),
+            total_oi_usd=sum(m.oi_usd for m in markets),
+            total_volume_24h=sum(m.volume_24h for m in markets),
+            total_volume_24h_usd=sum(m.volume_24h_usd for m in markets),
+            usdt_markets=[m for m in markets if m.market_type == MarketType.USDT],
+            usdc_markets=[m for m in markets if m.market_type == MarketType.USDC],
+            usd_markets=[m for m in markets if m.market_type == MarketType.USD],
+            validation_passed=len(errors) == 0 if validation_passed is None else validation_passed,
+            validation_errors=errors
+        )
+
     @abstractmethod
     def get_supported_market_types(self) -> List[MarketType]:
         """Get supported market types for this exchange"""
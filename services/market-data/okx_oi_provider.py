@@ -33,6 +33,7 @@ class OKXOIProvider(BaseExchangeOIProvider):
         self.endpoints = {
             'oi': f"{self.api_base}/api/v5/public/open-interest",
             'ticker': f"{self.api_base}/api/v5/market/ticker",
+            'tickers': f"{self.api_base}/api/v5/market/tickers",
             'funding': f"{self.api_base}/api/v5/public/funding-rate"
         }
         
@@ -122,114 +123,142 @@ class OKXOIProvider(BaseExchangeOIProvider):
         """Fetch SWAP market data (USDT/USDC/USD)"""
         try:
             symbol = self.format_symbol(base_symbol, market_type)
-            inst_type = self.inst_types[market_type]
-            session = await self.get_session()
-            
-            # Fetch OI data
-            oi_params = {"instType": inst_type, "instId": symbol}
-            async with session.get(self.endpoints['oi'], params=oi_params) as response:
-                oi_response = await response.json()
-                
-            # Fetch ticker data
-            ticker_params = {"instId": symbol}
-            async with session.get(self.endpoints['ticker'], params=ticker_params) as response:
-                ticker_response = await response.json()
-            
-            # Fetch funding data
-            funding_params = {"instId": symbol}
-            async with session.get(self.endpoints['funding'], params=funding_params) as response:
-                funding_response = await response.json()
+            # OI, ticker and funding rows from the shared SWAP-wide snapshots
+            listings, _ = await self._swap_listings()
             
             # Extract OI data
-            if (oi_response.get('code') != '0' or 
-                not oi_response.get('data')):
+            oi_data = listings['oi'].get(symbol)
+            if not oi_data:
                 logger.warning(f"⚠️ OKX {market_type.value} OI data unavailable")
                 return None
-                
-            oi_data = oi_response['data'][0]
             
             # Extract ticker data
-            if (ticker_response.get('code') != '0' or 
-                not ticker_response.get('data')):
+            ticker_data = listings['tickers'].get(symbol)
+            if not ticker_data:
                 logger.warning(f"⚠️ OKX {market_type.value} ticker data unavailable")
                 return None
-                
-            ticker_data = ticker_response['data'][0]
-            price = float(ticker_data['last'])
-            # CRITICAL FIX: Use volCcy24h for base currency volume (BTC), not vol24h (contracts)
-            volume_24h_base = float(ticker_data.get('volCcy24h', 0))  # Volume in base currency (BTC)
-            volume_24h_contracts = float(ticker_data.get('vol24h', 0))  # Volume in contracts
-            
-            # Extract funding data
-            funding_rate = 0.0  # Default if not available
-            if (funding_response.get('code') == '0' and 
-                funding_response.get('data')):
-                funding_data = funding_response['data'][0]
-                funding_rate = float(funding_data['fundingRate'])
             
-            # OKX OI Calculation
-            # CRITICAL FIX: Use oiCcy (base currency) not oi (quote currency)
-            if market_type in [MarketType.USDT, MarketType.USDC]:
-                # Linear markets: Use oiCcy for base currency amount (BTC)
-                oi_tokens = float(oi_data['oiCcy'])  # Open interest in base currency (BTC)
-                # VOLUME FIX: Use volCcy24h for base currency volume (BTC)
-                volume_24h = volume_24h_base  # Volume in base currency (BTC)
-                
-                # Calculate USD values
-                oi_usd = oi_tokens * price
-                volume_24h_usd = volume_24h * price
-                calculation_method = f"linear: {oi_tokens:,.0f} × ${price:,.2f} (oiCcy), vol: {volume_24h:,.0f} BTC"
-                
-            else:  # MarketType.USD (inverse)
-                # Inverse markets: oi in contracts, oiCcy in base currency
-                oi_ccy = oi_data.get('oiCcy', '0')  # OI in base currency (BTC)
-                oi_contracts = oi_data.get('oi', '0')  # OI in contracts
-                
-                if float(oi_ccy) > 0:
-                    # Use oiCcy (already in BTC terms)
-                    oi_tokens = float(oi_ccy)
-                    oi_usd = oi_tokens * price
-                    calculation_method = f"inverse: oiCcy {oi_tokens:,.0f} × ${price:,.2f}"
-                elif float(oi_contracts) > 0:
-                    # Convert contracts to tokens
-                    # OKX inverse: 1 contract = $100 USD worth
-                    oi_contracts_num = float(oi_contracts)
-                    contract_value_usd = 100.0  # $100 per contract
-                    oi_usd_from_contracts = oi_contracts_num * contract_value_usd
-                    oi_tokens = oi_usd_from_contracts / price
-                    oi_usd = oi_tokens * price
-                    calculation_method = f"inverse: {oi_contracts_num:,.0f} contracts × $100 ÷ ${price:,.2f}"
-                else:
-                    logger.warning(f"⚠️ OKX {market_type.value} no valid OI data")
-                    return None
-                
-                # Volume calculation for inverse - FIXED: Use volCcy24h for BTC volume
-                volume_24h = volume_24h_base  # Volume in base currency (BTC) from volCcy24h
-                volume_24h_usd = volume_24h * price
+            # Extract funding data (default if not available)
+            funding_rate = float(listings['funding'].get(symbol, {}).get('fundingRate', 0.0) or 0.0)
             
-            return MarketOIData(
-                exchange="okx",
-                symbol=symbol,
-                base_symbol=base_symbol,
-                market_type=market_type,
-                oi_tokens=oi_tokens,
-                oi_usd=oi_usd,
-                price=price,
-                funding_rate=funding_rate,
-                volume_24h=volume_24h,
-                volume_24h_usd=volume_24h_usd,
-                timestamp=datetime.now(),
-                api_source=f"V5-SWAP:{symbol}",
-                calculation_method=calculation_method,
-                price_validated=False,
-                calculation_validated=False,
-                api_validated=False
-            )
+            return self._build_swap_market(base_symbol, market_type, symbol, oi_data, ticker_data, funding_rate)
             
         except Exception as e:
             logger.error(f"❌ OKX SWAP {market_type.value} error: {str(e)}")
             return None
     
+    def _build_swap_market(self, base_symbol: str, market_type: MarketType, symbol: str,
+                           oi_data: Dict, ticker_data: Dict, funding_rate: float) -> Optional[MarketOIData]:
+        """Build a SWAP market from open-interest and ticker rows"""
+        price = float(ticker_data['last'])
+        # CRITICAL FIX: Use volCcy24h for base currency volume (BTC), not vol24h (contracts)
+        volume_24h_base = float(ticker_data.get('volCcy24h', 0))  # Volume in base currency (BTC)
+        
+        # OKX OI Calculation
+        # CRITICAL FIX: Use oiCcy (base currency) not oi (quote currency)
+        if market_type in [MarketType.USDT, MarketType.USDC]:
+            # Linear markets: Use oiCcy for base currency amount (BTC)
+            oi_tokens = float(oi_data['oiCcy'])  # Open interest in base currency (BTC)
+            # VOLUME FIX: Use volCcy24h for base currency volume (BTC)
+            volume_24h = volume_24h_base  # Volume in base currency (BTC)
+            
+            # Calculate USD values
+            oi_usd = oi_tokens * price
+            volume_24h_usd = volume_24h * price
+            calculation_method = f"linear: {oi_tokens:,.0f} × ${price:,.2f} (oiCcy), vol: {volume_24h:,.0f} BTC"
+            
+        else:  # MarketType.USD (inverse)
+            # Inverse markets: oi in contracts, oiCcy in base currency
+            oi_ccy = oi_data.get('oiCcy', '0')  # OI in base currency (BTC)
+            oi_contracts = oi_data.get('oi', '0')  # OI in contracts
+            
+            if float(oi_ccy) > 0:
+                # Use oiCcy (already in BTC terms)
+                oi_tokens = float(oi_ccy)
+                oi_usd = oi_tokens * price
+                calculation_method = f"inverse: oiCcy {oi_tokens:,.0f} × ${price:,.2f}"
+            elif float(oi_contracts) > 0:
+                # Convert contracts to tokens
+                # OKX inverse: 1 contract = $100 USD worth
+                oi_contracts_num = float(oi_contracts)
+                contract_value_usd = 100.0  # $100 per contract
+                oi_usd_from_contracts = oi_contracts_num * contract_value_usd
+                oi_tokens = oi_usd_from_contracts / price
+                oi_usd = oi_tokens * price
+                calculation_method = f"inverse: {oi_contracts_num:,.0f} contracts × $100 ÷ ${price:,.2f}"
+            else:
+                logger.warning(f"⚠️ OKX {market_type.value} no valid OI data")
+                return None
+            
+            # Volume calculation for inverse - FIXED: Use volCcy24h for BTC volume
+            volume_24h = volume_24h_base  # Volume in base currency (BTC) from volCcy24h
+            volume_24h_usd = volume_24h * price
+        
+        return MarketOIData(
+            exchange="okx",
+            symbol=symbol,
+            base_symbol=base_symbol,
+            market_type=market_type,
+            oi_tokens=oi_tokens,
+            oi_usd=oi_usd,
+            price=price,
+            funding_rate=funding_rate,
+            volume_24h=volume_24h,
+            volume_24h_usd=volume_24h_usd,
+            timestamp=datetime.now(),
+            api_source=f"V5-SWAP:{symbol}",
+            calculation_method=calculation_method,
+            price_validated=False,
+            calculation_validated=False,
+            api_validated=False
+        )
+    
+    async def get_oi_data_bulk(self, base_symbols: List[str], max_concurrency: int = 4) -> Dict[str, ExchangeOIResult]:
+        """Get OI data for many base symbols from the SWAP-wide open-interest, tickers and funding snapshots"""
+        listings, listing_errors = await self._swap_listings()
+        
+        results = {}
+        for base_symbol in base_symbols:
+            markets = []
+            for market_type in self.get_supported_market_types():
+                symbol = self.format_symbol(base_symbol, market_type)
+                oi_data = listings['oi'].get(symbol)
+                ticker_data = listings['tickers'].get(symbol)
+                if oi_data is None or ticker_data is None:
+                    continue
+                funding_rate = float(listings['funding'].get(symbol, {}).get('fundingRate', 0.0) or 0.0)
+                try:
+                    market = self._build_swap_market(base_symbol, market_type, symbol, oi_data, ticker_data, funding_rate)
+                except Exception as e:
+                    logger.error(f"❌ OKX {symbol} error: {str(e)}")
+                    continue
+                if market is not None:
+                    markets.append(market)
+            results[base_symbol] = self.build_exchange_result(base_symbol, markets, list(listing_errors))
+        
+        return results
+    
+    async def _swap_listings(self) -> Tuple[Dict[str, Dict[str, Dict]], List[str]]:
+        """SWAP-wide listings from the shared snapshot cache (funding is optional)"""
+        requests = {
+            'oi': (self.endpoints['oi'], {"instType": "SWAP"}),
+            'tickers': (self.endpoints['tickers'], {"instType": "SWAP"}),
+            'funding': (self.endpoints['funding'], {"instId": "ANY"})
+        }
+        return await self.get_snapshots({
+            name: (lambda url=url, params=params: self._fetch_listing(url, params))
+            for name, (url, params) in requests.items()
+        }, optional=('funding',))
+    
+    async def _fetch_listing(self, url: str, params: Dict) -> Dict[str, Dict]:
+        """All-instrument listing keyed by instId"""
+        session = await self.get_session()
+        async with session.get(url, params=params) as response:
+            listing_response = await response.json()
+        if listing_response.get('code') != '0':
+            raise ValueError(f"code {listing_response.get('code')}: {listing_response.get('msg')}")
+        return {row['instId']: row for row in listing_response.get('data', [])}
+    
     def _calculate_inverse_usd(self, oi_tokens: float, price: float) -> float:
         """OKX-specific inverse calculation (handled in _fetch_swap_market)"""
         return oi_tokens * price
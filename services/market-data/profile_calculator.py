@@ -5,6 +5,10 @@ from typing import Dict, List, Tuple, Any, Optional
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 import logging
+try:
+    from .http_pool import get_http_pool
+except ImportError:
+    from http_pool import get_http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +22,179 @@ class Candle:
     close: float
     volume: float
 
+@dataclass
+class CandleBatch:
+    """
+    Columnar candle storage - one array per field instead of one object per candle
+    
+    Reductions like high.max() are a single NumPy call, and the arrays feed
+    the vectorized profile engines directly.
+    """
+    timestamp: np.ndarray  # int64 open time in ms
+    open: np.ndarray       # float64
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.timestamp)
+    
+    @classmethod
+    def empty(cls) -> 'CandleBatch':
+        return cls(np.empty(0, dtype=np.int64), *(np.empty(0) for _ in range(5)))
+    
+    @classmethod
+    def from_klines(cls, klines: List[list]) -> 'CandleBatch':
+        """Build from Binance kline JSON ([open_time, "open", "high", "low", "close", "volume", ...])"""
+        if not klines:
+            return cls.empty()
+        timestamp = np.fromiter((k[0] for k in klines), dtype=np.int64, count=len(klines))
+        # NumPy parses the decimal strings directly, no per-field float() calls
+        ohlcv = np.array([k[1:6] for k in klines], dtype=np.float64)
+        return cls(timestamp, ohlcv[:, 0], ohlcv[:, 1], ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4])
+    
+    @classmethod
+    def from_candles(cls, candles: List[Candle]) -> 'CandleBatch':
+        """Build from a list of Candle objects"""
+        if not candles:
+            return cls.empty()
+        n = len(candles)
+        return cls(
+            np.fromiter((c.timestamp for c in candles), dtype=np.int64, count=n),
+            *(np.fromiter((getattr(c, f) for c in candles), dtype=np.float64, count=n)
+              for f in ('open', 'high', 'low', 'close', 'volume'))
+        )
+
+def _round_price(price: float) -> float:
+    """Round to cents, keeping 5 significant digits for sub-dollar assets"""
+    price = float(price)
+    if price == 0 or abs(price) >= 1:
+        return round(price, 2)
+    return round(price, 4 - int(np.floor(np.log10(abs(price)))))
+
+def _as_batch(candles) -> CandleBatch:
+    """Accept either a CandleBatch or a list of Candle objects"""
+    if isinstance(candles, CandleBatch):
+        return candles
+    return CandleBatch.from_candles(candles)
+
+class SessionProfileAccumulator:
+    """
+    Incrementally maintained session profile for one symbol and timeframe
+    
+    Closed candles are folded in once: their low/high/close/volume are
+    appended to columns for the volume profile, their low/high inserted into
+    sorted arrays for TPO counting, and their typical price added to running
+    VWAP sums. The still forming candle is kept aside and overlaid at read
+    time, so a read costs O(candles x bins) arithmetic instead of refetching
+    the whole session, with the same results as a full recompute.
+    """
+    
+    def __init__(self, session_start_ms: int, interval_ms: int):
+        self.session_start_ms = session_start_ms
+        self.interval_ms = interval_ms
+        self.next_open_ms = session_start_ms  # Open time of the first candle not yet folded in
+        self.closed_count = 0
+        
+        # Sorted candle extremes: touches(level) = #(low <= level) - #(high < level)
+        self.sorted_lows = np.empty(0)
+        self.sorted_highs = np.empty(0)
+        # Closed candle columns in arrival order (volume profile, TPO POC tie-break)
+        self.candle_lows: List[float] = []
+        self.candle_highs: List[float] = []
+        self.candle_closes: List[float] = []
+        self.candle_volumes: List[float] = []
+        
+        self.vwap_numerator = 0.0
+        self.vwap_denominator = 0.0
+        self.high = -np.inf
+        self.low = np.inf
+        self.last_close = 0.0
+        
+        self.pending: Optional[CandleBatch] = None  # Forming candle (length 1)
+    
+    def __len__(self) -> int:
+        return self.closed_count + (1 if self.pending is not None else 0)
+    
+    def update(self, batch: CandleBatch, now_ms: int):
+        """Fold new klines in: those whose interval has ended are closed, a later one is still forming"""
+        keep = batch.timestamp >= max(self.next_open_ms, self.session_start_ms)
+        if not keep.all():
+            batch = CandleBatch(*(getattr(batch, f)[keep] for f in CandleBatch.__dataclass_fields__))
+        if not len(batch):
+            return
+        
+        closed = int(np.count_nonzero(batch.timestamp + self.interval_ms <= now_ms))
+        for i in range(closed):
+            self._add_closed(batch.timestamp[i], batch.high[i], batch.low[i], batch.close[i], batch.volume[i])
+        
+        if closed < len(batch):
+            forming = slice(closed, closed + 1)
+            self.pending = CandleBatch(*(getattr(batch, f)[forming] for f in CandleBatch.__dataclass_fields__))
+        else:
+            self.pending = None
+    
+    def _add_closed(self, timestamp: int, high: float, low: float, close: float, volume: float):
+        self.sorted_lows = np.insert(self.sorted_lows, np.searchsorted(self.sorted_lows, low), low)
+        self.sorted_highs = np.insert(self.sorted_highs, np.searchsorted(self.sorted_highs, high), high)
+        self.candle_lows.append(float(low))
+        self.candle_highs.append(float(high))
+        self.candle_closes.append(float(close))
+        self.candle_volumes.append(float(volume))
+        
+        self.vwap_numerator += (high + low + close) / 3.0 * volume
+        self.vwap_denominator += volume
+        self.high = max(self.high, high)
+        self.low = min(self.low, low)
+        self.last_close = close
+        self.closed_count += 1
+        self.next_open_ms = int(timestamp) + self.interval_ms
+    
+    def price_range(self) -> Tuple[float, float]:
+        high, low = self.high, self.low
+        if self.pending is not None:
+            high = max(high, float(self.pending.high[0]))
+            low = min(low, float(self.pending.low[0]))
+        return high, low
+    
+    def volume_histogram(self, price_levels: np.ndarray) -> np.ndarray:
+        """Volume per bin, each candle's volume spread uniformly over its high-low range"""
+        lows, highs = self.candle_extremes()
+        closes, volumes = self.candle_closes, self.candle_volumes
+        if self.pending is not None:
+            closes = closes + [float(self.pending.close[0])]
+            volumes = volumes + [float(self.pending.volume[0])]
+        return ProfileCalculator._distribute_volume(highs, lows, np.array(closes), np.array(volumes), price_levels)
+    
+    def tpo_counts(self, price_levels: np.ndarray) -> np.ndarray:
+        """Number of candles whose low-high range touches each level"""
+        counts = (np.searchsorted(self.sorted_lows, price_levels, side='right')
+                  - np.searchsorted(self.sorted_highs, price_levels, side='left'))
+        if self.pending is not None:
+            counts += (price_levels >= self.pending.low[0]) & (price_levels <= self.pending.high[0])
+        return counts
+    
+    def candle_extremes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Lows and highs of every candle (forming one last) in arrival order"""
+        lows, highs = self.candle_lows, self.candle_highs
+        if self.pending is not None:
+            lows = lows + [float(self.pending.low[0])]
+            highs = highs + [float(self.pending.high[0])]
+        return np.array(lows), np.array(highs)
+    
+    def vwap(self) -> float:
+        numerator, denominator = self.vwap_numerator, self.vwap_denominator
+        last_close = self.last_close
+        if self.pending is not None:
+            p = self.pending
+            numerator += float((p.high[0] + p.low[0] + p.close[0]) / 3.0 * p.volume[0])
+            denominator += float(p.volume[0])
+            last_close = float(p.close[0])
+        if denominator == 0:
+            return last_close
+        return _round_price(numerator / denominator)
+
 class ProfileCalculator:
     """
     High-performance Volume Profile and TPO calculator
@@ -77,21 +254,24 @@ class ProfileCalculator:
         'daily_timeframes': ['4h', '1d']                    # Use 00:00 UTC reset
     }
     
+    INTERVAL_MS = {
+        '1m': 60_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+        '1h': 3_600_000, '4h': 14_400_000, '1d': 86_400_000
+    }
+    
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
-        self.cache = {}
-        self.cache_ttl = 60  # 60 seconds cache
+        # Incremental session profiles keyed by (binance_symbol, timeframe)
+        self.session_profiles: Dict[Tuple[str, str], SessionProfileAccumulator] = {}
     
     async def _ensure_session(self):
-        """Ensure aiohttp session exists"""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        """Ensure the shared Binance keep-alive session is attached"""
+        if not self.session or self.session.closed:
+            self.session = await get_http_pool().get_session('binance')
     
     async def close(self):
-        """Clean up session"""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """Release session (the pooled connection stays open for reuse)"""
+        self.session = None
     
     def _get_session_start_time(self, timeframe: str) -> datetime:
         """Get session start time based on timeframe - TradingView compatible"""
@@ -148,8 +328,8 @@ class ProfileCalculator:
             # Fetch current price first
             current_price = await self._get_current_price(binance_symbol)
             
-            # Fetch session-based candle data for each timeframe
-            candle_data = await self._fetch_all_session_candles(binance_symbol)
+            # Bring incremental session profiles up to date (only new candles are fetched)
+            session_profiles = await self._refresh_all_session_profiles(binance_symbol)
             
             # Calculate profiles for each timeframe
             profiles = {
@@ -157,28 +337,19 @@ class ProfileCalculator:
                 'current_price': current_price
             }
             
-            for timeframe, candles in candle_data.items():
-                if candles:
-                    logger.info(f"Calculating {timeframe} profile with {len(candles)} candles")
-                    
-                    vp = self.calculate_volume_profile(
-                        candles, 
-                        num_bins=self.TIMEFRAME_CONFIG[timeframe]['bins']
-                    )
-                    
-                    tpo = self.calculate_tpo_profile(
-                        candles,
-                        timeframe=timeframe
-                    )
-                    
-                    # Calculate VWAP using same session data as Volume Profile
-                    vwap = self.calculate_vwap(candles)
+            for timeframe, accumulator in session_profiles.items():
+                if len(accumulator):
+                    logger.info(f"Reading {timeframe} session profile with {len(accumulator)} candles")
                     
                     profiles[timeframe] = {
-                        'volume_profile': vp,
-                        'tpo': tpo,
-                        'vwap': vwap,
-                        'candles': len(candles),
+                        'volume_profile': self._session_volume_profile(
+                            accumulator,
+                            num_bins=self.TIMEFRAME_CONFIG[timeframe]['bins']
+                        ),
+                        'tpo': self._session_tpo_profile(accumulator),
+                        # VWAP uses the same session data as Volume Profile
+                        'vwap': accumulator.vwap(),
+                        'candles': len(accumulator),
                         'period': self._get_session_period_name(timeframe)
                     }
             
@@ -205,63 +376,73 @@ class ProfileCalculator:
             data = await response.json()
             return float(data['price'])
     
-    async def _fetch_all_session_candles(self, symbol: str) -> Dict[str, List[Candle]]:
-        """Fetch session-based candles for all timeframes - TradingView compatible"""
-        tasks = {}
-        
-        for timeframe, config in self.TIMEFRAME_CONFIG.items():
-            # Get session start time for this timeframe
-            session_start = self._get_session_start_time(timeframe)
-            candles_needed = self._calculate_session_candles(config['interval'], session_start)
-            
-            logger.info(f"Timeframe {timeframe}: Session start {session_start.strftime('%Y-%m-%d %H:%M UTC')}, "
-                       f"candles needed: {candles_needed}")
-            
-            task = self._fetch_candles(symbol, config['interval'], candles_needed)
-            tasks[timeframe] = task
-        
-        # Execute all fetches in parallel
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    async def _refresh_session_profile(self, symbol: str, timeframe: str) -> SessionProfileAccumulator:
+        """Fetch only candles newer than the last closed one and fold them into the session profile"""
+        config = self.TIMEFRAME_CONFIG[timeframe]
+        session_start = self._get_session_start_time(timeframe)
+        session_start_ms = int(session_start.timestamp() * 1000)
+        
+        key = (symbol, timeframe)
+        accumulator = self.session_profiles.get(key)
+        
+        if accumulator is None or accumulator.session_start_ms != session_start_ms:
+            # New symbol or session boundary crossed: start over from the session open
+            interval_ms = self.INTERVAL_MS[config['interval']]
+            accumulator = SessionProfileAccumulator(session_start_ms, interval_ms)
+            self.session_profiles[key] = accumulator
+        
+        # Page forward from the first unfolded candle until the forming one is reached;
+        # a single request is capped at 1000 klines, less than a 1m session
+        while True:
+            batch = await self._fetch_candles(symbol, config['interval'], 1000, start_time=accumulator.next_open_ms)
+            now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+            folded_before = accumulator.next_open_ms
+            accumulator.update(batch, now_ms)
+            if (not len(batch)
+                    or int(batch.timestamp[-1]) + accumulator.interval_ms > now_ms
+                    or accumulator.next_open_ms == folded_before):
+                break
         
-        candle_data = {}
-        for timeframe, result in zip(tasks.keys(), results):
+        return accumulator
+    
+    async def _refresh_all_session_profiles(self, symbol: str) -> Dict[str, SessionProfileAccumulator]:
+        """Refresh session profiles for all timeframes in parallel"""
+        timeframes = list(self.TIMEFRAME_CONFIG.keys())
+        results = await asyncio.gather(
+            *(self._refresh_session_profile(symbol, timeframe) for timeframe in timeframes),
+            return_exceptions=True
+        )
+        
+        session_profiles = {}
+        for timeframe, result in zip(timeframes, results):
             if isinstance(result, Exception):
-                logger.error(f"Error fetching {timeframe} candles: {result}")
-                candle_data[timeframe] = []
+                logger.error(f"Error refreshing {timeframe} session profile: {result}")
             else:
-                candle_data[timeframe] = result
+                session_profiles[timeframe] = result
         
-        return candle_data
+        return session_profiles
     
-    async def _fetch_all_candles(self, symbol: str) -> Dict[str, List[Candle]]:
-        """Fetch candles for all timeframes in parallel"""
-        tasks = {}
-        
-        for timeframe, config in self.TIMEFRAME_CONFIG.items():
-            task = self._fetch_candles(
-                symbol, 
-                config['interval'], 
-                config['lookback']
-            )
-            tasks[timeframe] = task
-        
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
-        
-        candle_data = {}
-        for timeframe, result in zip(tasks.keys(), results):
-            if isinstance(result, Exception):
-                logger.error(f"Failed to fetch {timeframe} candles: {result}")
-                candle_data[timeframe] = []
-            else:
-                candle_data[timeframe] = result
+    def _session_volume_profile(self, accumulator: SessionProfileAccumulator, num_bins: int) -> Dict[str, float]:
+        """Volume Profile read from an incremental session accumulator"""
+        high, low = accumulator.price_range()
+        if high == low:
+            return {'poc': high, 'vah': high, 'val': low, 'value_area_pct': 100.0}
         
-        return candle_data
+        price_levels = np.linspace(low, high, num_bins + 1)
+        return self._volume_profile_from_histogram(accumulator.volume_histogram(price_levels), price_levels, high, low)
     
-    async def _fetch_vwap_candles(self, symbol: str, interval: str, limit: int) -> List[Candle]:
-        """Fetch candles specifically for VWAP calculation with trading-optimized periods"""
-        return await self._fetch_candles(symbol, interval, limit)
+    def _session_tpo_profile(self, accumulator: SessionProfileAccumulator) -> Dict[str, float]:
+        """TPO profile read from an incremental session accumulator"""
+        high, low = accumulator.price_range()
+        if high == low:
+            return {'poc': high, 'vah': high, 'val': low, 'value_area_pct': 100.0}
+        
+        price_levels = np.linspace(low, high, 100)
+        return self._tpo_from_level_counts(price_levels, accumulator.tpo_counts(price_levels), high, low,
+                                           *accumulator.candle_extremes())
     
-    async def _fetch_candles(self, symbol: str, interval: str, limit: int) -> List[Candle]:
+    async def _fetch_candles(self, symbol: str, interval: str, limit: int,
+                             start_time: Optional[int] = None) -> CandleBatch:
         """Fetch candles from Binance API"""
         url = "https://api.binance.com/api/v3/klines"
         params = {
@@ -269,6 +450,8 @@ class ProfileCalculator:
             'interval': interval,
             'limit': min(limit, 1000)  # Binance limit
         }
+        if start_time is not None:
+            params['startTime'] = start_time
         
         async with self.session.get(url, params=params) as response:
             if response.status != 200:
@@ -276,20 +459,9 @@ class ProfileCalculator:
             
             data = await response.json()
             
-            candles = []
-            for kline in data:
-                candles.append(Candle(
-                    timestamp=kline[0],
-                    open=float(kline[1]),
-                    high=float(kline[2]),
-                    low=float(kline[3]),
-                    close=float(kline[4]),
-                    volume=float(kline[5])
-                ))
-            
-            return candles
+            return CandleBatch.from_klines(data)
     
-    def calculate_volume_profile(self, candles: List[Candle], num_bins: int = 24) -> Dict[str, float]:
+    def calculate_volume_profile(self, candles: CandleBatch, num_bins: int = 24) -> Dict[str, float]:
         """
         Calculate Volume Profile (VP) - TradingView compatible
         
@@ -299,12 +471,15 @@ class ProfileCalculator:
             val: Value Area Low (lower boundary of 70% volume)
             value_area_pct: Actual percentage of volume in value area
         """
-        if not candles:
+        candles = _as_batch(candles)
+        if not len(candles):
             return {'poc': 0, 'vah': 0, 'val': 0, 'value_area_pct': 0}
         
+        highs, lows, closes, volumes = candles.high, candles.low, candles.close, candles.volume
+        
         # Find price range
-        high = max(c.high for c in candles)
-        low = min(c.low for c in candles)
+        high = highs.max()
+        low = lows.min()
         
         # Prevent division by zero
         if high == low:
@@ -312,33 +487,14 @@ class ProfileCalculator:
         
         # Create price levels (bins)
         price_levels = np.linspace(low, high, num_bins + 1)
-        volume_at_price = np.zeros(num_bins)
+        volume_at_price = self._distribute_volume(highs, lows, closes, volumes, price_levels)
         
-        # Distribute volume across price levels (TradingView method)
-        for candle in candles:
-            candle_range = candle.high - candle.low
-            
-            if candle_range == 0:
-                # Single price point (doji candle)
-                idx = np.searchsorted(price_levels[:-1], candle.close)
-                if idx > 0:
-                    idx -= 1
-                if idx < num_bins:
-                    volume_at_price[idx] += candle.volume
-            else:
-                # Distribute volume uniformly across candle range
-                for i in range(num_bins):
-                    level_low = price_levels[i]
-                    level_high = price_levels[i + 1]
-                    
-                    # Calculate overlap between candle and price level
-                    overlap_low = max(candle.low, level_low)
-                    overlap_high = min(candle.high, level_high)
-                    
-                    if overlap_low < overlap_high:
-                        # Calculate proportion of candle in this level
-                        overlap_pct = (overlap_high - overlap_low) / candle_range
-                        volume_at_price[i] += candle.volume * overlap_pct
+        return self._volume_profile_from_histogram(volume_at_price, price_levels, high, low)
+    
+    def _volume_profile_from_histogram(self, volume_at_price: np.ndarray, price_levels: np.ndarray,
+                                       high: float, low: float) -> Dict[str, float]:
+        """POC and 70% value area from a volume-at-price histogram"""
+        num_bins = len(volume_at_price)
         
         # Find POC (Point of Control)
         if np.sum(volume_at_price) == 0:
@@ -398,22 +554,56 @@ class ProfileCalculator:
         val = price_levels[val_index]
         
         return {
-            'poc': round(poc_price, 2),
-            'vah': round(vah, 2),
-            'val': round(val, 2),
+            'poc': _round_price(poc_price),
+            'vah': _round_price(vah),
+            'val': _round_price(val),
             'value_area_pct': round((accumulated_volume / total_volume) * 100, 1)
         }
     
-    def calculate_tpo_profile(self, candles: List[Candle], timeframe: str) -> Dict[str, float]:
+    @staticmethod
+    def _distribute_volume(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                           volumes: np.ndarray, price_levels: np.ndarray) -> np.ndarray:
+        """
+        Distribute each candle's volume uniformly over its high-low range (TradingView method)
+        
+        Vectorized over a (candles x bins) overlap matrix instead of a Python
+        loop per candle per bin.
+        """
+        num_bins = len(price_levels) - 1
+        volume_at_price = np.zeros(num_bins)
+        candle_range = highs - lows
+        ranged = candle_range > 0
+        
+        if ranged.any():
+            r_high = highs[ranged, None]
+            r_low = lows[ranged, None]
+            # Overlap between each candle and each price level
+            overlap = np.minimum(r_high, price_levels[None, 1:]) - np.maximum(r_low, price_levels[None, :-1])
+            np.maximum(overlap, 0.0, out=overlap)
+            weights = volumes[ranged] / candle_range[ranged]
+            volume_at_price += weights @ overlap
+        
+        # Single price point (doji candle) goes to the level containing the close
+        doji = ~ranged
+        if doji.any():
+            idx = np.searchsorted(price_levels[:-1], closes[doji])
+            idx = np.where(idx > 0, idx - 1, idx)
+            valid = idx < num_bins
+            np.add.at(volume_at_price, idx[valid], volumes[doji][valid])
+        
+        return volume_at_price
+    
+    def calculate_tpo_profile(self, candles: CandleBatch, timeframe: str) -> Dict[str, float]:
         """
         Calculate Time Price Opportunity (TPO) profile
         """
-        if not candles:
+        candles = _as_batch(candles)
+        if not len(candles):
             return {'poc': 0, 'vah': 0, 'val': 0, 'value_area_pct': 0}
         
         # Find price range
-        high = max(c.high for c in candles)
-        low = min(c.low for c in candles)
+        high = candles.high.max()
+        low = candles.low.min()
         
         if high == low:
             return {'poc': high, 'vah': high, 'val': low, 'value_area_pct': 100.0}
@@ -422,90 +612,91 @@ class ProfileCalculator:
         num_levels = 100
         price_levels = np.linspace(low, high, num_levels)
         
-        # Count time at each price level
-        time_at_price = {}
+        # Count time at each price level: each candle touches a contiguous index
+        # range, accumulated with a difference array and one cumsum
+        first = np.searchsorted(price_levels, candles.low, side='left')
+        last = np.searchsorted(price_levels, candles.high, side='right')
+        diff = np.bincount(first, minlength=num_levels + 1) - np.bincount(last, minlength=num_levels + 1)
+        counts = np.cumsum(diff[:num_levels])
         
-        for candle in candles:
-            # Find all price levels touched by this candle
-            touched_levels = price_levels[
-                (price_levels >= candle.low) & (price_levels <= candle.high)
-            ]
-            
-            for level in touched_levels:
-                level_key = round(level, 2)
-                time_at_price[level_key] = time_at_price.get(level_key, 0) + 1
+        return self._tpo_from_level_counts(price_levels, counts, high, low, candles.low, candles.high)
+    
+    def _tpo_from_level_counts(self, price_levels: np.ndarray, counts: np.ndarray, high: float, low: float,
+                               candle_lows: np.ndarray, candle_highs: np.ndarray) -> Dict[str, float]:
+        """
+        TPO POC and 70% value area from per-level touch counts
         
-        if not time_at_price:
+        Works on integer bin indices, so distinct levels never merge regardless
+        of price magnitude. Expansion alternates one level up, then one level
+        down while short of 70%, evaluated with a cumulative sum. Candle lows
+        and highs (in time order) only break POC ties.
+        """
+        touched = np.flatnonzero(counts)
+        if not len(touched):
             return {'poc': (high + low) / 2, 'vah': high, 'val': low, 'value_area_pct': 0}
         
-        # Find TPO POC (most time at price)
-        tpo_poc = max(time_at_price, key=time_at_price.get)
+        levels = price_levels[touched]
+        times = counts[touched]
+        
+        # Find TPO POC (most time at price). Ties go to the level the earliest
+        # candle touched first, lowest first within a candle, as levels were
+        # first seen when candles were walked in time order
+        tied = np.flatnonzero(times == times.max())
+        poc_index = int(tied[0])
+        if len(tied) > 1:
+            tied_levels = levels[tied]
+            touches = (candle_lows[:, None] <= tied_levels) & (candle_highs[:, None] >= tied_levels)
+            poc_index = int(tied[np.argmin(touches.argmax(axis=0))])
         
         # Calculate TPO Value Area (70% of time)
-        total_time = sum(time_at_price.values())
+        total_time = int(times.sum())
         value_area_time = total_time * 0.70
         
-        # Sort prices
-        sorted_prices = sorted(time_at_price.keys())
-        
-        # Find POC index
-        try:
-            poc_index = sorted_prices.index(tpo_poc)
-        except ValueError:
-            poc_index = len(sorted_prices) // 2
-        
-        # Expand from POC outward
-        va_indices = {poc_index}
-        accumulated_time = time_at_price[tpo_poc]
-        
-        while accumulated_time < value_area_time:
-            max_idx = max(va_indices)
-            min_idx = min(va_indices)
-            
-            added = False
-            
-            # Try to expand upward
-            if max_idx + 1 < len(sorted_prices):
-                va_indices.add(max_idx + 1)
-                accumulated_time += time_at_price[sorted_prices[max_idx + 1]]
-                added = True
-            
-            # Try to expand downward if still need more
-            if accumulated_time < value_area_time and min_idx - 1 >= 0:
-                va_indices.add(min_idx - 1)
-                accumulated_time += time_at_price[sorted_prices[min_idx - 1]]
-                added = True
-            
-            if not added:
-                break
-        
-        tpo_vah = sorted_prices[max(va_indices)]
-        tpo_val = sorted_prices[min(va_indices)]
+        # Order in which levels join the value area: up, down, up, down, ...
+        # then whatever remains on the longer side
+        above = times[poc_index + 1:]
+        below = times[:poc_index][::-1]
+        paired = min(len(above), len(below))
+        additions = np.empty(2 * paired, dtype=np.int64)
+        additions[0::2] = above[:paired]
+        additions[1::2] = below[:paired]
+        directions = np.tile(np.array([1, -1]), paired)
+        if len(above) > paired:
+            additions = np.concatenate((additions, above[paired:]))
+            directions = np.concatenate((directions, np.ones(len(above) - paired, dtype=np.int64)))
+        elif len(below) > paired:
+            additions = np.concatenate((additions, below[paired:]))
+            directions = np.concatenate((directions, -np.ones(len(below) - paired, dtype=np.int64)))
+        
+        accumulated = times[poc_index] + np.cumsum(additions)
+        if times[poc_index] >= value_area_time:
+            steps = 0
+        else:
+            steps = min(int(np.searchsorted(accumulated, value_area_time, side='left')) + 1, len(additions))
+        accumulated_time = int(accumulated[steps - 1]) if steps else int(times[poc_index])
+        
+        taken = directions[:steps]
+        vah_index = poc_index + int(np.count_nonzero(taken > 0))
+        val_index = poc_index - int(np.count_nonzero(taken < 0))
         
         return {
-            'poc': round(tpo_poc, 2),
-            'vah': round(tpo_vah, 2),
-            'val': round(tpo_val, 2),
+            'poc': _round_price(levels[poc_index]),
+            'vah': _round_price(levels[vah_index]),
+            'val': _round_price(levels[val_index]),
             'value_area_pct': round((accumulated_time / total_time) * 100, 1)
         }
     
-    def calculate_vwap(self, candles: List[Candle]) -> float:
+    def calculate_vwap(self, candles: CandleBatch) -> float:
         """Calculate VWAP (Volume Weighted Average Price)"""
-        if not candles:
+        candles = _as_batch(candles)
+        if not len(candles):
             return 0.0
         
-        total_volume_price = 0.0
-        total_volume = 0.0
-        
-        for candle in candles:
-            # Calculate typical price (H + L + C) / 3
-            typical_price = (candle.high + candle.low + candle.close) / 3.0
-            volume = candle.volume
-            
-            total_volume_price += typical_price * volume
-            total_volume += volume
+        # Typical price (H + L + C) / 3 weighted by volume
+        typical_price = (candles.high + candles.low + candles.close) / 3.0
+        total_volume = float(candles.volume.sum())
         
         if total_volume == 0:
-            return candles[-1].close  # Return last close if no volume
+            return float(candles.close[-1])  # Return last close if no volume
         
-        return round(total_volume_price / total_volume, 2)
\ No newline at end of file
+        return _round_price(float(np.dot(typical_price, candles.volume)) / total_volume)
\ No newline at end of file
@@ -0,0 +1,365 @@
+"""
+Shared Rate Limiter for outbound exchange REST calls
+Token buckets per exchange API (per endpoint where the exchange limits per
+endpoint) charged with Binance-style request weights. Interactive requests are
+granted ahead of background monitor traffic, and every grant's queueing delay
+is recorded. Attached to pooled sessions as an aiohttp trace hook, so every
+request through http_pool (providers, analysis engines, ccxt) is scheduled
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+import aiohttp
+from aiohttp import web
+from yarl import URL
+from loguru import logger
+
+# Priority classes, lower is served first
+INTERACTIVE = 0
+BACKGROUND = 1
+PRIORITY_NAMES = {INTERACTIVE: 'interactive', BACKGROUND: 'background'}
+
+# Priority of the requests made by the current task (inherited by tasks it spawns)
+request_priority: ContextVar[int] = ContextVar('request_priority', default=INTERACTIVE)
+
+@contextmanager
+def priority(level: int):
+    """Run the enclosed requests at `level`"""
+    token = request_priority.set(level)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+def parse_priority(value: Optional[str]) -> int:
+    """Priority from an X-Request-Priority header value (interactive unless 'background')"""
+    return BACKGROUND if (value or '').strip().lower() == 'background' else INTERACTIVE
+
+# Request weight from URL path and query
+Weigher = Callable[[str, Mapping[str, str]], int]
+
+def _limit_weight(query: Mapping[str, str], default_limit: int, tiers: Tuple[Tuple[float, int], ...]) -> int:
+    """Weight from the first tier whose max limit covers the request's `limit`"""
+    try:
+        limit = int(query.get('limit', default_limit))
+    except ValueError:
+        limit = default_limit
+    for max_limit, weight in tiers:
+        if limit <= max_limit:
+            return weight
+    return tiers[-1][1]
+
+# path -> (weight with symbol, weight without symbol)
+BINANCE_SPOT_WEIGHTS = {
+    '/api/v3/ticker/24hr': (2, 80),
+    '/api/v3/ticker/price': (2, 4),
+    '/api/v3/ticker/bookTicker': (2, 4),
+    '/api/v3/exchangeInfo': (20, 20),
+    '/api/v3/klines': (2, 2),
+    '/api/v3/aggTrades': (4, 4),
+    '/api/v3/trades': (25, 25),
+    '/api/v3/account': (20, 20),
+}
+
+# Endpoint (after /fapi/vN/ or /dapi/vN/) -> (weight with symbol, weight without symbol)
+BINANCE_FUTURES_WEIGHTS = {
+    'ticker/24hr': (1, 40),
+    'ticker/price': (1, 2),
+    'ticker/bookTicker': (2, 5),
+    'premiumIndex': (1, 10),
+    'openInterest': (1, 1),
+    'exchangeInfo': (1, 1),
+    'account': (5, 5),
+    'positionRisk': (5, 5),
+    'balance': (5, 5),
+}
+
+def binance_spot_weight(path: str, query: Mapping[str, str]) -> int:
+    if path == '/api/v3/depth':
+        return _limit_weight(query, 100, ((100, 5), (500, 25), (1000, 50), (5000, 250)))
+    with_symbol, without_symbol = BINANCE_SPOT_WEIGHTS.get(path, (1, 1))
+    return with_symbol if 'symbol' in query else without_symbol
+
+def binance_futures_weight(path: str, query: Mapping[str, str]) -> int:
+    parts = path.split('/', 3)  # '', 'fapi', 'v1', endpoint
+    endpoint = parts[3] if len(parts) == 4 and parts[1] in ('fapi', 'dapi') else path
+    if endpoint in ('klines', 'continuousKlines', 'markPriceKlines', 'indexPriceKlines'):
+        return _limit_weight(query, 500, ((99, 1), (499, 2), (1000, 5), (1500, 10)))
+    if endpoint == 'depth':
+        return _limit_weight(query, 500, ((50, 2), (100, 5), (500, 10), (1000, 20)))
+    with_symbol, without_symbol = BINANCE_FUTURES_WEIGHTS.get(endpoint, (1, 1))
+    return with_symbol if 'symbol' in query or 'pair' in query else without_symbol
+
+def hyperliquid_weight(path: str, query: Mapping[str, str]) -> int:
+    # Most /info requests (including metaAndAssetCtxs) weigh 20; actions weigh 1
+    return 20 if path == '/info' else 1
+
+def unit_weight(path: str, query: Mapping[str, str]) -> int:
+    return 1
+
+@dataclass
+class HostLimit:
+    """Published limit of one exchange API host"""
+    bucket: str                             # Bucket name, e.g. 'binance_futures'
+    capacity: float                         # Weight allowed per window
+    window: float                           # Window in seconds
+    per_endpoint: bool = False              # Exchange limits each endpoint separately
+    weigh: Weigher = unit_weight
+    used_weight_header: Optional[str] = None  # Response header with the IP's used weight
+
+MBX_USED_WEIGHT = 'X-MBX-USED-WEIGHT-1M'
+
+HOST_LIMITS: Dict[str, HostLimit] = {
+    'api.binance.com': HostLimit('binance_spot', 6000, 60, weigh=binance_spot_weight,
+                                 used_weight_header=MBX_USED_WEIGHT),
+    'fapi.binance.com': HostLimit('binance_futures', 2400, 60, weigh=binance_futures_weight,
+                                  used_weight_header=MBX_USED_WEIGHT),
+    'dapi.binance.com': HostLimit('binance_delivery', 2400, 60, weigh=binance_futures_weight,
+                                  used_weight_header=MBX_USED_WEIGHT),
+    'api.bybit.com': HostLimit('bybit', 600, 5),
+    'www.okx.com': HostLimit('okx', 20, 2, per_endpoint=True),
+    'api.gateio.ws': HostLimit('gateio', 200, 10, per_endpoint=True),
+    'api.bitget.com': HostLimit('bitget', 20, 1, per_endpoint=True),
+    'api.hyperliquid.xyz': HostLimit('hyperliquid', 1200, 60, weigh=hyperliquid_weight),
+}
+
+@dataclass
+class DelayStats:
+    """Queueing delay of the grants of one priority class"""
+    granted: int = 0
+    queued: int = 0             # Grants that had to wait
+    total_delay: float = 0.0
+    max_delay: float = 0.0
+
+    def record(self, delay: float):
+        self.granted += 1
+        if delay > 0:
+            self.queued += 1
+            self.total_delay += delay
+            self.max_delay = max(self.max_delay, delay)
+
+    def to_dict(self) -> dict:
+        return {
+            'granted': self.granted,
+            'queued': self.queued,
+            'avg_delay_ms': round(self.total_delay / self.granted * 1000, 1) if self.granted else 0.0,
+            'max_delay_ms': round(self.max_delay * 1000, 1)
+        }
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    weight: float = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+class TokenBucket:
+    """
+    Weight budget refilling at capacity / window per second
+
+    Waiters are served strictly in (priority, arrival) order: a large request
+    at the head is not overtaken by smaller ones behind it, so background
+    bursts cannot starve it and interactive requests always go first.
+    """
+
+    def __init__(self, name: str, capacity: float, window: float):
+        self.name = name
+        self.capacity = capacity
+        self.rate = capacity / window
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.delays: Dict[int, DelayStats] = {level: DelayStats() for level in PRIORITY_NAMES}
+        self.stats = {'weight': 0.0, 'throttled': 0, 'synced': 0}
+
+    def _refill(self, now: float):
+        if now > self.updated:
+            start = max(self.updated, self.paused_until)
+            if now > start:
+                self.tokens = min(self.capacity, self.tokens + (now - start) * self.rate)
+            self.updated = now
+
+    async def acquire(self, weight: float, level: int = INTERACTIVE) -> float:
+        """Take `weight` tokens, waiting behind higher-priority and earlier requests; returns the delay"""
+        weight = min(weight, self.capacity)
+        now = time.monotonic()
+        self._refill(now)
+        if not self.waiters and now >= self.paused_until and self.tokens >= weight:
+            self.tokens -= weight
+            self._granted(weight, level, 0.0)
+            return 0.0
+
+        waiter = _Waiter(level, next(self._seq), weight, now, asyncio.get_running_loop().create_future())
+        heapq.heappush(self.waiters, waiter)
+        self._drain()
+        await waiter.future
+        delay = time.monotonic() - now
+        self._granted(weight, level, delay)
+        return delay
+
+    def _granted(self, weight: float, level: int, delay: float):
+        self.stats['weight'] += weight
+        self.delays[level].record(delay)
+
+    def _drain(self):
+        """Grant waiters in order while tokens last, then sleep until the head fits"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        now = time.monotonic()
+        self._refill(now)
+        waiters = self.waiters
+        while waiters:
+            head = waiters[0]
+            if head.future.done():  # Cancelled caller
+                heapq.heappop(waiters)
+                continue
+            if now < self.paused_until or self.tokens < head.weight:
+                break
+            heapq.heappop(waiters)
+            self.tokens -= head.weight
+            head.future.set_result(None)
+
+        if waiters:
+            wait = max(self.paused_until - now, 0.0) + max(waiters[0].weight - self.tokens, 0.0) / self.rate
+            self._timer = asyncio.get_running_loop().call_later(wait, self._drain)
+
+    def throttle(self, seconds: float):
+        """The exchange rejected us (429/418): stop granting for `seconds`"""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens = 0.0
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.stats['throttled'] += 1
+        if self.waiters:
+            self._drain()
+
+    def sync_used(self, used_weight: float, limit: float):
+        """Align with the exchange's count of weight used this window (it sees every client on the IP)"""
+        now = time.monotonic()
+        self._refill(now)
+        remaining = self.capacity - used_weight * self.capacity / limit
+        if remaining < self.tokens:
+            self.tokens = max(remaining, 0.0)
+            self.stats['synced'] += 1
+
+    def get_status(self) -> dict:
+        self._refill(time.monotonic())
+        return {
+            'tokens': round(self.tokens, 1),
+            'capacity': self.capacity,
+            'queue_depth': sum(1 for w in self.waiters if not w.future.done()),
+            'paused_for': round(max(self.paused_until - time.monotonic(), 0.0), 1),
+            'delays': {PRIORITY_NAMES[level]: stats.to_dict() for level, stats in self.delays.items()},
+            **self.stats
+        }
+
+class RateLimiter:
+    """
+    Buckets for every known exchange host
+
+    Capacity is `headroom` of the published limit, leaving room for clock
+    drift and for clients that do not go through this limiter. Requests to
+    hosts without a HostLimit pass through unmetered.
+    """
+
+    def __init__(self, host_limits: Dict[str, HostLimit] = None, headroom: float = 0.8):
+        self.host_limits = host_limits or HOST_LIMITS
+        self.headroom = headroom
+        self.buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket(self, limit: HostLimit, path: str) -> TokenBucket:
+        name = f"{limit.bucket}:{path}" if limit.per_endpoint else limit.bucket
+        bucket = self.buckets.get(name)
+        if bucket is None:
+            bucket = TokenBucket(name, limit.capacity * self.headroom, limit.window)
+            self.buckets[name] = bucket
+        return bucket
+
+    def resolve(self, url: URL) -> Optional[Tuple[TokenBucket, int]]:
+        """Bucket and weight of a request (None if the host is not limited)"""
+        limit = self.host_limits.get(url.host)
+        if limit is None:
+            return None
+        return self._bucket(limit, url.path), limit.weigh(url.path, url.query)
+
+    async def acquire(self, url: URL, level: Optional[int] = None) -> float:
+        """Wait until the request may be sent; returns the queueing delay in seconds"""
+        resolved = self.resolve(url)
+        if resolved is None:
+            return 0.0
+        bucket, weight = resolved
+        delay = await bucket.acquire(weight, request_priority.get() if level is None else level)
+        if delay > 1.0:
+            logger.debug(f"{bucket.name} request queued {delay:.2f}s ({url.path})")
+        return delay
+
+    def observe_response(self, url: URL, status: int, headers: Mapping[str, str]):
+        """Back off on rate-limit rejections and sync with used-weight headers"""
+        limit = self.host_limits.get(url.host)
+        if limit is None:
+            return
+        bucket = self._bucket(limit, url.path)
+
+        if status in (418, 429):
+            try:
+                retry_after = float(headers.get('Retry-After', limit.window))
+            except ValueError:
+                retry_after = limit.window
+            logger.warning(f"{bucket.name} rate limited (HTTP {status}), pausing {retry_after:.0f}s")
+            bucket.throttle(retry_after)
+            return
+
+        if limit.used_weight_header:
+            used = headers.get(limit.used_weight_header)
+            if used is not None:
+                try:
+                    bucket.sync_used(float(used), limit.capacity)
+                except ValueError:
+                    pass
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """aiohttp hooks that schedule each request of a session through this limiter"""
+        async def on_request_start(session, context, params):
+            context.queue_delay = await self.acquire(params.url)
+
+        async def on_request_end(session, context, params):
+            self.observe_response(params.url, params.response.status, params.response.headers)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        return trace_config
+
+    def get_status(self) -> dict:
+        return {name: bucket.get_status() for name, bucket in sorted(self.buckets.items())}
+
+def create_priority_middleware():
+    """Build an aiohttp middleware running each request at its X-Request-Priority class"""
+
+    @web.middleware
+    async def priority_middleware(request: web.Request, handler):
+        with priority(parse_priority(request.headers.get('X-Request-Priority'))):
+            return await handler(request)
+
+    return priority_middleware
+
+_limiter: Optional[RateLimiter] = None
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter, creating it lazily"""
+    global _limiter
+    if _limiter is None:
+        _limiter = RateLimiter()
+    return _limiter
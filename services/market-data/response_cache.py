@@ -0,0 +1,135 @@
+"""
+Response Cache Middleware for the Market Data aiohttp app
+Per-route TTL caching with a bounded LRU and stale-while-revalidate refresh
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from dataclasses import dataclass
+from aiohttp import web
+from loguru import logger
+try:
+    from .rate_limiter import BACKGROUND, priority
+except ImportError:
+    from rate_limiter import BACKGROUND, priority
+
+# Freshness policy per route: (ttl_seconds, stale_seconds)
+# Within ttl the cached body is served as-is; within ttl + stale it is served
+# immediately while a background refresh replaces it.
+DEFAULT_ROUTE_POLICIES: Dict[str, Tuple[float, float]] = {
+    '/combined_price': (3.0, 10.0),
+    '/combined_prices': (3.0, 10.0),
+    '/top_symbols': (30.0, 60.0),
+    '/volume_scan': (30.0, 60.0),
+    '/multi_oi': (20.0, 40.0),
+    '/multi_oi_bulk': (20.0, 40.0),
+    '/market_profile': (30.0, 60.0),
+    '/thresholds': (60.0, 240.0),
+}
+
+@dataclass
+class CachedResponse:
+    status: int
+    body: bytes
+    content_type: str
+    stored_at: float
+
+class ResponseCache:
+    """Bounded LRU of serialized responses with per-route freshness"""
+
+    def __init__(self, route_policies: Dict[str, Tuple[float, float]] = None, max_entries: int = 512):
+        self.route_policies = route_policies or dict(DEFAULT_ROUTE_POLICIES)
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[tuple, CachedResponse]" = OrderedDict()
+        self.refreshing: Dict[tuple, asyncio.Task] = {}
+        self.stats = {'hits': 0, 'misses': 0, 'stale': 0, 'evictions': 0}
+
+    def get(self, key: tuple) -> Optional[CachedResponse]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple, entry: CachedResponse):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    @staticmethod
+    def is_cacheable(status: int, body: bytes) -> bool:
+        """Only cache successful payloads, never error results"""
+        if status != 200:
+            return False
+        try:
+            payload = json.loads(body)
+        except (ValueError, TypeError):
+            return False
+        return not (isinstance(payload, dict) and payload.get('success') is False)
+
+def create_cache_middleware(cache: ResponseCache):
+    """Build an aiohttp middleware serving cached responses for configured routes"""
+
+    def _render(entry: CachedResponse, status: str) -> web.Response:
+        response = web.Response(status=entry.status, body=entry.body, content_type=entry.content_type)
+        response.headers['X-Cache'] = status
+        response.headers['X-Cache-Age'] = f"{time.monotonic() - entry.stored_at:.1f}"
+        return response
+
+    async def _call_and_store(key: tuple, request: web.Request, handler) -> Tuple[web.StreamResponse, Optional[CachedResponse]]:
+        response = await handler(request)
+        body = getattr(response, 'body', None)
+        if isinstance(body, bytes) and cache.is_cacheable(response.status, body):
+            entry = CachedResponse(
+                status=response.status,
+                body=body,
+                content_type=response.content_type,
+                stored_at=time.monotonic()
+            )
+            cache.put(key, entry)
+            return response, entry
+        return response, None
+
+    async def _background_refresh(key: tuple, request: web.Request, handler):
+        try:
+            # Nobody is waiting on this response, so its upstream calls yield to interactive ones
+            with priority(BACKGROUND):
+                await _call_and_store(key, request, handler)
+        except Exception as e:
+            logger.warning(f"Background cache refresh failed for {key[0]}: {e}")
+        finally:
+            cache.refreshing.pop(key, None)
+
+    @web.middleware
+    async def cache_middleware(request: web.Request, handler):
+        policy = cache.route_policies.get(request.path)
+        if policy is None:
+            return await handler(request)
+
+        ttl, stale = policy
+        # Body is read once here; aiohttp keeps it for the handler's request.json()
+        body = await request.read()
+        key = (request.path, request.method, request.query_string, body)
+
+        entry = cache.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.stored_at
+            if age < ttl:
+                cache.stats['hits'] += 1
+                return _render(entry, 'HIT')
+            if age < ttl + stale:
+                cache.stats['stale'] += 1
+                if key not in cache.refreshing:
+                    cache.refreshing[key] = asyncio.ensure_future(_background_refresh(key, request, handler))
+                return _render(entry, 'STALE')
+
+        cache.stats['misses'] += 1
+        response, _ = await _call_and_store(key, request, handler)
+        response.headers['X-Cache'] = 'MISS'
+        return response
+
+    return cache_middleware
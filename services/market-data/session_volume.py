@@ -224,8 +224,8 @@ class SessionVolumeEngine:
                 logger.warning(f"Exchange {exchange} not available")
                 return 0.0
                 
-            ex = self.exchange_manager.exchanges[exchange]
-            ohlcv = await ex.fetch_ohlcv(symbol, timeframe, limit=candles_needed + 5)
+            store = self.exchange_manager.candle_store
+            ohlcv = await store.fetch_ohlcv(exchange, symbol, timeframe, limit=candles_needed + 5)
             
             if not ohlcv:
                 return 0.0
@@ -289,9 +289,9 @@ class SessionVolumeEngine:
                 candles_needed = session_config['hours'] * 4 + 10  # 4 candles per hour + buffer
                 
                 try:
-                    ex = self.exchange_manager.exchanges[exchange]
+                    store = self.exchange_manager.candle_store
                     since_timestamp = session_start_timestamp - (candles_needed * 900000)  # Go back further
-                    ohlcv = await ex.fetch_ohlcv(symbol, timeframe, limit=candles_needed, since=since_timestamp)
+                    ohlcv = await store.fetch_ohlcv(exchange, symbol, timeframe, limit=candles_needed, since=since_timestamp)
                     
                     if ohlcv:
                         day_session_volume = 0.0
@@ -371,8 +371,8 @@ class SessionVolumeEngine:
             day_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
             candles_since_start = int((current_time - day_start).total_seconds() / 900)  # 15m candles
             
-            ex = self.exchange_manager.exchanges[exchange]
-            ohlcv = await ex.fetch_ohlcv(symbol, timeframe, limit=candles_since_start + 10)
+            store = self.exchange_manager.candle_store
+            ohlcv = await store.fetch_ohlcv(exchange, symbol, timeframe, limit=candles_since_start + 10)
             
             current_daily_volume = 0.0
             day_start_timestamp = int(day_start.timestamp() * 1000)
@@ -392,7 +392,7 @@ class SessionVolumeEngine:
                 try:
                     # Get full day data (96 candles for 24 hours of 15m data)
                     since_timestamp = int(day_start_hist.timestamp() * 1000)
-                    hist_ohlcv = await ex.fetch_ohlcv(symbol, timeframe, limit=100, since=since_timestamp)
+                    hist_ohlcv = await store.fetch_ohlcv(exchange, symbol, timeframe, limit=100, since=since_timestamp)
                     
                     day_volume = 0.0
                     day_end_timestamp = int(day_end_hist.timestamp() * 1000)
@@ -170,11 +170,6 @@ class TechnicalAnalysisService:
             if exchange is None:
                 exchange = 'binance'
             
-            if exchange not in self.exchange_manager.exchanges:
-                raise ValueError(f"Exchange {exchange} not configured")
-            
-            ex = self.exchange_manager.exchanges[exchange]
-            
             # Use timeframe-appropriate periods for VWAP calculation
             # This matches trading app behavior better than fixed 100 candles
             # Optimized VWAP periods for trading effectiveness
@@ -196,8 +191,10 @@ class TechnicalAnalysisService:
             # Get appropriate period for this timeframe, fallback to 50 if not specified
             vwap_limit = vwap_periods.get(timeframe, 50)
             
-            # Fetch OHLCV data with timeframe-appropriate period
-            ohlcv = await ex.fetch_ohlcv(symbol, timeframe, limit=vwap_limit)
+            # Fetch OHLCV data with timeframe-appropriate period (shared candle store)
+            ohlcv = await self.exchange_manager.candle_store.fetch_ohlcv(
+                exchange, symbol, timeframe, limit=vwap_limit
+            )
             
             if len(ohlcv) < 20:  # Need minimum data for calculations
                 return TechnicalIndicators(symbol=symbol, timeframe=timeframe)
@@ -0,0 +1,99 @@
+"""
+Exchange-wide Ticker Snapshot Cache for the OI providers
+One in-memory copy of each all-instrument listing (tickers, open interest,
+funding) per exchange and endpoint, refreshed on a short TTL and shared across
+symbols and requests so providers resolve markets without refetching listings
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from dataclasses import dataclass
+from loguru import logger
+
+try:
+    from .rate_limiter import INTERACTIVE, priority
+except ImportError:
+    from rate_limiter import INTERACTIVE, priority
+
+# Listing rows keyed by exchange symbol / contract / instId
+Listing = Dict[str, Dict]
+
+@dataclass
+class ListingSnapshot:
+    rows: Listing
+    fetched_at: float
+
+class TickerSnapshotCache:
+    """
+    Listings keyed by (exchange, endpoint name)
+
+    A snapshot younger than `ttl` is served as-is. An older one is refetched;
+    concurrent callers share the single in-flight fetch. If the refetch fails
+    the previous snapshot is served until it is `max_stale` seconds old, after
+    which the error propagates.
+    """
+
+    def __init__(self, ttl: float = 10.0, max_stale: float = 60.0):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.snapshots: Dict[Tuple[str, str], ListingSnapshot] = {}
+        self.inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self.stats = {'hits': 0, 'fetches': 0, 'errors': 0, 'stale': 0}
+
+    async def get(self, exchange: str, name: str, fetch: Callable[[], Awaitable[Listing]],
+                  ttl: Optional[float] = None) -> Listing:
+        """Listing `name` of `exchange`, calling `fetch` when the snapshot is missing or expired"""
+        key = (exchange, name)
+        snapshot = self.snapshots.get(key)
+        if snapshot is not None and time.monotonic() - snapshot.fetched_at < (self.ttl if ttl is None else ttl):
+            self.stats['hits'] += 1
+            return snapshot.rows
+
+        task = self.inflight.get(key)
+        if task is None:
+            # Shared by every caller, so never queued at a background caller's priority
+            with priority(INTERACTIVE):
+                task = asyncio.ensure_future(self._refresh(key, fetch))
+            self.inflight[key] = task
+
+        try:
+            # Shielded so one cancelled caller does not abort the shared fetch
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if snapshot is not None and time.monotonic() - snapshot.fetched_at < self.max_stale:
+                self.stats['stale'] += 1
+                logger.warning(f"{exchange} {name} snapshot refresh failed, serving stale copy: {e}")
+                return snapshot.rows
+            raise
+
+    async def _refresh(self, key: Tuple[str, str], fetch: Callable[[], Awaitable[Listing]]) -> Listing:
+        try:
+            self.stats['fetches'] += 1
+            rows = await fetch()
+            self.snapshots[key] = ListingSnapshot(rows=rows, fetched_at=time.monotonic())
+            return rows
+        except Exception:
+            self.stats['errors'] += 1
+            raise
+        finally:
+            self.inflight.pop(key, None)
+
+    def age(self, exchange: str, name: str) -> Optional[float]:
+        """Seconds since the snapshot was fetched (None if never fetched)"""
+        snapshot = self.snapshots.get((exchange, name))
+        return None if snapshot is None else time.monotonic() - snapshot.fetched_at
+
+    def clear(self):
+        self.snapshots.clear()
+
+_cache: Optional[TickerSnapshotCache] = None
+
+def get_ticker_snapshots() -> TickerSnapshotCache:
+    """Get the process-wide snapshot cache, creating it lazily"""
+    global _cache
+    if _cache is None:
+        _cache = TickerSnapshotCache()
+    return _cache
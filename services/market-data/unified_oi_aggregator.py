@@ -73,14 +73,62 @@ class UnifiedOIAggregator:
             return_exceptions=True
         )
         
-        # Process results
+        successful_exchanges, failed_exchanges = self._split_exchange_results(
+            base_symbol,
+            dict(zip(exchange_tasks.keys(), exchange_results))
+        )
+        
+        # Build unified response
+        return self._build_unified_response(
+            base_symbol, 
+            successful_exchanges, 
+            failed_exchanges
+        )
+    
+    async def get_unified_oi_data_bulk(self, base_symbols: List[str]) -> Dict[str, UnifiedOIResponse]:
+        """
+        Get unified OI data for many base symbols
+        
+        Each provider resolves the whole symbol list in one get_oi_data_bulk
+        call, so exchanges with all-instrument listings are hit once per
+        listing rather than once per symbol.
+        """
+        logger.info(f"🎯 Starting bulk unified OI aggregation for {len(base_symbols)} symbols")
+        
+        exchanges = list(self.providers.keys())
+        bulk_results = await asyncio.gather(
+            *(self.providers[exchange].get_oi_data_bulk(base_symbols) for exchange in exchanges),
+            return_exceptions=True
+        )
+        
+        responses = {}
+        for base_symbol in base_symbols:
+            per_exchange = {}
+            for exchange, results in zip(exchanges, bulk_results):
+                # A failed bulk call fails that exchange for every symbol
+                per_exchange[exchange] = results if isinstance(results, Exception) else results.get(base_symbol)
+            
+            successful_exchanges, failed_exchanges = self._split_exchange_results(base_symbol, per_exchange)
+            responses[base_symbol] = self._build_unified_response(
+                base_symbol,
+                successful_exchanges,
+                failed_exchanges
+            )
+        
+        return responses
+    
+    def _split_exchange_results(self, base_symbol: str, exchange_results: Dict[str, Any]):
+        """Split per-exchange results into successful and failed (with reason)"""
         successful_exchanges = {}
         failed_exchanges = {}
         
-        for i, (exchange, result) in enumerate(zip(exchange_tasks.keys(), exchange_results)):
+        for exchange, result in exchange_results.items():
             if isinstance(result, Exception):
                 failed_exchanges[exchange] = str(result)
                 logger.error(f"❌ {exchange.title()} failed: {result}")
+            elif result is None:
+                failed_exchanges[exchange] = "No data"
+                logger.warning(f"⚠️ {exchange.title()}: No data for {base_symbol}")
             elif result.validation_passed:
                 successful_exchanges[exchange] = result
                 logger.info(f"✅ {exchange.title()}: {result.total_oi_tokens:,.0f} {base_symbol} (${result.total_oi_usd/1e9:.1f}B)")
@@ -88,12 +136,7 @@ class UnifiedOIAggregator:
                 failed_exchanges[exchange] = f"Validation failed: {result.validation_errors}"
                 logger.warning(f"⚠️ {exchange.title()}: Validation failed")
         
-        # Build unified response
-        return self._build_unified_response(
-            base_symbol, 
-            successful_exchanges, 
-            failed_exchanges
-        )
+        return successful_exchanges, failed_exchanges
     
     def _build_unified_response(self, base_symbol: str, successful_exchanges: Dict, failed_exchanges: Dict) -> UnifiedOIResponse:
         """Build unified response matching target specification"""
@@ -73,13 +73,10 @@ class VolumeAnalysisEngine:
             if exchange is None:
                 exchange = 'binance'
             
-            if exchange not in self.exchange_manager.exchanges:
-                raise ValueError(f"Exchange {exchange} not configured")
-            
-            ex = self.exchange_manager.exchanges[exchange]
-            
-            # Fetch OHLCV data
-            ohlcv = await ex.fetch_ohlcv(symbol, timeframe, limit=lookback_periods + 1)
+            # Fetch OHLCV data from the shared candle store
+            ohlcv = await self.exchange_manager.candle_store.fetch_ohlcv(
+                exchange, symbol, timeframe, limit=lookback_periods + 1
+            )
             
             if len(ohlcv) < 20:  # Need minimum data
                 return self._create_empty_spike(symbol, timeframe)
@@ -216,13 +213,10 @@ class VolumeAnalysisEngine:
             if exchange is None:
                 exchange = 'binance'
             
-            if exchange not in self.exchange_manager.exchanges:
-                raise ValueError(f"Exchange {exchange} not configured")
-            
-            ex = self.exchange_manager.exchanges[exchange]
-            
-            # Fetch OHLCV data
-            ohlcv = await ex.fetch_ohlcv(symbol, timeframe, limit=periods)
+            # Fetch OHLCV data from the shared candle store
+            ohlcv = await self.exchange_manager.candle_store.fetch_ohlcv(
+                exchange, symbol, timeframe, limit=periods
+            )
             
             if len(ohlcv) < 10:
                 return self._create_empty_cvd(symbol, timeframe)
@@ -351,6 +345,130 @@ class VolumeAnalysisEngine:
         # Sort by spike percentage
         return sorted(spikes, key=lambda x: x.spike_percentage, reverse=True)
     
+    async def scan_futures_volume_spikes(self, timeframe: str = '15m', min_spike_percentage: float = 200,
+                                         lookback_periods: int = 96, max_symbols: int = None,
+                                         concurrency: int = 16, exchange: str = 'binance_futures') -> List[VolumeSpike]:
+        """
+        Scan every active USDT perpetual for volume spikes
+        
+        One fetch_tickers call ranks the universe by 24h quote volume, klines
+        for the shortlist are fetched with bounded concurrency through the
+        shared candle store, and spike statistics are computed for all
+        symbols in one vectorized pass.
+        
+        Args:
+            max_symbols: Only scan the N most traded perps (None = all active)
+            concurrency: Maximum parallel kline requests
+        """
+        if exchange not in self.exchange_manager.exchanges:
+            raise ValueError(f"Exchange {exchange} not configured")
+        
+        ex = self.exchange_manager.exchanges[exchange]
+        markets = await ex.load_markets()
+        tickers = await ex.fetch_tickers()
+        
+        candidates = []
+        for symbol, ticker in tickers.items():
+            market = markets.get(symbol)
+            if not market or not market.get('swap') or not market.get('linear'):
+                continue
+            if market.get('quote') != 'USDT' or market.get('active') is False:
+                continue
+            candidates.append((symbol, ticker.get('quoteVolume') or 0))
+        
+        candidates.sort(key=lambda item: item[1], reverse=True)
+        if max_symbols:
+            candidates = candidates[:max_symbols]
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        store = self.exchange_manager.candle_store
+        
+        async def fetch(symbol: str):
+            async with semaphore:
+                return await store.fetch_ohlcv(exchange, symbol, timeframe, limit=lookback_periods + 1)
+        
+        symbols = [symbol for symbol, _ in candidates]
+        results = await asyncio.gather(*(fetch(symbol) for symbol in symbols), return_exceptions=True)
+        
+        # Stack full-length histories into one (symbols x periods) matrix
+        window = lookback_periods + 1
+        full_symbols, volume_rows, price_rows = [], [], []
+        for symbol, ohlcv in zip(symbols, results):
+            if isinstance(ohlcv, Exception):
+                logger.warning(f"Error scanning {symbol}: {ohlcv}")
+                continue
+            if len(ohlcv) < window:
+                continue  # Fresh listings without a full baseline are skipped
+            tail = ohlcv[-window:]
+            full_symbols.append(symbol)
+            volume_rows.append([candle[5] for candle in tail])
+            price_rows.append(tail[-1][4])
+        
+        if not full_symbols:
+            return []
+        
+        volumes = np.array(volume_rows, dtype=np.float64)
+        stats = self._analyze_volume_matrix(volumes, timeframe)
+        current_volumes = volumes[:, -1]
+        volume_usd = current_volumes * np.array(price_rows, dtype=np.float64)
+        
+        spikes = []
+        now = datetime.now()
+        for i in np.flatnonzero(stats['spike_percentage'] >= min_spike_percentage):
+            spike_percentage = float(stats['spike_percentage'][i])
+            spike_level, is_significant = self._classify_spike(spike_percentage)
+            spikes.append(VolumeSpike(
+                symbol=full_symbols[i],
+                timeframe=timeframe,
+                current_volume=float(current_volumes[i]),
+                average_volume=float(stats['average_volume'][i]),
+                spike_percentage=spike_percentage,
+                spike_level=spike_level,
+                timestamp=now,
+                volume_usd=float(volume_usd[i]),
+                is_significant=bool(is_significant)
+            ))
+        
+        logger.info(f"Volume scan: {len(full_symbols)}/{len(candidates)} perps analyzed, {len(spikes)} spikes")
+        
+        # Sort by spike percentage
+        return sorted(spikes, key=lambda x: x.spike_percentage, reverse=True)
+    
+    def _analyze_volume_matrix(self, volumes: np.ndarray, timeframe: str) -> Dict[str, np.ndarray]:
+        """
+        Vectorized _analyze_volume_pattern over a (symbols x periods) volume matrix
+        
+        Same trimmed-median baseline and time-of-day adjustment, one NumPy pass.
+        """
+        current_volume = volumes[:, -1]
+        historical = np.sort(volumes[:, :-1], axis=1)
+        
+        # Remove outliers for cleaner baseline (top 5% and bottom 5%)
+        trim_count = max(1, historical.shape[1] // 20)
+        trimmed = historical[:, trim_count:-trim_count]
+        if trimmed.shape[1] == 0:
+            trimmed = historical
+        
+        average_volume = trimmed.mean(axis=1)
+        median_volume = np.median(trimmed, axis=1)
+        
+        # Median baseline adjusted for known session patterns
+        baseline_volume = self._adjust_for_time_patterns(1.0, timeframe) * median_volume
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spike_percentage = np.where(
+                baseline_volume > 0,
+                (current_volume - baseline_volume) / baseline_volume * 100,
+                0.0
+            )
+        
+        return {
+            'spike_percentage': np.round(spike_percentage, 2),
+            'average_volume': np.round(average_volume, 2),
+            'baseline_volume': np.round(baseline_volume, 2),
+            'median_volume': np.round(median_volume, 2)
+        }
+    
     def _create_empty_spike(self, symbol: str, timeframe: str) -> VolumeSpike:
         """Create empty volume spike for error cases"""
         return VolumeSpike(
@@ -384,4 +502,5 @@ class VolumeAnalysisEngine:
 # volume_engine = VolumeAnalysisEngine(exchange_manager)
 # spike = await volume_engine.detect_volume_spike("BTC/USDT", "15m")
 # cvd = await volume_engine.calculate_cvd("BTC/USDT", "1h")
-# all_spikes = await volume_engine.scan_volume_spikes("15m", 200)
\ No newline at end of file
+# all_spikes = await volume_engine.scan_volume_spikes("15m", 200)
+# perp_spikes = await volume_engine.scan_futures_volume_spikes("15m", 200, max_symbols=250)
\ No newline at end of file
@@ -19,6 +19,9 @@ import time
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from shared.models.compact_oi_data import OIDataManager, OISnapshot
+from shared.intelligence.oi_stream_collector import OIStreamCollector
+from shared.intelligence.oi_poll_scheduler import OIPollScheduler
+from shared.intelligence.dynamic_thresholds import DynamicThresholdEngine
 from shared.config.alert_thresholds import OI_EXPLOSION_THRESHOLDS, EXCHANGE_CONFIG
 
 
@@ -33,10 +36,12 @@ class OIExplosionDetector:
         # Configuration
         self.market_data_url = os.getenv("MARKET_DATA_URL", "http://localhost:8001")
         self.monitoring_interval = EXCHANGE_CONFIG["oi_monitoring_interval"]  # 5 minutes
+        self.detection_interval = EXCHANGE_CONFIG["oi_detection_interval"]
         self.api_timeout = EXCHANGE_CONFIG["api_timeout_seconds"]
         
-        # Data manager
-        self.oi_manager = OIDataManager(target_memory_mb=40)
+        # Data manager (sized for streamed sub-minute samples)
+        self.oi_manager = OIDataManager(target_memory_mb=40,
+                                        resolution_seconds=EXCHANGE_CONFIG["oi_stream_emit_interval"])
         
         # State
         self.running = False
@@ -47,6 +52,27 @@ class OIExplosionDetector:
         # Monitored symbols (focus on major pairs)
         self.monitored_symbols = ["BTC", "ETH", "SOL", "ADA", "DOT", "AVAX", "MATIC", "ATOM"]
         
+        # Per-symbol REST poll intervals from OI velocity and liquidity tier
+        # (no liquidation feed runs in this service)
+        self.threshold_engine = DynamicThresholdEngine(market_data_url=self.market_data_url)
+        self.poll_scheduler = OIPollScheduler(
+            self.monitored_symbols,
+            min_interval=EXCHANGE_CONFIG["oi_min_poll_interval"],
+            max_interval=EXCHANGE_CONFIG["oi_max_poll_interval"],
+            baseline_interval=self.monitoring_interval,
+            budget_multiplier=EXCHANGE_CONFIG["oi_poll_budget_multiplier"]
+        )
+        
+        # Push feeds (Bybit/OKX) plus scheduled bulk REST polling for the rest
+        self.collector = OIStreamCollector(
+            self.monitored_symbols,
+            sink=self.on_oi_sample,
+            poll=self.poll_oi_data,
+            emit_interval=EXCHANGE_CONFIG["oi_stream_emit_interval"],
+            streaming=EXCHANGE_CONFIG["oi_streaming_enabled"],
+            scheduler=self.poll_scheduler
+        )
+        
         # Setup logging
         logging.basicConfig(
             level=logging.INFO,
@@ -63,15 +89,19 @@ class OIExplosionDetector:
         self.running = True
         
         # Initialize HTTP session
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.api_timeout))
+        # Background priority: the market data service serves bot commands first
+        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.api_timeout),
+                                             headers={"X-Request-Priority": "background"})
+        await self.refresh_poll_tiers()
         
         try:
             # Start concurrent tasks
+            collector_task = asyncio.create_task(self.collector.run())
             monitor_task = asyncio.create_task(self.monitor_oi_changes())
             cleanup_task = asyncio.create_task(self.periodic_cleanup())
             
             # Wait for tasks
-            await asyncio.gather(monitor_task, cleanup_task)
+            await asyncio.gather(collector_task, monitor_task, cleanup_task)
             
         except KeyboardInterrupt:
             self.logger.info("Shutdown requested")
@@ -84,20 +114,18 @@ class OIExplosionDetector:
         """Stop the OI explosion detector"""
         self.logger.info("Stopping OI explosion detector...")
         self.running = False
+        await self.collector.stop()
+        await self.threshold_engine.close()
         
         if self.session:
             await self.session.close()
     
     async def monitor_oi_changes(self) -> None:
-        """Main monitoring loop"""
+        """Main detection loop (OI samples arrive through the collector)"""
         while self.running:
             try:
                 start_time = time.time()
                 
-                # Collect OI data for all monitored symbols
-                for symbol in self.monitored_symbols:
-                    await self.collect_symbol_oi(symbol)
-                
                 # Detect explosions
                 explosions = self.oi_manager.detect_explosions()
                 
@@ -107,52 +135,68 @@ class OIExplosionDetector:
                 
                 # Log performance
                 elapsed = time.time() - start_time
-                self.logger.info(f"OI monitoring cycle completed in {elapsed:.2f}s, {len(explosions)} explosions detected")
+                self.logger.debug(f"OI detection completed in {elapsed:.3f}s, {len(explosions)} explosions detected")
                 
                 # Wait for next cycle
-                await asyncio.sleep(self.monitoring_interval)
+                await asyncio.sleep(self.detection_interval)
                 
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
                 await asyncio.sleep(60)  # Wait before retry
     
-    async def collect_symbol_oi(self, symbol: str) -> None:
-        """Collect OI data for a specific symbol"""
+    async def refresh_poll_tiers(self) -> None:
+        """Give the poll scheduler each symbol's current liquidity tier"""
         try:
-            # Get OI data from existing market-data service
-            oi_data = await self.fetch_oi_data(symbol)
-            
-            if oi_data:
-                # Convert to OI snapshots
-                current_timestamp = int(datetime.now().timestamp())
-                
-                for exchange, oi_info in oi_data.items():
-                    if isinstance(oi_info, dict) and "oi_usd" in oi_info:
-                        snapshot = OISnapshot(
-                            timestamp=current_timestamp,
-                            exchange=exchange,
-                            symbol=symbol,
-                            oi_usd=float(oi_info["oi_usd"]),
-                            oi_change_24h=float(oi_info.get("oi_change_24h", 0))
-                        )
-                        
-                        self.oi_manager.add_oi_snapshot(snapshot)
-            
+            profiles = await self.threshold_engine.get_asset_profiles(
+                [f"{symbol}-USDT" for symbol in self.monitored_symbols]
+            )
+            for symbol in self.monitored_symbols:
+                profile = profiles.get(f"{symbol}-USDT")
+                if profile is not None:
+                    self.poll_scheduler.set_tier(symbol, profile.liquidity_tier)
         except Exception as e:
-            self.logger.error(f"Error collecting OI for {symbol}: {e}")
+            self.logger.warning(f"Could not refresh liquidity tiers, keeping previous poll intervals: {e}")
+    
+    async def on_oi_sample(self, symbol: str, exchange: str, oi_usd: float, timestamp: int) -> None:
+        """Store one exchange-wide OI sample from the collector"""
+        self.oi_manager.add_oi_snapshot(OISnapshot(
+            timestamp=timestamp,
+            exchange=exchange,
+            symbol=symbol,
+            oi_usd=oi_usd,
+            oi_change_24h=0.0
+        ))
+    
+    async def poll_oi_data(self, symbols: List[str]) -> Optional[Dict[str, Dict]]:
+        """
+        OI for all symbols in one bulk request, falling back to concurrent
+        per-symbol requests (None if everything failed)
+        """
+        bulk_data = await self.fetch_bulk_oi_data(symbols)
+        if bulk_data is not None:
+            return bulk_data
+        
+        results = await asyncio.gather(*(self.fetch_oi_data(symbol) for symbol in symbols))
+        data = {symbol: oi_data for symbol, oi_data in zip(symbols, results) if oi_data}
+        return data or None
+    
+    @staticmethod
+    def _exchange_oi(response: Dict) -> Dict[str, Dict]:
+        """Per-exchange OI from a /multi_oi response, keyed by exchange"""
+        return {entry["exchange"]: entry for entry in response.get("exchange_breakdown", [])}
     
     async def fetch_oi_data(self, symbol: str) -> Optional[Dict]:
         """Fetch OI data from existing market-data service"""
         try:
             # Use existing /multi_oi endpoint (read-only)
             url = f"{self.market_data_url}/multi_oi"
-            payload = {"symbol": f"{symbol}-USDT"}
+            payload = {"base_symbol": symbol}
             
             async with self.session.post(url, json=payload) as response:
                 if response.status == 200:
                     data = await response.json()
                     if "success" in data and data["success"]:
-                        return data.get("data", {})
+                        return self._exchange_oi(data)
                 else:
                     self.logger.warning(f"API request failed for {symbol}: {response.status}")
                     
@@ -163,6 +207,31 @@ class OIExplosionDetector:
         
         return None
     
+    async def fetch_bulk_oi_data(self, symbols: List[str]) -> Optional[Dict[str, Dict]]:
+        """Fetch OI data for many symbols with one /multi_oi_bulk request (None on failure)"""
+        try:
+            url = f"{self.market_data_url}/multi_oi_bulk"
+            payload = {"base_symbols": symbols}
+            
+            async with self.session.post(url, json=payload) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if data.get("success"):
+                        return {
+                            symbol: self._exchange_oi(result)
+                            for symbol, result in data.get("data", {}).items()
+                            if result.get("success")
+                        }
+                else:
+                    self.logger.warning(f"Bulk OI request failed: {response.status}")
+                    
+        except asyncio.TimeoutError:
+            self.logger.warning("Timeout fetching bulk OI data")
+        except Exception as e:
+            self.logger.error(f"Error fetching bulk OI data: {e}")
+        
+        return None
+    
     async def process_explosion(self, explosion: Dict) -> None:
         """Process detected OI explosion"""
         symbol = explosion["symbol"]
@@ -253,6 +322,7 @@ class OIExplosionDetector:
                 
                 # Clean old data
                 self.oi_manager.cleanup_memory()
+                await self.refresh_poll_tiers()
                 
                 # Clean old alerts from deduplication
                 current_time = datetime.now()
@@ -279,7 +349,8 @@ class OIExplosionDetector:
             "memory_usage_mb": memory_stats["total_mb"],
             "symbols_tracked": memory_stats["symbols_count"],
             "last_alerts_count": len(self.last_alerts),
-            "api_url": self.market_data_url
+            "api_url": self.market_data_url,
+            "collector": self.collector.get_status()
         }
     
     async def test_connection(self) -> bool:
@@ -4,16 +4,16 @@ Real-time liquidation tracking integrated into the main bot
 """
 
 import asyncio
-import json
 import websockets
 import logging
 from typing import Optional, Dict, List
 from datetime import datetime, timedelta
 import os
 from dataclasses import dataclass
-import numpy as np  # Added for advanced cascade prediction
 from collections import deque
-from shared.intelligence.dynamic_thresholds import DynamicThresholdEngine, ThresholdResult
+from shared.intelligence.dynamic_thresholds import DynamicThresholdEngine, ThresholdResult, ThresholdSnapshotStore
+from shared.intelligence.message_decoder import get_decoder
+from shared.models.liquidation_window import LiquidationWindow, SymbolLiquidationWindows
 from formatting_utils import format_dollar_amount, format_large_number
 
 
@@ -61,7 +61,13 @@ class LiquidationTracker:
         self.recent_liquidations: deque = deque(maxlen=100)  # Performance optimization
         self.threshold_engine = DynamicThresholdEngine(market_data_url=market_data_url)
         self.threshold_cache: Dict[str, ThresholdResult] = {}
+        self.snapshot_store = ThresholdSnapshotStore(self.threshold_engine, 'liquidation')
+        self._threshold_refreshes: Dict[str, asyncio.Task] = {}
         self.cascade_window = 30  # 30 seconds for immediate cascade, 60s for prediction
+        self.prediction_window = 60
+        # Per-symbol rolling aggregates, updated on insert so cascade checks never rescan history
+        # (cascade checks read the prediction window only, so only that one is maintained)
+        self.symbol_windows = SymbolLiquidationWindows((self.prediction_window,))
         
         # DATA-DRIVEN INSTITUTIONAL THRESHOLDS - Based on 0.05% of Open Interest Analysis
         # Analysis: BTC $10.6B OI, ETH $11.0B OI, SOL $2.5B OI (Aug 2025)
@@ -83,15 +89,34 @@ class LiquidationTracker:
         self.cascade_predictions = 0
         self.start_time = datetime.now()
     
+    async def warm_start(self, symbols: List[str] = None):
+        """Restore thresholds from the on-disk snapshot, then refresh them in one bulk request"""
+        self.snapshot_store.load()
+        self.threshold_cache.update(self.threshold_engine.computed['liquidation'])
+        
+        symbols = symbols or list(self.threshold_cache) or ['BTCUSDT', 'ETHUSDT', 'SOLUSDT']
+        loaded = await self.threshold_engine.fetch_remote_thresholds(symbols, ['liquidation'])
+        self.threshold_cache.update(self.threshold_engine.computed['liquidation'])
+        logging.info(f"Liquidation thresholds warm: {len(self.threshold_cache)} cached, {loaded} refreshed in bulk")
+        
+        self.snapshot_store.start()
+    
     async def _get_threshold(self, symbol: str) -> ThresholdResult:
         """Get threshold with caching"""
         # Check cache first
         if symbol in self.threshold_cache:
             cached = self.threshold_cache[symbol]
-            if datetime.now() < cached.next_review_time:
-                return cached
+            if datetime.now() >= cached.next_review_time and symbol not in self._threshold_refreshes:
+                # Serve the last known value while recalculating in the background
+                task = asyncio.create_task(self._refresh_threshold(symbol))
+                self._threshold_refreshes[symbol] = task
+                task.add_done_callback(lambda _: self._threshold_refreshes.pop(symbol, None))
+            return cached
         
         # Calculate new threshold
+        return await self._refresh_threshold(symbol)
+    
+    async def _refresh_threshold(self, symbol: str) -> ThresholdResult:
         threshold_result = await self.threshold_engine.calculate_liquidation_threshold(symbol)
         self.threshold_cache[symbol] = threshold_result
         return threshold_result
@@ -102,6 +127,11 @@ class LiquidationTracker:
         
         # Add to deque (automatically maintains size limit)
         self.recent_liquidations.append(liquidation)
+        self.symbol_windows.add(liquidation.symbol, int(liquidation.timestamp.timestamp() * 1000),
+                                liquidation.side == 'LONG', liquidation.price,
+                                liquidation.quantity, liquidation.value_usd)
+        if len(self.symbol_windows) > 200:
+            self.symbol_windows.prune()
         
         # Check for single large liquidation alert with cooldown
         if await self._should_alert_single(liquidation):
@@ -112,7 +142,7 @@ class LiquidationTracker:
                 return liquidation.format_alert()
         
         # Check for cascade with enhanced prediction
-        cascade_alert = await self._check_cascade()
+        cascade_alert = await self._check_cascade(liquidation.symbol)
         if cascade_alert:
             alert_key = f"{liquidation.symbol}_cascade"
             if self._check_alert_cooldown(alert_key):
@@ -152,113 +182,91 @@ class LiquidationTracker:
             # Fallback to institutional thresholds (minimum $100K for all assets)
             return liquidation.value_usd >= min_institutional_threshold
     
-    async def _check_cascade(self) -> Optional[str]:
+    async def _check_cascade(self, symbol: str) -> Optional[str]:
         """Enhanced cascade detection with 6-factor analysis (consolidated from enhanced system)"""
-        if len(self.recent_liquidations) < 3:  # Minimum cascades needed
+        # Rolling 60s aggregates for the symbol that just liquidated (extended for better prediction)
+        window = self.symbol_windows.get(symbol, self.prediction_window)
+        if window is None or window.count < 3:  # Minimum for any cascade
             return None
         
-        # Get liquidations from last 60 seconds (extended for better prediction)
-        now = datetime.now()
-        recent = [liq for liq in self.recent_liquidations 
-                 if (now - liq.timestamp).total_seconds() <= 60]  # Extended window
+        total_value = window.total_usd
         
-        if len(recent) >= 3:  # Minimum for any cascade
-            # Group by symbol
-            symbol_groups = {}
-            for liq in recent:
-                symbol_groups.setdefault(liq.symbol, []).append(liq)
+        # Get dynamic cascade threshold
+        try:
+            threshold_result = await self._get_threshold(symbol)
+            cascade_min_count = threshold_result.cascade_count_threshold
+            cascade_min_value = threshold_result.cascade_threshold_usd
+        except Exception as e:
+            logging.error(f"Error getting cascade thresholds for {symbol}: {e}")
+            cascade_min_count = 5  # Fallback
+            cascade_min_value = 500000  # Fallback
+        
+        # Enhanced 6-factor cascade analysis (consolidated from enhanced_liquidation_monitor.py)
+        if window.count >= cascade_min_count and total_value >= cascade_min_value:
+            # Calculate advanced risk factors
+            risk_analysis = await self._analyze_cascade_risk_factors(window, threshold_result)
             
-            # Find largest group and analyze it
-            largest_group = max(symbol_groups.values(), key=len)
-            symbol = largest_group[0].symbol
-            total_value = sum(liq.value_usd for liq in largest_group)
+            # Enhanced institutional intelligence
+            symbol_clean = symbol.replace('USDT', '').replace('USDC', '')
+            avg_size = window.avg_value_usd
+            max_single = window.max_value_usd
+            long_bias_pct = (window.long_count / window.count) * 100
             
-            # Get dynamic cascade threshold
-            try:
-                threshold_result = await self._get_threshold(symbol)
-                cascade_min_count = threshold_result.cascade_count_threshold
-                cascade_min_value = threshold_result.cascade_threshold_usd
-            except Exception as e:
-                logging.error(f"Error getting cascade thresholds for {symbol}: {e}")
-                cascade_min_count = 5  # Fallback
-                cascade_min_value = 500000  # Fallback
+            # Classify cascade severity with risk scoring
+            if risk_analysis['composite_risk'] > 1.5:
+                severity = "🔴 EXTREME CASCADE RISK"
+            elif risk_analysis['composite_risk'] > 1.0:
+                severity = "🟠 HIGH CASCADE RISK"
+            elif total_value >= 10_000_000:  # $10M+
+                severity = "🚨 TIER-1 INSTITUTIONAL"
+            elif total_value >= 5_000_000:  # $5M+
+                severity = "⚡ TIER-2 MAJOR"
+            else:
+                severity = "📊 TIER-3 SIGNIFICANT"
             
-            # Enhanced 6-factor cascade analysis (consolidated from enhanced_liquidation_monitor.py)
-            if len(largest_group) >= cascade_min_count and total_value >= cascade_min_value:
-                # Calculate advanced risk factors
-                risk_analysis = await self._analyze_cascade_risk_factors(largest_group, threshold_result)
-                
-                long_count = sum(1 for liq in largest_group if liq.side == 'LONG')
-                short_count = len(largest_group) - long_count
-                
-                # Enhanced institutional intelligence
-                symbol_clean = symbol.replace('USDT', '').replace('USDC', '')
-                avg_size = total_value / len(largest_group)
-                max_single = max(liq.value_usd for liq in largest_group)
-                long_bias_pct = (long_count / len(largest_group)) * 100
-                
-                # Classify cascade severity with risk scoring
-                if risk_analysis['composite_risk'] > 1.5:
-                    severity = "🔴 EXTREME CASCADE RISK"
-                elif risk_analysis['composite_risk'] > 1.0:
-                    severity = "🟠 HIGH CASCADE RISK"
-                elif total_value >= 10_000_000:  # $10M+
-                    severity = "🚨 TIER-1 INSTITUTIONAL"
-                elif total_value >= 5_000_000:  # $5M+
-                    severity = "⚡ TIER-2 MAJOR"
-                else:
-                    severity = "📊 TIER-3 SIGNIFICANT"
-                
-                # Advanced cascade risk prediction
-                cascade_risk = risk_analysis['risk_level']
-                
-                # Calculate total coin amount
-                total_coins = sum(liq.quantity for liq in largest_group)
-                
-                return (f"{severity} - {symbol_clean}\n"
-                       f"⚡ **{len(largest_group)} liquidations** in 60s\n"
-                       f"💰 **{format_dollar_amount(total_value, 1)}** ({total_coins:.1f} {symbol_clean})\n"
-                       f"📊 **Avg**: {format_dollar_amount(avg_size, 1)} | **Max**: {format_dollar_amount(max_single, 1)}\n"
-                       f"⚖️ **{long_bias_pct:.0f}% LONG** vs {100-long_bias_pct:.0f}% SHORT\n"
-                       f"🎯 **Risk Score**: {risk_analysis['composite_risk']:.2f}/2.0 ({cascade_risk})\n"
-                       f"🔮 **Prediction**: {'Cascade imminent (30-90s)' if risk_analysis['composite_risk'] > 1.2 else 'Next 2-5min critical'}\n"
-                       f"🏦 {'Institutional deleveraging detected' if avg_size > 200_000 else 'Market stress detected'}")
+            # Advanced cascade risk prediction
+            cascade_risk = risk_analysis['risk_level']
+            
+            # Total coin amount
+            total_coins = window.total_quantity
+            
+            return (f"{severity} - {symbol_clean}\n"
+                   f"⚡ **{window.count} liquidations** in 60s\n"
+                   f"💰 **{format_dollar_amount(total_value, 1)}** ({total_coins:.1f} {symbol_clean})\n"
+                   f"📊 **Avg**: {format_dollar_amount(avg_size, 1)} | **Max**: {format_dollar_amount(max_single, 1)}\n"
+                   f"⚖️ **{long_bias_pct:.0f}% LONG** vs {100-long_bias_pct:.0f}% SHORT\n"
+                   f"🎯 **Risk Score**: {risk_analysis['composite_risk']:.2f}/2.0 ({cascade_risk})\n"
+                   f"🔮 **Prediction**: {'Cascade imminent (30-90s)' if risk_analysis['composite_risk'] > 1.2 else 'Next 2-5min critical'}\n"
+                   f"🏦 {'Institutional deleveraging detected' if avg_size > 200_000 else 'Market stress detected'}")
         
         return None
     
-    async def _analyze_cascade_risk_factors(self, liquidations: List, threshold_result) -> Dict:
-        """6-factor cascade risk analysis (consolidated from enhanced system)"""
-        if not liquidations:
+    async def _analyze_cascade_risk_factors(self, window: LiquidationWindow, threshold_result) -> Dict:
+        """6-factor cascade risk analysis from the window's maintained aggregates"""
+        if not window.count:
             return {'composite_risk': 0.0, 'risk_level': 'LOW'}
         
-        total_value = sum(liq.value_usd for liq in liquidations)
-        avg_price = sum(liq.price for liq in liquidations) / len(liquidations)
+        total_value = window.total_usd
         
         # Factor 1: Volume concentration
         volume_concentration = total_value / threshold_result.cascade_threshold_usd
         
         # Factor 2: Time compression (faster liquidations = higher risk)
-        timestamps = [liq.timestamp for liq in liquidations]
-        time_span = max(timestamps) - min(timestamps)
-        time_compression = 60.0 / max(1.0, time_span.total_seconds())  # Normalize to 60 seconds
+        time_compression = 60.0 / max(1.0, window.time_span_seconds)  # Normalize to 60 seconds
         
         # Factor 3: Price concentration (liquidations at similar prices)
-        prices = [liq.price for liq in liquidations]
-        if len(prices) > 1:
-            price_std = np.std(prices) / np.mean(prices) if np.mean(prices) > 0 else 0
+        if window.count > 1:
+            avg_price = window.avg_price
+            price_std = window.price_std / avg_price if avg_price > 0 else 0
             price_concentration = max(0, 1.0 - price_std * 10)  # Higher when prices are close
         else:
             price_concentration = 1.0
         
         # Factor 4: Side imbalance (all longs or all shorts = higher cascade risk)
-        sides = [liq.side for liq in liquidations]
-        long_count = sum(1 for side in sides if side == 'LONG')
-        short_count = len(sides) - long_count
-        side_imbalance = abs(long_count - short_count) / len(sides)
+        side_imbalance = abs(window.long_count - window.short_count) / window.count
         
         # Factor 5: Institutional ratio (more institutional = higher systemic risk)
-        institutional_count = sum(1 for liq in liquidations if liq.value_usd >= 500_000)
-        institutional_ratio = institutional_count / len(liquidations)
+        institutional_ratio = window.institutional_count / window.count
         
         # Factor 6: Market session context
         session_multiplier = self._get_session_risk_multiplier()
@@ -337,6 +345,7 @@ class LiquidationMonitor:
         self.websocket_url = "wss://fstream.binance.com/ws/!forceOrder@arr"
         self.running = False
         self.websocket = None
+        self.decoder = get_decoder()
         self.logger = logging.getLogger(__name__)
         
     async def start_monitoring(self):
@@ -346,6 +355,7 @@ class LiquidationMonitor:
         
         self.running = True
         self.logger.info("Starting liquidation monitoring...")
+        await self.tracker.warm_start()
         
         while self.running:
             try:
@@ -355,11 +365,12 @@ class LiquidationMonitor:
                 if self.running:
                     await asyncio.sleep(5)  # Wait before reconnecting
     
-    def stop_monitoring(self):
-        """Stop liquidation monitoring"""
+    async def stop_monitoring(self):
+        """Stop liquidation monitoring and write the final threshold snapshot"""
         self.running = False
         if self.websocket:
-            asyncio.create_task(self.websocket.close())
+            await self.websocket.close()
+        await self.tracker.snapshot_store.stop()
     
     async def _connect_and_monitor(self):
         """Connect to WebSocket and monitor liquidations"""
@@ -373,9 +384,9 @@ class LiquidationMonitor:
                         break
                     
                     try:
-                        data = json.loads(message)
-                        await self._process_liquidation(data)
-                    except json.JSONDecodeError:
+                        event = self.decoder.decode_force_order(message)
+                        await self._process_liquidation(event)
+                    except self.decoder.decode_errors:
                         continue
                     except Exception as e:
                         self.logger.error(f"Error processing liquidation: {e}")
@@ -386,19 +397,16 @@ class LiquidationMonitor:
             self.logger.error(f"WebSocket connection error: {e}")
             raise
     
-    async def _process_liquidation(self, data: dict):
-        """Process incoming liquidation data"""
+    async def _process_liquidation(self, event):
+        """Process a decoded forceOrder event"""
         try:
-            order = data.get('o', {})
-            if not order:
-                return
-            
             # Extract liquidation data
-            symbol = order.get('s', '')
-            side_str = order.get('S', '')  # SELL = long liquidation
-            price = float(order.get('ap', 0))
-            quantity = float(order.get('z', 0))
-            timestamp_ms = int(order.get('T', 0))
+            order = event.order
+            symbol = order.symbol
+            side_str = order.side  # SELL = long liquidation
+            price = order.avg_price
+            quantity = order.filled_quantity
+            timestamp_ms = order.trade_time
             
             # Calculate USD value
             value_usd = price * quantity
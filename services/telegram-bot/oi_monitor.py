@@ -10,9 +10,12 @@ from datetime import datetime, timedelta
 import aiohttp
 import os
 from dataclasses import dataclass
+from collections import deque
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-from shared.intelligence.dynamic_thresholds import DynamicThresholdEngine, OIThreshold
+from shared.intelligence.dynamic_thresholds import DynamicThresholdEngine, OIThreshold, ThresholdSnapshotStore
+from shared.intelligence.oi_stream_collector import OIStreamCollector
+from shared.intelligence.oi_poll_scheduler import OIPollScheduler
 from formatting_utils import format_dollar_amount, format_large_number
 
 
@@ -28,10 +31,13 @@ class OISnapshot:
 class OITracker:
     """Tracks OI changes and detects explosions with dynamic thresholds"""
     
+    MAX_WINDOW_MINUTES = 30  # Widest OI window DynamicThresholdEngine assigns (MICRO_CAP)
+    
     def __init__(self, market_data_url: str = "http://localhost:8001"):
-        self.snapshots: Dict[str, List[OISnapshot]] = {}  # symbol -> snapshots
+        self.snapshots: Dict[str, deque] = {}  # symbol -> time-ordered snapshots
         self.threshold_engine = DynamicThresholdEngine(market_data_url=market_data_url)
         self.threshold_cache: Dict[str, OIThreshold] = {}
+        self.snapshot_store = ThresholdSnapshotStore(self.threshold_engine, 'oi')
         
         # Fallback hardcoded thresholds (used if dynamic calculation fails)
         self.fallback_thresholds = {
@@ -42,6 +48,18 @@ class OITracker:
         }
         # Dynamic settings will be calculated per symbol
         self.min_exchanges = 2    # Minimum exchanges for confirmation
+        
+        # Samples arrive every few seconds, so one explosion would re-alert on each
+        self.alert_cooldown = timedelta(minutes=15)
+        self.last_alerts: Dict[str, datetime] = {}
+    
+    async def warm_start(self, symbols: List[str]):
+        """Restore thresholds from the on-disk snapshot, then refresh them in one bulk request"""
+        self.snapshot_store.load()
+        await self.threshold_engine.fetch_remote_thresholds(symbols, ['oi'])
+        self.threshold_cache.update(self.threshold_engine.computed['oi'])
+        logging.info(f"OI thresholds warm: {len(self.threshold_cache)} cached")
+        self.snapshot_store.start()
     
     async def _get_oi_threshold(self, symbol: str) -> OIThreshold:
         """Get OI threshold with caching"""
@@ -67,25 +85,30 @@ class OITracker:
                 maturity_adjustment=1.0
             )
     
+    def _max_window_minutes(self) -> int:
+        """Widest detection window a threshold refresh can switch a symbol to"""
+        return max([self.MAX_WINDOW_MINUTES] + [t.time_window_minutes for t in self.threshold_cache.values()])
+    
     async def add_snapshot(self, snapshot: OISnapshot) -> Optional[str]:
         """Add OI snapshot and check for explosions"""
         symbol_key = snapshot.symbol
         
         # Initialize if new symbol
         if symbol_key not in self.snapshots:
-            self.snapshots[symbol_key] = []
+            self.snapshots[symbol_key] = deque()
         
         # Add snapshot
-        self.snapshots[symbol_key].append(snapshot)
-        
-        # Keep only recent snapshots (last 24 hours)
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        self.snapshots[symbol_key] = [
-            s for s in self.snapshots[symbol_key] if s.timestamp > cutoff_time
-        ]
+        snapshots = self.snapshots[symbol_key]
+        snapshots.append(snapshot)
         
-        # Check for explosion
-        return await self._check_explosion(symbol_key)
+        # Check (also trims history to the detection window) for explosion
+        alert_message = await self._check_explosion(symbol_key)
+        if alert_message:
+            last_alert = self.last_alerts.get(symbol_key)
+            if last_alert is not None and snapshot.timestamp - last_alert < self.alert_cooldown:
+                return None
+            self.last_alerts[symbol_key] = snapshot.timestamp
+        return alert_message
     
     async def _check_explosion(self, symbol: str) -> Optional[str]:
         """Check for OI explosion"""
@@ -110,6 +133,11 @@ class OITracker:
         now = datetime.now()
         window_start = now - timedelta(minutes=window_minutes)
         
+        # Nothing older than the widest detection window is ever read: don't keep 24h of 15s samples
+        retention_start = now - timedelta(minutes=max(window_minutes, self._max_window_minutes()))
+        while snapshots and snapshots[0].timestamp < retention_start:
+            snapshots.popleft()
+        
         recent_snapshots = [s for s in snapshots if s.timestamp >= window_start]
         if len(recent_snapshots) < 2:
             return None
@@ -193,9 +221,14 @@ class OITracker:
 class OIMonitor:
     """OI explosion monitor for the telegram bot"""
     
-    def __init__(self, bot_instance, market_data_url: str = "http://localhost:8001"):
+    def __init__(self, bot_instance, market_data_url: str = "http://localhost:8001",
+                 liquidation_monitor=None):
         self.bot = bot_instance
         self.tracker = OITracker(market_data_url)
+        # Optional LiquidationMonitor for poll scheduling. Nothing in the bot
+        # constructs OIMonitor yet; whoever starts it must pass the running
+        # LiquidationMonitor here, otherwise polling follows OI velocity only.
+        self.liquidation_monitor = liquidation_monitor
         self.running = False
         self.monitoring_task = None
         self.logger = logging.getLogger(__name__)
@@ -204,7 +237,26 @@ class OIMonitor:
         
         # Symbols to monitor
         self.symbols = ['BTC-USDT', 'ETH-USDT', 'SOL-USDT', 'ADA-USDT', 'DOT-USDT']
-        self.check_interval = 300  # 5 minutes
+        self.check_interval = 300  # Quiet-market REST poll cadence
+        
+        # Per-symbol 30-600s poll intervals from OI velocity, liquidations and liquidity tier
+        self.poll_scheduler = OIPollScheduler(
+            self.symbols,
+            min_interval=30,
+            max_interval=600,
+            baseline_interval=self.check_interval,
+            liquidation_activity=self._liquidation_activity
+        )
+        
+        # Bybit/OKX push feeds at 15s resolution, scheduled bulk polling for the rest
+        self.collector = OIStreamCollector(
+            self.symbols,
+            sink=self._on_oi_sample,
+            poll=self._poll_oi_data,
+            emit_interval=15,
+            streaming=os.getenv('OI_STREAMING', '1') != '0',
+            scheduler=self.poll_scheduler
+        )
     
     async def start_monitoring(self):
         """Start OI monitoring"""
@@ -212,10 +264,13 @@ class OIMonitor:
             return
         
         self.running = True
-        self.session = aiohttp.ClientSession()
+        # Background priority: the market data service serves bot commands first
+        self.session = aiohttp.ClientSession(headers={'X-Request-Priority': 'background'})
         self.logger.info("Starting OI monitoring...")
+        await self.tracker.warm_start(self.symbols)
+        await self._refresh_poll_tiers()
         
-        self.monitoring_task = asyncio.create_task(self._monitoring_loop())
+        self.monitoring_task = asyncio.create_task(self.collector.run())
     
     async def stop_monitoring(self):
         """Stop OI monitoring"""
@@ -226,54 +281,71 @@ class OIMonitor:
                 await self.monitoring_task
             except asyncio.CancelledError:
                 pass
+        await self.collector.stop()
         
         if self.session:
             await self.session.close()
+        
+        await self.tracker.snapshot_store.stop()
     
-    async def _monitoring_loop(self):
-        """Main monitoring loop"""
-        while self.running:
-            try:
-                for symbol in self.symbols:
-                    if not self.running:
-                        break
-                    await self._check_symbol_oi(symbol)
-                
-                # Wait before next check
-                await asyncio.sleep(self.check_interval)
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                self.logger.error(f"OI monitoring error: {e}")
-                await asyncio.sleep(60)  # Wait on error
-    
-    async def _check_symbol_oi(self, symbol: str):
-        """Check OI for a specific symbol"""
+    async def _refresh_poll_tiers(self):
+        """Give the poll scheduler each symbol's liquidity tier"""
         try:
-            # Get OI data from market data service
-            oi_data = await self._fetch_oi_data(symbol)
-            if not oi_data:
-                return
-            
-            # Create snapshots for each exchange
-            timestamp = datetime.now()
-            for exchange, data in oi_data.items():
-                if isinstance(data, dict) and 'oi_usd' in data:
-                    snapshot = OISnapshot(
-                        symbol=symbol,
-                        exchange=exchange,
-                        oi_usd=float(data['oi_usd']),
-                        timestamp=timestamp
-                    )
-                    
-                    # Check for explosion (now async)
-                    alert_message = await self.tracker.add_snapshot(snapshot)
-                    if alert_message:
-                        await self._send_alert(alert_message)
-                        
+            profiles = await self.tracker.threshold_engine.get_asset_profiles(self.symbols)
+            for symbol in self.symbols:
+                profile = profiles.get(symbol.upper())
+                if profile is not None:
+                    self.poll_scheduler.set_tier(symbol, profile.liquidity_tier)
         except Exception as e:
-            self.logger.error(f"Error checking OI for {symbol}: {e}")
+            self.logger.warning(f"Could not load liquidity tiers for OI polling: {e}")
+    
+    def _liquidation_activity(self, symbol: str) -> float:
+        """Last minute's liquidations for the symbol as a fraction of its cascade threshold"""
+        if self.liquidation_monitor is None:
+            return 0.0
+        
+        tracker = self.liquidation_monitor.tracker
+        liquidation_symbol = symbol.replace('-', '')
+        window = tracker.symbol_windows.get(liquidation_symbol, tracker.prediction_window)
+        if window is None or not window.count:
+            return 0.0
+        
+        threshold = tracker.threshold_cache.get(liquidation_symbol)
+        if threshold is not None:
+            cascade_usd = threshold.cascade_threshold_usd
+        else:
+            base_symbol = liquidation_symbol.replace('USDT', '')
+            # Cascade thresholds are 5x the single-liquidation threshold, as in DynamicThresholdEngine
+            cascade_usd = tracker.fallback_thresholds.get(base_symbol, tracker.fallback_thresholds['default']) * 5
+        return window.total_usd / cascade_usd if cascade_usd > 0 else 0.0
+    
+    async def _on_oi_sample(self, symbol: str, exchange: str, oi_usd: float, timestamp: int):
+        """Track one exchange-wide OI sample from the collector and alert on explosions"""
+        snapshot = OISnapshot(
+            symbol=symbol,
+            exchange=exchange,
+            oi_usd=oi_usd,
+            timestamp=datetime.fromtimestamp(timestamp)
+        )
+        
+        alert_message = await self.tracker.add_snapshot(snapshot)
+        if alert_message:
+            await self._send_alert(alert_message)
+    
+    async def _poll_oi_data(self, symbols: List[str]) -> Optional[Dict[str, Dict]]:
+        """One bulk request; concurrent per-symbol requests if it fails (None if all failed)"""
+        bulk_data = await self._fetch_bulk_oi_data(symbols)
+        if bulk_data is not None:
+            return bulk_data
+        
+        results = await asyncio.gather(*(self._fetch_oi_data(symbol) for symbol in symbols))
+        data = {symbol: oi_data for symbol, oi_data in zip(symbols, results) if oi_data}
+        return data or None
+    
+    @staticmethod
+    def _exchange_oi(result: Dict) -> Dict[str, Dict]:
+        """Per-exchange OI from a /multi_oi response, keyed by exchange"""
+        return {entry['exchange']: entry for entry in result.get('exchange_breakdown', [])}
     
     async def _fetch_oi_data(self, symbol: str) -> Optional[Dict]:
         """Fetch OI data from market data service"""
@@ -289,13 +361,38 @@ class OIMonitor:
                 if response.status == 200:
                     result = await response.json()
                     if result.get('success'):
-                        return result.get('data', {})
+                        return self._exchange_oi(result)
                         
         except Exception as e:
             self.logger.error(f"Error fetching OI data for {symbol}: {e}")
         
         return None
     
+    async def _fetch_bulk_oi_data(self, symbols: List[str]) -> Optional[Dict[str, Dict]]:
+        """Fetch OI data for many symbols in one request (None on failure)"""
+        try:
+            if not self.session:
+                return None
+            
+            async with self.session.post(
+                f"{self.market_data_url}/multi_oi_bulk",
+                json={'base_symbols': symbols},
+                timeout=30
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    if result.get('success'):
+                        return {
+                            symbol: self._exchange_oi(data)
+                            for symbol, data in result.get('data', {}).items()
+                            if data.get('success')
+                        }
+                        
+        except Exception as e:
+            self.logger.error(f"Error fetching bulk OI data: {e}")
+        
+        return None
+    
     async def _send_alert(self, message: str):
         """Send alert to telegram chat"""
         try:
@@ -316,6 +413,7 @@ class OIMonitor:
             'running': self.running,
             'symbols_monitored': len(self.symbols),
             'check_interval': self.check_interval,
+            'collector': self.collector.get_status(),
             'total_snapshots': sum(len(snapshots) for snapshots in self.tracker.snapshots.values()),
             'threshold_cache_size': len(getattr(self.tracker, 'threshold_cache', {}))
         }
\ No newline at end of file
@@ -84,7 +84,13 @@ MONITORING_CONFIG = {
 
 # Exchange API Configuration
 EXCHANGE_CONFIG = {
-    "oi_monitoring_interval": 300,    # Check OI every 5 minutes
+    "oi_monitoring_interval": 300,    # Quiet-market OI REST poll cadence (per-cycle cost baseline)
+    "oi_max_poll_interval": 600,      # Slowest OI REST poll (quiet low-liquidity tiers)
+    "oi_min_poll_interval": 30,       # Fastest OI REST poll while OI is moving
+    "oi_stream_emit_interval": 15,    # Streamed OI sample spacing (seconds)
+    "oi_detection_interval": 30,      # Run OI explosion detection every 30 seconds
+    "oi_streaming_enabled": os.getenv("OI_STREAMING", "1") != "0",
+    "oi_poll_budget_multiplier": 2.0,  # OI poll requests allowed per cadence, x the fixed-cadence cost
     "api_timeout_seconds": 10,        # API request timeout
     "max_concurrent_requests": 5,     # Max parallel requests
     "rate_limit_buffer": 0.8,         # Use 80% of rate limit
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: WebSocket message decoders
+Measures messages/second for the legacy stdlib json + dict.get/float path
+and for every available MessageDecoder backend on Binance trade, forceOrder
+and bookTicker payloads
+
+Usage: python benchmark_decoder.py [recorded_frames.jsonl]
+A recording holds one raw websocket frame per line (single-stream frames);
+without one, the built-in frames captured from fstream.binance.com are used
+"""
+
+import json
+import sys
+import time
+from typing import Callable, Dict, List
+
+from message_decoder import MessageDecoder, available_backends
+
+RECORDED_FRAMES = {
+    'trade': [
+        '{"e":"trade","E":1724511211207,"T":1724511211206,"s":"BTCUSDT","t":5196839432,"p":"64112.30","q":"0.004","X":"MARKET","m":true}',
+        '{"e":"trade","E":1724511211215,"T":1724511211214,"s":"BTCUSDT","t":5196839433,"p":"64112.40","q":"1.250","X":"MARKET","m":false}',
+        '{"e":"trade","E":1724511211302,"T":1724511211301,"s":"ETHUSDT","t":4213376761,"p":"2761.57","q":"12.418","X":"MARKET","m":false}',
+        '{"e":"trade","E":1724511211344,"T":1724511211343,"s":"SOLUSDT","t":1840263718,"p":"155.2100","q":"41","X":"MARKET","m":true}',
+    ],
+    'forceOrder': [
+        '{"e":"forceOrder","E":1724511213511,"o":{"s":"BTCUSDT","S":"SELL","o":"LIMIT","f":"IOC","q":"0.512","p":"63980.10","ap":"64011.62","X":"FILLED","l":"0.512","z":"0.512","T":1724511213507}}',
+        '{"e":"forceOrder","E":1724511214120,"o":{"s":"ETHUSDT","S":"BUY","o":"LIMIT","f":"IOC","q":"35.120","p":"2779.40","ap":"2771.09","X":"FILLED","l":"35.120","z":"35.120","T":1724511214116}}',
+    ],
+    'bookTicker': [
+        '{"e":"bookTicker","u":5169843211937,"s":"BTCUSDT","b":"64112.30","B":"4.731","a":"64112.40","A":"1.095","T":1724511211207,"E":1724511211211}',
+        '{"e":"bookTicker","u":5169843212031,"s":"ETHUSDT","b":"2761.56","B":"88.404","a":"2761.57","A":"11.622","T":1724511211301,"E":1724511211305}',
+    ],
+}
+
+
+def legacy_parse(kind: str) -> Callable[[str], tuple]:
+    """The pre-decoder path: json.loads followed by dict.get and float() per field"""
+    def trade(message):
+        data = json.loads(message)
+        return (data.get('s', ''), float(data.get('p', 0)), float(data.get('q', 0)),
+                int(data.get('T', 0)), data.get('m', False))
+
+    def force_order(message):
+        order = json.loads(message).get('o', {})
+        return (order.get('s', ''), order.get('S', ''), float(order.get('ap', 0)),
+                float(order.get('z', 0)), int(order.get('T', 0)))
+
+    def book_ticker(message):
+        data = json.loads(message)
+        return (data.get('s', ''), float(data.get('b', 0)), float(data.get('a', 0)),
+                float(data.get('B', 0)), float(data.get('A', 0)))
+
+    return {'trade': trade, 'forceOrder': force_order, 'bookTicker': book_ticker}[kind]
+
+
+def typed_parse(decoder: MessageDecoder, kind: str) -> Callable:
+    return {
+        'trade': decoder.decode_trade,
+        'forceOrder': decoder.decode_force_order,
+        'bookTicker': decoder.decode_book_ticker,
+    }[kind]
+
+
+def load_recording(path: str) -> Dict[str, List[str]]:
+    frames: Dict[str, List[str]] = {kind: [] for kind in RECORDED_FRAMES}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            event_type = json.loads(line).get('e')
+            if event_type in frames:
+                frames[event_type].append(line)
+    return frames
+
+
+def messages_per_second(parse: Callable, frames: List[str], min_seconds: float = 0.5) -> float:
+    rounds = 0
+    start = time.perf_counter()
+    while True:
+        for frame in frames:
+            parse(frame)
+        rounds += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return rounds * len(frames) / elapsed
+
+
+def main():
+    frames = load_recording(sys.argv[1]) if len(sys.argv) > 1 else RECORDED_FRAMES
+
+    print("⚡ WEBSOCKET DECODER BENCHMARK")
+    print("=" * 70)
+    print(f"Backends available: {', '.join(available_backends())}")
+    print(f"{'payload':>11} {'decoder':>16} {'msgs/sec':>14} {'vs legacy':>10}")
+
+    for kind, kind_frames in frames.items():
+        if not kind_frames:
+            continue
+        # Fail loudly if a backend cannot decode the recording
+        for backend in available_backends():
+            typed_parse(MessageDecoder(backend), kind)(kind_frames[0])
+
+        legacy_rate = messages_per_second(legacy_parse(kind), kind_frames)
+        print(f"{kind:>11} {'legacy json':>16} {legacy_rate:>14,.0f} {'1.00x':>10}")
+        for backend in available_backends():
+            rate = messages_per_second(typed_parse(MessageDecoder(backend), kind), kind_frames)
+            print(f"{kind:>11} {backend + ' typed':>16} {rate:>14,.0f} {rate / legacy_rate:>9.2f}x")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,13 @@ Intelligent, market-adaptive thresholds replacing all hardcoded values
 Part of the Institutional Trading Intelligence System
 """
 
-from dataclasses import dataclass
-from typing import Dict, Optional, List
+from dataclasses import asdict, dataclass, fields as dataclass_fields
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, List, Set
 import math
+import json
+import os
+import tempfile
 from datetime import datetime, timedelta
 import aiohttp
 import asyncio
@@ -27,6 +31,7 @@ class AssetProfile:
     avg_trade_size: float
     whale_threshold_percentile: float
     last_updated: datetime
+    degraded: bool = False  # Market cap or volume missing from the provider: tier is a guess
 
 
 @dataclass
@@ -63,6 +68,29 @@ class OIThreshold:
     maturity_adjustment: float
 
 
+THRESHOLD_TYPES = {
+    'liquidation': ThresholdResult,
+    'volume': VolumeThreshold,
+    'oi': OIThreshold
+}
+
+
+def _to_serializable(obj) -> dict:
+    """Dataclass -> JSON-safe dict (datetimes as ISO strings)"""
+    return {k: v.isoformat() if isinstance(v, datetime) else v for k, v in asdict(obj).items()}
+
+
+def _from_serializable(cls, fields: dict):
+    """JSON dict -> dataclass, parsing datetime fields back"""
+    values = {}
+    for f in dataclass_fields(cls):
+        if f.name not in fields:
+            continue  # Field added since the snapshot was written: keep its default
+        value = fields[f.name]
+        values[f.name] = datetime.fromisoformat(value) if f.type is datetime else value
+    return cls(**values)
+
+
 class MarketDataProvider(ABC):
     """Abstract interface for market data providers"""
     
@@ -88,34 +116,142 @@ class MarketDataProvider(ABC):
 
 
 class DefaultMarketDataProvider(MarketDataProvider):
-    """Default implementation using existing market data service"""
+    """
+    Default implementation using existing market data service
     
-    def __init__(self, market_data_url: str):
+    All four metrics are derived from one /combined_price payload per symbol.
+    Payloads are memoized for snapshot_ttl seconds and concurrent requests for
+    the same symbol share one in-flight fetch, so a profile refresh costs a
+    single combined-price computation. prefetch() loads many symbols with one
+    /combined_prices bulk request.
+    """
+    
+    # Typical volume/market-cap ratios used to estimate market cap from volume
+    MARKET_CAP_MULTIPLIERS = {
+        'BTC': 100,   # Conservative BTC ratio
+        'ETH': 80,    # ETH typically lower
+        'SOL': 30,    # Mid-caps
+        'ADA': 25,
+        'DOT': 20,
+        'AVAX': 15,
+    }
+    
+    # Typical trades per day used to estimate average trade size
+    TRADES_PER_DAY = {
+        'BTC': 100000,  # Very active
+        'ETH': 80000,
+        'SOL': 30000,
+        'ADA': 20000,
+        'DOT': 15000,
+    }
+    
+    def __init__(self, market_data_url: str, snapshot_ttl: float = 30.0, fetch_combined_price=None):
         self.market_data_url = market_data_url
         self.session = None
+        # Optional in-process source (async symbol -> combined price response), used
+        # by the market data service itself instead of an HTTP round trip
+        self.fetch_combined_price = fetch_combined_price
+        self.snapshot_ttl = snapshot_ttl
+        self.snapshots: Dict[str, tuple] = {}  # symbol -> (fetched_at, combined price data or None)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {'fetches': 0, 'bulk_fetches': 0, 'memo_hits': 0}
     
     async def _get_session(self):
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            # Threshold inputs are background work: the market data service
+            # schedules their upstream calls behind interactive requests
+            self.session = aiohttp.ClientSession(headers={'X-Request-Priority': 'background'})
         return self.session
     
-    async def get_24h_volume(self, symbol: str) -> Optional[float]:
-        """Get 24h volume from market data service"""
+    async def get_market_snapshot(self, symbol: str) -> Optional[dict]:
+        """Combined price payload ('data' section) for a symbol, fetched at most once per TTL"""
+        loop = asyncio.get_event_loop()
+        cached = self.snapshots.get(symbol)
+        if cached and loop.time() - cached[0] < self.snapshot_ttl:
+            self.stats['memo_hits'] += 1
+            return cached[1]
+        
+        future = self._inflight.get(symbol)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_snapshot(symbol))
+            self._inflight[symbol] = future
+            future.add_done_callback(lambda _: self._inflight.pop(symbol, None))
+        return await asyncio.shield(future)
+    
+    async def _fetch_snapshot(self, symbol: str) -> Optional[dict]:
+        data = None
+        try:
+            self.stats['fetches'] += 1
+            if self.fetch_combined_price is not None:
+                payload = await self.fetch_combined_price(symbol)
+                if payload.get('success'):
+                    data = payload.get('data', {})
+            else:
+                session = await self._get_session()
+                async with session.post(f"{self.market_data_url}/combined_price", 
+                                      json={'symbol': symbol}) as response:
+                    if response.status == 200:
+                        payload = await response.json()
+                        if payload.get('success'):
+                            data = payload.get('data', {})
+        except Exception as e:
+            logger.error(f"Error fetching market data for {symbol}: {e}")
+        
+        self.snapshots[symbol] = (asyncio.get_event_loop().time(), data)
+        return data
+    
+    async def prefetch(self, symbols: List[str]):
+        """Load snapshots for many symbols with one bulk request (per-symbol fallback)"""
+        loop = asyncio.get_event_loop()
+        stale = [s for s in dict.fromkeys(symbols)
+                 if s not in self._inflight
+                 and not (s in self.snapshots and loop.time() - self.snapshots[s][0] < self.snapshot_ttl)]
+        if not stale:
+            return
+        
+        if self.fetch_combined_price is not None:
+            await asyncio.gather(*(self.get_market_snapshot(s) for s in stale))
+            return
+        
         try:
             session = await self._get_session()
-            async with session.post(f"{self.market_data_url}/combined_price", 
-                                  json={'symbol': symbol}) as response:
+            async with session.post(f"{self.market_data_url}/combined_prices", 
+                                  json={'symbols': stale}) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    if data.get('success'):
-                        # Try perp first, then spot
-                        perp_vol = data.get('data', {}).get('perp', {}).get('volume_24h', 0)
-                        spot_vol = data.get('data', {}).get('spot', {}).get('volume_24h', 0)
-                        price = (data.get('data', {}).get('perp', {}).get('price') or 
-                               data.get('data', {}).get('spot', {}).get('price', 1))
-                        
-                        volume = max(perp_vol, spot_vol) * price if price else 0
-                        return volume if volume > 0 else None
+                    payload = await response.json()
+                    if payload.get('success'):
+                        self.stats['bulk_fetches'] += 1
+                        fetched_at = loop.time()
+                        for symbol, result in payload.get('data', {}).items():
+                            data = result.get('data') if result.get('success') else None
+                            self.snapshots[symbol] = (fetched_at, data)
+                        return
+        except Exception as e:
+            logger.warning(f"Bulk market data fetch failed, falling back to per-symbol: {e}")
+        
+        await asyncio.gather(*(self.get_market_snapshot(s) for s in stale))
+    
+    @staticmethod
+    def _base_symbol(symbol: str) -> str:
+        return symbol.replace('USDT', '').replace('USDC', '').replace('-', '')
+    
+    @staticmethod
+    def _volume_from_snapshot(data: Optional[dict]) -> Optional[float]:
+        if not data:
+            return None
+        # Try perp first, then spot
+        perp_vol = data.get('perp', {}).get('volume_24h', 0)
+        spot_vol = data.get('spot', {}).get('volume_24h', 0)
+        price = (data.get('perp', {}).get('price') or 
+               data.get('spot', {}).get('price', 1))
+        
+        volume = max(perp_vol or 0, spot_vol or 0) * price if price else 0
+        return volume if volume > 0 else None
+    
+    async def get_24h_volume(self, symbol: str) -> Optional[float]:
+        """Get 24h volume from market data service"""
+        try:
+            return self._volume_from_snapshot(await self.get_market_snapshot(symbol))
         except Exception as e:
             logger.error(f"Error fetching volume for {symbol}: {e}")
         return None
@@ -126,19 +262,7 @@ class DefaultMarketDataProvider(MarketDataProvider):
             # Use volume as a proxy for market cap (rough estimation)
             volume = await self.get_24h_volume(symbol)
             if volume:
-                # Rough market cap estimation based on volume patterns
-                base_symbol = symbol.replace('USDT', '').replace('USDC', '').replace('-', '')
-                
-                # Market cap multipliers based on typical volume/mcap ratios
-                multipliers = {
-                    'BTC': 100,   # Conservative BTC ratio
-                    'ETH': 80,    # ETH typically lower
-                    'SOL': 30,    # Mid-caps
-                    'ADA': 25,
-                    'DOT': 20,
-                    'AVAX': 15,
-                }
-                multiplier = multipliers.get(base_symbol, 5)  # Default for smaller caps
+                multiplier = self.MARKET_CAP_MULTIPLIERS.get(self._base_symbol(symbol), 5)  # Default for smaller caps
                 return volume * multiplier
         except Exception as e:
             logger.error(f"Error estimating market cap for {symbol}: {e}")
@@ -147,19 +271,15 @@ class DefaultMarketDataProvider(MarketDataProvider):
     async def get_volatility(self, symbol: str, period_hours: int = 24) -> Optional[float]:
         """Get volatility from price changes"""
         try:
-            session = await self._get_session()
-            async with session.post(f"{self.market_data_url}/combined_price", 
-                                  json={'symbol': symbol}) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if data.get('success'):
-                        # Use 24h change as volatility proxy
-                        perp_change = data.get('data', {}).get('perp', {}).get('change_24h', 0)
-                        spot_change = data.get('data', {}).get('spot', {}).get('change_24h', 0)
-                        
-                        # Use the larger absolute change
-                        volatility = max(abs(perp_change or 0), abs(spot_change or 0)) / 100
-                        return volatility if volatility > 0 else None
+            data = await self.get_market_snapshot(symbol)
+            if data:
+                # Use 24h change as volatility proxy
+                perp_change = data.get('perp', {}).get('change_24h', 0)
+                spot_change = data.get('spot', {}).get('change_24h', 0)
+                
+                # Use the larger absolute change
+                volatility = max(abs(perp_change or 0), abs(spot_change or 0)) / 100
+                return volatility if volatility > 0 else None
         except Exception as e:
             logger.error(f"Error fetching volatility for {symbol}: {e}")
         return None
@@ -169,17 +289,8 @@ class DefaultMarketDataProvider(MarketDataProvider):
         try:
             volume = await self.get_24h_volume(symbol)
             if volume:
-                # Rough estimation: assume 10-50k trades per day depending on asset
-                base_symbol = symbol.replace('USDT', '').replace('USDC', '').replace('-', '')
-                
-                # Typical trades per day
-                trades_per_day = {
-                    'BTC': 100000,  # Very active
-                    'ETH': 80000,
-                    'SOL': 30000,
-                    'ADA': 20000,
-                    'DOT': 15000,
-                }.get(base_symbol, 5000)  # Default for smaller assets
+                # Rough estimation: assume 5-100k trades per day depending on asset
+                trades_per_day = self.TRADES_PER_DAY.get(self._base_symbol(symbol), 5000)  # Default for smaller assets
                 
                 avg_trade_size = volume / trades_per_day
                 return avg_trade_size if avg_trade_size > 10 else 100  # Minimum $100
@@ -196,6 +307,10 @@ class DynamicThresholdEngine:
         self.market_data_provider = market_data_provider or DefaultMarketDataProvider(market_data_url)
         self.asset_cache: Dict[str, AssetProfile] = {}
         self.cache_ttl = timedelta(hours=1)  # Cache profiles for 1 hour
+        self._profile_inflight: Dict[str, asyncio.Future] = {}
+        
+        # Last successfully computed thresholds (no fallback or degraded profile): kind -> symbol -> result
+        self.computed: Dict[str, Dict[str, object]] = {kind: {} for kind in THRESHOLD_TYPES}
         
         # Market session multipliers (from PRD)
         self.market_session_multipliers = {
@@ -246,7 +361,7 @@ class DynamicThresholdEngine:
             }
             final_threshold = max(final_threshold, min_thresholds[profile.liquidity_tier])
             
-            return ThresholdResult(
+            result = ThresholdResult(
                 single_liquidation_usd=final_threshold,
                 cascade_threshold_usd=final_threshold * 5,
                 cascade_count_threshold=self._calculate_cascade_count(profile),
@@ -256,11 +371,105 @@ class DynamicThresholdEngine:
                 volatility_adjustment=volatility_multiplier,
                 session_adjustment=session_multiplier
             )
+            if not profile.degraded:
+                self.computed['liquidation'][symbol] = result
+            return result
             
         except Exception as e:
             logger.error(f"Error calculating liquidation threshold for {symbol}: {e}")
             return self._get_fallback_liquidation_threshold(symbol)
     
+    async def calculate_thresholds(self, symbols: List[str], kinds: Iterable[str] = None) -> Dict[str, Dict[str, object]]:
+        """Bulk threshold calculation: one profile refresh pass, then every kind per symbol"""
+        kinds = [k for k in (kinds or THRESHOLD_TYPES) if k in THRESHOLD_TYPES]
+        symbols = list(dict.fromkeys(symbols))
+        await self.get_asset_profiles(symbols)
+        
+        calculators = {
+            'liquidation': self.calculate_liquidation_threshold,
+            'volume': self.calculate_volume_threshold,
+            'oi': self.calculate_oi_threshold
+        }
+        results = await asyncio.gather(*(calculators[k](s) for s in symbols for k in kinds))
+        
+        thresholds: Dict[str, Dict[str, object]] = {s: {} for s in symbols}
+        pairs = [(s, k) for s in symbols for k in kinds]
+        for (symbol, kind), result in zip(pairs, results):
+            thresholds[symbol][kind] = result
+        return thresholds
+    
+    async def fetch_remote_thresholds(self, symbols: List[str], kinds: Iterable[str] = None,
+                                      market_data_url: str = None) -> int:
+        """
+        Load thresholds for many symbols from the market data /thresholds endpoint
+        
+        Results land in self.computed and the profiles in self.asset_cache, exactly
+        as if they had been calculated locally. Returns the number of symbols loaded.
+        """
+        url = market_data_url or getattr(self.market_data_provider, 'market_data_url', None)
+        if not url or not symbols:
+            return 0
+        
+        kinds = list(kinds or THRESHOLD_TYPES)
+        session = None
+        own_session = not hasattr(self.market_data_provider, '_get_session')
+        try:
+            session = aiohttp.ClientSession() if own_session else await self.market_data_provider._get_session()
+            async with session.post(f"{url}/thresholds", json={'symbols': list(symbols), 'types': kinds},
+                                    timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status != 200:
+                    return 0
+                payload = await response.json()
+        except Exception as e:
+            logger.warning(f"Bulk threshold fetch failed: {e}")
+            return 0
+        finally:
+            if own_session and session:
+                await session.close()
+        
+        if not payload.get('success'):
+            return 0
+        self._load_serialized(payload.get('profiles', {}), payload.get('data', {}))
+        return len(payload.get('data', {}))
+    
+    def export_state(self, symbols: Iterable[str] = None) -> dict:
+        """Serializable asset profiles and computed thresholds (for snapshots and the bulk endpoint)"""
+        wanted = set(symbols) if symbols is not None else None
+        thresholds: Dict[str, Dict[str, dict]] = {}
+        for kind, results in self.computed.items():
+            for symbol, result in results.items():
+                if wanted is None or symbol in wanted:
+                    thresholds.setdefault(symbol, {})[kind] = _to_serializable(result)
+        
+        wanted_profiles = None if wanted is None else {s.replace('/', '-').upper() for s in wanted}
+        return {
+            'profiles': {symbol: _to_serializable(p) for symbol, p in self.asset_cache.items()
+                         if wanted_profiles is None or symbol in wanted_profiles},
+            'data': thresholds
+        }
+    
+    def _load_serialized(self, profiles: Dict[str, dict], thresholds: Dict[str, Dict[str, dict]]):
+        """Inverse of export_state; entries that do not parse are skipped"""
+        for symbol, fields in profiles.items():
+            try:
+                profile = _from_serializable(AssetProfile, fields)
+                if profile.degraded:
+                    continue
+                cached = self.asset_cache.get(symbol)
+                if cached is None or cached.last_updated < profile.last_updated:
+                    self.asset_cache[symbol] = profile
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Skipping asset profile for {symbol}: {e}")
+        
+        for symbol, kinds in thresholds.items():
+            for kind, fields in kinds.items():
+                if kind not in THRESHOLD_TYPES:
+                    continue
+                try:
+                    self.computed[kind][symbol] = _from_serializable(THRESHOLD_TYPES[kind], fields)
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Skipping {kind} threshold for {symbol}: {e}")
+    
     async def calculate_volume_threshold(self, symbol: str) -> VolumeThreshold:
         """Calculate dynamic volume spike thresholds"""
         try:
@@ -280,7 +489,7 @@ class DynamicThresholdEngine:
             
             final_multiplier = base_multiplier * volatility_adjustment
             
-            return VolumeThreshold(
+            result = VolumeThreshold(
                 volume_spike_multiplier=final_multiplier,
                 moderate_threshold=final_multiplier * 0.7,
                 high_threshold=final_multiplier,
@@ -288,6 +497,9 @@ class DynamicThresholdEngine:
                 whale_trade_usd=profile.avg_trade_size * 20,  # 20x average trade
                 baseline_volume_usd=profile.avg_daily_volume_usd
             )
+            if not profile.degraded:
+                self.computed['volume'][symbol] = result
+            return result
             
         except Exception as e:
             logger.error(f"Error calculating volume threshold for {symbol}: {e}")
@@ -317,13 +529,16 @@ class DynamicThresholdEngine:
             maturity_multiplier = maturity_multipliers.get(market_maturity, 1.0)
             final_oi_threshold = base_oi_threshold_pct * maturity_multiplier
             
-            return OIThreshold(
+            result = OIThreshold(
                 oi_change_threshold_pct=final_oi_threshold,
                 minimum_oi_usd=self._calculate_min_oi_threshold(profile),
                 time_window_minutes=self._calculate_time_window(profile),
                 cross_exchange_confirmation_required=profile.liquidity_tier in ['TIER_3', 'MICRO_CAP'],
                 maturity_adjustment=maturity_multiplier
             )
+            if not profile.degraded:
+                self.computed['oi'][symbol] = result
+            return result
             
         except Exception as e:
             logger.error(f"Error calculating OI threshold for {symbol}: {e}")
@@ -340,12 +555,41 @@ class DynamicThresholdEngine:
             if datetime.now() - profile.last_updated < self.cache_ttl:
                 return profile
         
-        # Fetch fresh data
+        # Concurrent callers for the same symbol share one refresh
+        future = self._profile_inflight.get(clean_symbol)
+        if future is None:
+            future = asyncio.ensure_future(self._build_asset_profile(symbol, clean_symbol))
+            self._profile_inflight[clean_symbol] = future
+            future.add_done_callback(lambda _: self._profile_inflight.pop(clean_symbol, None))
+        return await asyncio.shield(future)
+    
+    async def get_asset_profiles(self, symbols: List[str]) -> Dict[str, AssetProfile]:
+        """Refresh many asset profiles concurrently, using one bulk market data request"""
+        clean_symbols = list(dict.fromkeys(s.replace('/', '-').upper() for s in symbols))
+        stale = [s for s in clean_symbols
+                 if s not in self.asset_cache or datetime.now() - self.asset_cache[s].last_updated >= self.cache_ttl]
+        
+        if stale and hasattr(self.market_data_provider, 'prefetch'):
+            await self.market_data_provider.prefetch(stale)
+        
+        profiles = await asyncio.gather(*(self.get_asset_profile(s) for s in clean_symbols))
+        return dict(zip(clean_symbols, profiles))
+    
+    async def _build_asset_profile(self, symbol: str, clean_symbol: str) -> AssetProfile:
+        """Fetch provider metrics (concurrently) and cache a fresh profile"""
         try:
-            market_cap = await self.market_data_provider.get_market_cap(clean_symbol) or 0
-            daily_volume = await self.market_data_provider.get_24h_volume(clean_symbol) or 0
-            volatility = await self.market_data_provider.get_volatility(clean_symbol) or 0.05
-            avg_trade_size = await self.market_data_provider.get_average_trade_size(clean_symbol) or 1000
+            provider = self.market_data_provider
+            market_cap, daily_volume, volatility, avg_trade_size = await asyncio.gather(
+                provider.get_market_cap(clean_symbol),
+                provider.get_24h_volume(clean_symbol),
+                provider.get_volatility(clean_symbol),
+                provider.get_average_trade_size(clean_symbol)
+            )
+            degraded = market_cap is None or daily_volume is None
+            market_cap = market_cap or 0
+            daily_volume = daily_volume or 0
+            volatility = volatility or 0.05
+            avg_trade_size = avg_trade_size or 1000
             
             # Determine liquidity tier
             liquidity_tier = self._determine_liquidity_tier(market_cap, daily_volume)
@@ -359,11 +603,15 @@ class DynamicThresholdEngine:
                 liquidity_tier=liquidity_tier,
                 avg_trade_size=avg_trade_size,
                 whale_threshold_percentile=0.95,
-                last_updated=datetime.now()
+                last_updated=datetime.now(),
+                degraded=degraded
             )
             
-            # Cache it
-            self.asset_cache[clean_symbol] = profile
+            # Cache it, unless the provider data was missing (retry on the next lookup)
+            if degraded:
+                logger.warning(f"Incomplete provider data for {clean_symbol}, profile not cached")
+            else:
+                self.asset_cache[clean_symbol] = profile
             return profile
             
         except Exception as e:
@@ -544,10 +792,231 @@ class DynamicThresholdEngine:
             liquidity_tier='TIER_3',
             avg_trade_size=5000,
             whale_threshold_percentile=0.95,
-            last_updated=datetime.now()
+            last_updated=datetime.now(),
+            degraded=True
         )
     
     async def close(self):
         """Clean up resources"""
         if hasattr(self.market_data_provider, 'session') and self.market_data_provider.session:
-            await self.market_data_provider.session.close()
\ No newline at end of file
+            await self.market_data_provider.session.close()
+
+
+class ThresholdSnapshotCache:
+    """
+    Precomputed volume thresholds for hot paths that must never await I/O
+
+    A background task recomputes thresholds for every tracked symbol on a
+    fixed schedule and publishes them as a new read-only mapping, so readers
+    only do a synchronous dict lookup. Symbols first seen on the hot path are
+    queued with track() and picked up on the next (immediately woken) pass.
+    """
+    
+    def __init__(self, engine, refresh_interval: float = 300.0, max_concurrency: int = 8):
+        self.engine = engine  # Anything with async calculate_volume_threshold(symbol)
+        self.refresh_interval = refresh_interval
+        self.max_concurrency = max_concurrency
+        self.snapshot: Mapping[str, VolumeThreshold] = MappingProxyType({})
+        self.snapshot_time: Optional[datetime] = None
+        self.symbols: Set[str] = set()
+        self.pending: Set[str] = set()
+        self.refresh_count = 0
+        self.store: Optional['ThresholdSnapshotStore'] = None
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    def get(self, symbol: str) -> Optional[VolumeThreshold]:
+        """Synchronous lookup; unknown symbols are queued and None is returned"""
+        threshold = self.snapshot.get(symbol)
+        if threshold is None:
+            self.track([symbol])
+        return threshold
+    
+    def track(self, symbols: Iterable[str]):
+        """Add symbols to the refresh set, waking the refresher for new ones"""
+        new_symbols = [s for s in symbols if s not in self.symbols]
+        if new_symbols:
+            self.symbols.update(new_symbols)
+            self.pending.update(new_symbols)
+            self._wake.set()
+    
+    def untrack(self, symbols: Iterable[str]):
+        for symbol in symbols:
+            self.symbols.discard(symbol)
+            self.pending.discard(symbol)
+    
+    async def warm_start(self, symbols: Iterable[str], snapshot_name: str = 'volume'):
+        """Restore the engine's volume thresholds from disk and the bulk endpoint before start()"""
+        if not hasattr(self.engine, 'export_state'):
+            return
+        symbols = list(symbols)
+        self.store = ThresholdSnapshotStore(self.engine, snapshot_name)
+        self.store.load()
+        await self.engine.fetch_remote_thresholds(symbols, ['volume'])
+        self.store.start()
+    
+    def start(self, symbols: Iterable[str] = ()):
+        """Start the background refresher, seeding from thresholds the engine already holds"""
+        self.track(symbols)
+        warm = getattr(self.engine, 'computed', {}).get('volume', {})
+        seeded = {s: warm[s] for s in self.symbols if s in warm and s not in self.snapshot}
+        if seeded:
+            self.snapshot = MappingProxyType({**self.snapshot, **seeded})
+            logger.info(f"Seeded {len(seeded)} volume thresholds from warm start")
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        if self.store:
+            await self.store.stop()
+    
+    async def refresh(self, symbols: Optional[Iterable[str]] = None):
+        """Recompute thresholds and publish a new snapshot"""
+        symbols = list(self.symbols if symbols is None else symbols)
+        if not symbols:
+            return
+        
+        # Warm all asset profiles in one bulk pass before per-symbol threshold math
+        if hasattr(self.engine, 'get_asset_profiles'):
+            try:
+                await self.engine.get_asset_profiles(symbols)
+            except Exception as e:
+                logger.warning(f"Bulk asset profile refresh failed: {e}")
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def compute(symbol: str):
+            async with semaphore:
+                return symbol, await self.engine.calculate_volume_threshold(symbol)
+        
+        results = await asyncio.gather(*(compute(s) for s in symbols), return_exceptions=True)
+        
+        updated = dict(self.snapshot)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Threshold refresh failed: {result}")
+                continue
+            symbol, threshold = result
+            if symbol in self.symbols:
+                updated[symbol] = threshold
+        
+        # Publish atomically: readers see either the old or the new mapping
+        self.snapshot = MappingProxyType(updated)
+        self.snapshot_time = datetime.now()
+        self.refresh_count += 1
+    
+    async def _run(self):
+        loop = asyncio.get_event_loop()
+        next_full_refresh = loop.time()
+        while True:
+            try:
+                if loop.time() >= next_full_refresh:
+                    self.pending.clear()
+                    await self.refresh()
+                    next_full_refresh = loop.time() + self.refresh_interval
+                elif self.pending:
+                    pending, self.pending = self.pending, set()
+                    await self.refresh(pending)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Threshold snapshot refresh error: {e}")
+            
+            self._wake.clear()
+            if self.pending:
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=max(0.0, next_full_refresh - loop.time()))
+            except asyncio.TimeoutError:
+                pass
+    
+    def get_status(self) -> dict:
+        return {
+            'symbols': len(self.symbols),
+            'cached': len(self.snapshot),
+            'pending': len(self.pending),
+            'refresh_count': self.refresh_count,
+            'snapshot_age_seconds': (datetime.now() - self.snapshot_time).total_seconds() if self.snapshot_time else None
+        }
+
+
+class ThresholdSnapshotStore:
+    """
+    On-disk warm-start snapshot of an engine's asset profiles and thresholds
+    
+    load() at startup puts the last computed values back into the engine, so
+    alerts are calibrated before the first refresh completes; a background
+    task rewrites the file periodically (atomic replace) and once more on stop.
+    """
+    
+    def __init__(self, engine: 'DynamicThresholdEngine', name: str, directory: str = None,
+                 save_interval: float = 300.0, max_age: timedelta = timedelta(hours=24)):
+        directory = directory or os.getenv('THRESHOLD_SNAPSHOT_DIR',
+                                           os.path.join(tempfile.gettempdir(), 'tg-bot-thresholds'))
+        self.engine = engine
+        self.path = os.path.join(directory, f"{name}.json")
+        self.save_interval = save_interval
+        self.max_age = max_age
+        self._task: Optional[asyncio.Task] = None
+    
+    def load(self) -> int:
+        """Load the snapshot into the engine; returns the number of symbols restored"""
+        try:
+            with open(self.path) as f:
+                snapshot = json.load(f)
+            saved_at = datetime.fromisoformat(snapshot['saved_at'])
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable threshold snapshot {self.path}: {e}")
+            return 0
+        
+        if datetime.now() - saved_at > self.max_age:
+            logger.info(f"Threshold snapshot {self.path} is older than {self.max_age}, not loading")
+            return 0
+        
+        self.engine._load_serialized(snapshot.get('profiles', {}), snapshot.get('data', {}))
+        restored = len(snapshot.get('data', {}))
+        logger.info(f"Warm-started {restored} symbols from {self.path} (saved {saved_at:%H:%M:%S})")
+        return restored
+    
+    def save(self):
+        """Write the engine state atomically"""
+        state = self.engine.export_state()
+        if not state['profiles'] and not state['data']:
+            return
+        state['saved_at'] = datetime.now().isoformat()
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write threshold snapshot {self.path}: {e}")
+    
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self.save()
+    
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.save_interval)
+            self.save()
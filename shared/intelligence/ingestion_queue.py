@@ -0,0 +1,164 @@
+"""
+Sharded Ingestion Queue - decouples websocket readers from stream processors
+Readers enqueue parsed events into bounded per-shard queues; one consumer task
+per shard drives the processors, so slow processing never stalls socket reads
+Part of the Institutional Trading Intelligence System
+"""
+
+import asyncio
+import time
+import zlib
+from typing import Any, Awaitable, Callable, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Overflow policies for a full shard
+DROP_OLDEST = 'drop_oldest'    # Evict the oldest queued event (freshest data wins)
+DROP_NEWEST = 'drop_newest'    # Reject the incoming event
+BLOCK = 'block'                # Backpressure: the reader waits for space
+
+EventConsumer = Callable[[Any], Awaitable[None]]
+
+
+class ShardedIngestionQueue:
+    """
+    Bounded queues sharded by key (symbol) with a consumer task per shard
+
+    Events for one symbol always land on the same shard and are consumed in
+    order by a single task, so per-symbol processor state is never touched
+    concurrently. Must-keep events go to a separate lane per shard that the
+    overflow policy never evicts from, and are consumed ahead of queued
+    droppable events. Queue depth, drops and enqueue-to-dequeue lag are
+    tracked per shard.
+    """
+
+    def __init__(self, consumer: EventConsumer, num_shards: int = 8,
+                 max_queue_size: int = 5000, overflow_policy: str = DROP_OLDEST):
+        if overflow_policy not in (DROP_OLDEST, DROP_NEWEST, BLOCK):
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+
+        self.consumer = consumer
+        self.num_shards = num_shards
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.queues: List[asyncio.Queue] = [asyncio.Queue(maxsize=max_queue_size) for _ in range(num_shards)]
+        self.keep_queues: List[asyncio.Queue] = [asyncio.Queue(maxsize=max_queue_size) for _ in range(num_shards)]
+        # Counts items queued across both lanes of a shard; the worker waits on it
+        self.ready: List[asyncio.Semaphore] = [asyncio.Semaphore(0) for _ in range(num_shards)]
+        self.workers: List[asyncio.Task] = []
+
+        self.enqueued = [0] * num_shards
+        self.processed = [0] * num_shards
+        self.dropped = [0] * num_shards
+        self.blocked = [0] * num_shards
+        self.last_lag_ms = [0.0] * num_shards
+        self.max_lag_ms = [0.0] * num_shards
+
+    def shard_for(self, key: str) -> int:
+        # crc32 is stable across processes, unlike hash() on str
+        return zlib.crc32(key.encode()) % self.num_shards
+
+    async def put(self, key: str, event: Any, block: Optional[bool] = None):
+        """
+        Enqueue an event for `key`, applying the overflow policy if the shard is full
+
+        Args:
+            key: Shard key, normally the symbol
+            event: Parsed event handed to the consumer
+            block: Must-keep event (e.g. rare liquidations): queued on the shard's
+                never-evicted lane, with backpressure if that lane is full
+        """
+        shard = self.shard_for(key)
+        item = (time.monotonic(), event)
+
+        if block:
+            keep_queue = self.keep_queues[shard]
+            if keep_queue.full():
+                self.blocked[shard] += 1
+            await keep_queue.put(item)
+            self.enqueued[shard] += 1
+            self.ready[shard].release()
+            return
+
+        queue = self.queues[shard]
+        if queue.full():
+            if block is None and self.overflow_policy == BLOCK:
+                self.blocked[shard] += 1
+                await queue.put(item)
+                self.enqueued[shard] += 1
+                self.ready[shard].release()
+                return
+            if self.overflow_policy == DROP_NEWEST:
+                self.dropped[shard] += 1
+                return
+            # DROP_OLDEST: the replacement takes the evicted event's slot in the ready count
+            queue.get_nowait()
+            queue.task_done()
+            self.dropped[shard] += 1
+            queue.put_nowait(item)
+            self.enqueued[shard] += 1
+            return
+
+        queue.put_nowait(item)
+        self.enqueued[shard] += 1
+        self.ready[shard].release()
+
+    def start(self):
+        """Start one consumer task per shard"""
+        if self.workers:
+            return
+        self.workers = [asyncio.create_task(self._worker(shard)) for shard in range(self.num_shards)]
+
+    async def stop(self, drain: bool = False):
+        """Stop consumers, optionally processing what is already queued first"""
+        if drain:
+            await asyncio.gather(*(queue.join() for queue in self.keep_queues + self.queues))
+        for task in self.workers:
+            task.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    async def _worker(self, shard: int):
+        keep_queue, queue = self.keep_queues[shard], self.queues[shard]
+        while True:
+            await self.ready[shard].acquire()
+            queue_used = keep_queue if not keep_queue.empty() else queue
+            enqueued_at, event = queue_used.get_nowait()
+            try:
+                lag_ms = (time.monotonic() - enqueued_at) * 1000
+                self.last_lag_ms[shard] = lag_ms
+                if lag_ms > self.max_lag_ms[shard]:
+                    self.max_lag_ms[shard] = lag_ms
+                await self.consumer(event)
+            except Exception as e:
+                logger.error(f"Ingestion shard {shard} consumer error: {e}")
+            finally:
+                self.processed[shard] += 1
+                queue_used.task_done()
+
+    def get_metrics(self) -> dict:
+        """Queue depth, throughput, drop and lag metrics"""
+        depths = [queue.qsize() + keep_queue.qsize() for queue, keep_queue in zip(self.queues, self.keep_queues)]
+        return {
+            'num_shards': self.num_shards,
+            'overflow_policy': self.overflow_policy,
+            'max_queue_size': self.max_queue_size,
+            'workers_running': sum(1 for task in self.workers if not task.done()),
+            'queue_depth_total': sum(depths),
+            'queue_depth_max': max(depths) if depths else 0,
+            'enqueued': sum(self.enqueued),
+            'processed': sum(self.processed),
+            'dropped': sum(self.dropped),
+            'blocked': sum(self.blocked),
+            'lag_ms_max': round(max(self.max_lag_ms), 2) if self.num_shards else 0.0,
+            'per_shard': [
+                {
+                    'depth': depths[i],
+                    'dropped': self.dropped[i],
+                    'last_lag_ms': round(self.last_lag_ms[i], 2),
+                    'max_lag_ms': round(self.max_lag_ms[i], 2)
+                }
+                for i in range(self.num_shards)
+            ]
+        }
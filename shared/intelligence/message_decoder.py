@@ -0,0 +1,217 @@
+"""
+WebSocket Message Decoder - pluggable fast JSON path for high-rate feeds
+Decodes Binance trade, forceOrder and bookTicker payloads straight into
+typed compact structs using msgspec or orjson when available (stdlib json
+as the fallback)
+Part of the Institutional Trading Intelligence System
+"""
+
+import json
+import os
+from typing import Any, NamedTuple, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if msgspec is not None:
+    # Typed schemas: msgspec validates and converts numeric strings during the parse itself
+
+    class TradeMessage(msgspec.Struct, rename={
+            'symbol': 's', 'trade_id': 't', 'price': 'p', 'quantity': 'q',
+            'trade_time': 'T', 'is_buyer_maker': 'm'}):
+        """Binance <symbol>@trade payload"""
+        symbol: str
+        trade_id: int
+        price: float
+        quantity: float
+        trade_time: int
+        is_buyer_maker: bool
+
+    class ForceOrderDetail(msgspec.Struct, rename={
+            'symbol': 's', 'side': 'S', 'avg_price': 'ap', 'filled_quantity': 'z', 'trade_time': 'T'}):
+        """Order section of a forceOrder payload"""
+        symbol: str
+        side: str  # SELL = long liquidated, BUY = short liquidated
+        avg_price: float
+        filled_quantity: float
+        trade_time: int
+
+    class ForceOrderMessage(msgspec.Struct, rename={'event_time': 'E', 'order': 'o'}):
+        """Binance !forceOrder@arr payload"""
+        event_time: int
+        order: ForceOrderDetail
+
+    class BookTickerMessage(msgspec.Struct, rename={
+            'symbol': 's', 'best_bid': 'b', 'bid_quantity': 'B', 'best_ask': 'a', 'ask_quantity': 'A',
+            'event_time': 'E'}):
+        """Binance !bookTicker payload"""
+        symbol: str
+        best_bid: float
+        bid_quantity: float
+        best_ask: float
+        ask_quantity: float
+        event_time: int = 0
+
+    class StreamEnvelope(msgspec.Struct):
+        """Combined-stream frame; data stays raw until the stream's handler decodes it"""
+        stream: Optional[str] = None
+        data: msgspec.Raw = msgspec.Raw(b'null')
+
+else:
+    # Same attribute names as the msgspec schemas, built from a parsed dict
+
+    class TradeMessage(NamedTuple):
+        """Binance <symbol>@trade payload"""
+        symbol: str
+        trade_id: int
+        price: float
+        quantity: float
+        trade_time: int
+        is_buyer_maker: bool
+
+    class ForceOrderDetail(NamedTuple):
+        """Order section of a forceOrder payload"""
+        symbol: str
+        side: str  # SELL = long liquidated, BUY = short liquidated
+        avg_price: float
+        filled_quantity: float
+        trade_time: int
+
+    class ForceOrderMessage(NamedTuple):
+        """Binance !forceOrder@arr payload"""
+        event_time: int
+        order: ForceOrderDetail
+
+    class BookTickerMessage(NamedTuple):
+        """Binance !bookTicker payload"""
+        symbol: str
+        best_bid: float
+        bid_quantity: float
+        best_ask: float
+        ask_quantity: float
+        event_time: int = 0
+
+    StreamEnvelope = None
+
+
+def _trade_from_dict(d: dict) -> 'TradeMessage':
+    return TradeMessage(d['s'], int(d['t']), float(d['p']), float(d['q']), int(d['T']), bool(d['m']))
+
+
+def _force_order_from_dict(d: dict) -> 'ForceOrderMessage':
+    o = d['o']
+    return ForceOrderMessage(
+        int(d.get('E', 0)),
+        ForceOrderDetail(o['s'], o['S'], float(o['ap']), float(o['z']), int(o['T']))
+    )
+
+
+def _book_ticker_from_dict(d: dict) -> 'BookTickerMessage':
+    return BookTickerMessage(d['s'], float(d['b']), float(d['B']), float(d['a']), float(d['A']), int(d.get('E', 0)))
+
+
+BACKENDS = ('msgspec', 'orjson', 'json')
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Decoder backends importable in this environment, fastest first"""
+    return tuple(name for name, module in zip(BACKENDS, (msgspec, orjson, json)) if module is not None)
+
+
+class MessageDecoder:
+    """
+    Pluggable decoder for Binance websocket payloads
+
+    backend='auto' picks msgspec, then orjson, then stdlib json. Every
+    decode_* method accepts the raw frame (str/bytes), the `data` part of a
+    combined-stream frame from decode_envelope, or an already parsed dict.
+    Malformed payloads raise one of `decode_errors`.
+    """
+
+    def __init__(self, backend: str = 'auto'):
+        if backend == 'auto':
+            backend = available_backends()[0]
+        if backend not in available_backends():
+            raise ValueError(f"Decoder backend '{backend}' is not available (have {available_backends()})")
+
+        self.backend = backend
+        errors = [ValueError, KeyError, TypeError]  # json/orjson errors are ValueError subclasses
+
+        if backend == 'msgspec':
+            errors.append(msgspec.DecodeError)
+            self._envelope_decoder = msgspec.json.Decoder(StreamEnvelope)
+            self._typed = {
+                TradeMessage: msgspec.json.Decoder(TradeMessage, strict=False),
+                ForceOrderMessage: msgspec.json.Decoder(ForceOrderMessage, strict=False),
+                BookTickerMessage: msgspec.json.Decoder(BookTickerMessage, strict=False),
+            }
+            self.loads = msgspec.json.decode
+        else:
+            self.loads = orjson.loads if backend == 'orjson' else json.loads
+            self._builders = {
+                TradeMessage: _trade_from_dict,
+                ForceOrderMessage: _force_order_from_dict,
+                BookTickerMessage: _book_ticker_from_dict,
+            }
+
+        self.decode_errors = tuple(errors)
+
+    def _decode(self, payload: Any, schema):
+        if self.backend == 'msgspec':
+            if isinstance(payload, dict):
+                return msgspec.convert(payload, schema, strict=False)
+            return self._typed[schema].decode(payload)
+
+        if not isinstance(payload, dict):
+            payload = self.loads(payload)
+        return self._builders[schema](payload)
+
+    def decode_envelope(self, message: Any) -> Tuple[Optional[str], Any]:
+        """
+        Split a combined-stream frame into (stream, data)
+
+        Control responses ({"result": null, "id": n}) yield stream None and the
+        whole parsed frame as data.
+        """
+        if self.backend == 'msgspec':
+            envelope = self._envelope_decoder.decode(message)
+            if envelope.stream is None:
+                return None, self.loads(message)
+            return envelope.stream, envelope.data
+
+        payload = self.loads(message)
+        if not isinstance(payload, dict):
+            return None, payload
+        return payload.get('stream'), payload.get('data', payload)
+
+    def decode_trade(self, payload: Any) -> 'TradeMessage':
+        return self._decode(payload, TradeMessage)
+
+    def decode_force_order(self, payload: Any) -> 'ForceOrderMessage':
+        return self._decode(payload, ForceOrderMessage)
+
+    def decode_book_ticker(self, payload: Any) -> 'BookTickerMessage':
+        return self._decode(payload, BookTickerMessage)
+
+
+_decoder: Optional[MessageDecoder] = None
+
+
+def get_decoder() -> MessageDecoder:
+    """Process-wide decoder; WS_JSON_DECODER=msgspec|orjson|json overrides auto-selection"""
+    global _decoder
+    if _decoder is None:
+        _decoder = MessageDecoder(os.getenv('WS_JSON_DECODER', 'auto'))
+        logger.info(f"WebSocket message decoder backend: {_decoder.backend}")
+    return _decoder
@@ -0,0 +1,283 @@
+"""
+Adaptive OI Poll Scheduler - per-symbol REST poll intervals
+Each symbol is polled on its own interval: quiet symbols stay at a ceiling
+set by their liquidity tier (never faster than the fixed 300s bulk cadence
+this replaces), symbols with fast-moving OI or a burst of liquidations are
+pulled in towards the minimum. Everything due before the next poll rides
+along in one bulk request. Per-symbol requests are capped per exchange at a
+multiple of what the fixed cadence spent, and all-instrument listings are
+charged only when the shared ticker snapshot has expired, at most one
+refetch per minimum interval, so only hot symbols add API calls
+Part of the Institutional Trading Intelligence System
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Quiet-market poll ceiling per DynamicThresholdEngine liquidity tier (seconds)
+TIER_POLL_INTERVALS = {
+    'TIER_1': 300,
+    'TIER_2': 420,
+    'TIER_3': 600,
+    'MICRO_CAP': 600,
+}
+
+# REST requests one bulk poll costs each exchange on the market-data service:
+# (all-instrument listings per poll, requests per symbol). Binance has no
+# all-symbol open interest endpoint, so every symbol costs its USDT, USDC and
+# coin-margined openInterest calls.
+EXCHANGE_REQUEST_COSTS = {
+    'binance': (4, 3),
+    'bybit': (2, 0),
+    'okx': (3, 0),
+    'gateio': (2, 0),
+    'bitget': (2, 0),
+    'hyperliquid': (1, 0),
+}
+
+# symbol -> liquidation activity relative to its cascade threshold (1.0 = at threshold)
+LiquidationActivity = Callable[[str], float]
+
+
+@dataclass
+class SymbolSchedule:
+    """Poll state for one symbol"""
+    interval: float                 # Current (backed-off) interval in seconds
+    last_poll: float = 0.0          # Monotonic time of the last poll (0 = never)
+    retry_at: float = 0.0           # No poll before this after a failed one
+    velocity: float = 0.0           # Peak OI velocity in %/min, decaying
+    velocity_at: float = 0.0
+    tier: Optional[str] = None
+
+
+class OIPollScheduler:
+    """
+    Chooses which symbols the next bulk OI poll covers
+
+    A quiet symbol is polled at its tier ceiling (`baseline_interval` when the
+    tier is unknown, never less). Its heat - the larger of OI velocity /
+    `fast_velocity_pct` and liquidation activity - pulls the interval
+    linearly towards `min_interval`, reaching it at heat 1; once the heat is
+    gone the interval grows back x1.5 per poll. Heat is re-read on every
+    tick, so a symbol whose OI starts moving on a push feed, or that starts
+    liquidating, becomes due at once rather than at its next scheduled poll.
+
+    A poll takes every due symbol plus every symbol that would fall due
+    before the poll after it, so quiet symbols share one bulk request per
+    cycle. Per `baseline_interval`, each exchange may spend
+    `budget_multiplier` times the per-symbol requests of one bulk poll of
+    all symbols, and at least enough for one symbol to poll at
+    `min_interval` on top: a quiet market spends exactly what the fixed
+    cadence did, and the remainder is what hot symbols can use to poll
+    faster. Listing requests do not grow with the symbol count, so they are
+    budgeted apart: a poll is charged a listing only when the shared ticker
+    snapshot is older than `listing_ttl`, and listings may be refetched at
+    most once per `min_interval` on average.
+    """
+
+    def __init__(self, symbols: Iterable[str], min_interval: float = 30.0, max_interval: float = 600.0,
+                 baseline_interval: float = 300.0, budget_multiplier: float = 2.0,
+                 fast_velocity_pct: float = 0.5, velocity_half_life: float = 120.0,
+                 listing_ttl: float = 10.0,
+                 tier_intervals: Optional[Dict[str, float]] = None,
+                 request_costs: Optional[Dict[str, Tuple[int, int]]] = None,
+                 liquidation_activity: Optional[LiquidationActivity] = None):
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, baseline_interval)
+        self.baseline_interval = baseline_interval
+        self.fast_velocity_pct = fast_velocity_pct
+        self.velocity_half_life = velocity_half_life
+        self.listing_ttl = listing_ttl
+        self.tier_intervals = tier_intervals or TIER_POLL_INTERVALS
+        self.request_costs = request_costs or EXCHANGE_REQUEST_COSTS
+        self.liquidation_activity = liquidation_activity
+
+        self.schedules: Dict[str, SymbolSchedule] = {
+            symbol: SymbolSchedule(interval=self.max_interval) for symbol in symbols
+        }
+        # Per baseline interval: the per-symbol requests of one bulk poll of every symbol, times the
+        # multiplier, and never less than one extra symbol polled every min_interval on top
+        extra_polls = max((budget_multiplier - 1) * len(self.schedules), self.baseline_interval / self.min_interval)
+        self.request_budgets = {
+            exchange: per_symbol * (len(self.schedules) + extra_polls)
+            for exchange, (_, per_symbol) in self.request_costs.items()
+        }
+        # Per baseline interval: one listing refetch per minimum interval
+        self.listing_budgets = {
+            exchange: listings * max(self.baseline_interval / self.min_interval, 1.0)
+            for exchange, (listings, _) in self.request_costs.items()
+        }
+        # exchange -> (monotonic time, requests) spent in the last baseline interval
+        self.spent: Dict[str, Deque[Tuple[float, int]]] = {exchange: deque() for exchange in self.request_costs}
+        self.listing_spent: Dict[str, Deque[Tuple[float, int]]] = {exchange: deque() for exchange in self.request_costs}
+        # exchange -> monotonic time its listings were last charged (the snapshot's age)
+        self.listing_fetched_at: Dict[str, float] = {}
+        self.stats = {'polls': 0, 'symbols_polled': 0, 'deferred': 0, 'budget_waits': 0}
+
+    def set_tier(self, symbol: str, tier: Optional[str]):
+        schedule = self.schedules.get(symbol)
+        if schedule is not None:
+            schedule.tier = tier
+
+    def observe_velocity(self, symbol: str, pct_per_min: float, now: Optional[float] = None):
+        """Record an OI velocity sample (any exchange, polled or streamed)"""
+        schedule = self.schedules.get(symbol)
+        if schedule is None:
+            return
+        now = time.monotonic() if now is None else now
+        if pct_per_min >= self._velocity(schedule, now):
+            schedule.velocity = pct_per_min
+            schedule.velocity_at = now
+
+    def _velocity(self, schedule: SymbolSchedule, now: float) -> float:
+        if not schedule.velocity:
+            return 0.0
+        return schedule.velocity * 0.5 ** ((now - schedule.velocity_at) / self.velocity_half_life)
+
+    def heat(self, symbol: str, now: Optional[float] = None) -> float:
+        """How urgently the symbol wants polling (>= 1 means as fast as allowed)"""
+        schedule = self.schedules[symbol]
+        now = time.monotonic() if now is None else now
+        heat = self._velocity(schedule, now) / self.fast_velocity_pct
+        if self.liquidation_activity is not None:
+            try:
+                heat = max(heat, self.liquidation_activity(symbol))
+            except Exception as e:
+                logger.debug(f"Liquidation activity unavailable for {symbol}: {e}")
+        return heat
+
+    def ceiling(self, symbol: str) -> float:
+        """Quiet-market interval for the symbol's liquidity tier"""
+        tier = self.schedules[symbol].tier
+        ceiling = self.tier_intervals.get(tier, self.baseline_interval)
+        return min(max(ceiling, self.baseline_interval), self.max_interval)
+
+    def interval(self, symbol: str, now: Optional[float] = None) -> float:
+        """Interval the symbol is currently polled on"""
+        ceiling = self.ceiling(symbol)
+        heat = min(self.heat(symbol, now), 1.0)
+        target = ceiling - (ceiling - self.min_interval) * heat
+        return max(min(self.schedules[symbol].interval, target), self.min_interval)
+
+    def due_at(self, symbol: str, now: Optional[float] = None) -> float:
+        schedule = self.schedules[symbol]
+        if not schedule.last_poll:
+            return schedule.retry_at
+        return max(schedule.last_poll + self.interval(symbol, now), schedule.retry_at)
+
+    def next_poll(self, now: Optional[float] = None) -> List[str]:
+        """
+        Symbols to poll now, hottest first, trimmed to the request budgets
+
+        Besides the due symbols, every symbol due before the next poll (one
+        shortest due interval from now) rides along. The returned symbols'
+        requests are charged to the budgets; due symbols left out stay due
+        and are picked up by a later tick.
+        """
+        now = time.monotonic() if now is None else now
+        due_times = {symbol: self.due_at(symbol, now) for symbol in self.schedules}
+        due = [symbol for symbol, due_at in due_times.items() if due_at <= now]
+        if not due:
+            return []
+
+        next_poll_at = now + min(self.interval(symbol, now) for symbol in due)
+        ride_along = [symbol for symbol, due_at in due_times.items() if now < due_at <= next_poll_at]
+        due.sort(key=lambda symbol: self.heat(symbol, now), reverse=True)
+        ride_along.sort(key=lambda symbol: due_times[symbol])
+
+        # Listings to refetch because the exchange's snapshot has expired
+        listings = {exchange: listings if self._listing_expired(exchange, now) else 0
+                    for exchange, (listings, _) in self.request_costs.items()}
+        if any(listings[exchange] > self.listing_budgets[exchange] - self._spent(self.listing_spent[exchange], now)
+               for exchange in self.request_costs):
+            self.stats['budget_waits'] += 1
+            return []
+
+        available = {exchange: self.request_budgets[exchange] - self._spent(self.spent[exchange], now)
+                     for exchange in self.request_costs}
+        selected = []
+        for symbol in due + ride_along:
+            if self._fits(len(selected) + 1, available):
+                selected.append(symbol)
+            elif symbol in due:
+                self.stats['deferred'] += 1
+
+        if not selected:
+            self.stats['budget_waits'] += 1
+            return []
+
+        for exchange, (_, per_symbol) in self.request_costs.items():
+            if per_symbol:
+                self.spent[exchange].append((now, per_symbol * len(selected)))
+            if listings[exchange]:
+                self.listing_spent[exchange].append((now, listings[exchange]))
+                self.listing_fetched_at[exchange] = now
+        self.stats['polls'] += 1
+        self.stats['symbols_polled'] += len(selected)
+        return selected
+
+    def _fits(self, symbol_count: int, available: Dict[str, float]) -> bool:
+        return all(per_symbol * symbol_count <= available[exchange]
+                   for exchange, (_, per_symbol) in self.request_costs.items())
+
+    def _listing_expired(self, exchange: str, now: float) -> bool:
+        fetched_at = self.listing_fetched_at.get(exchange)
+        return fetched_at is None or now - fetched_at >= self.listing_ttl
+
+    def _spent(self, spent: Deque[Tuple[float, int]], now: float) -> int:
+        while spent and spent[0][0] <= now - self.baseline_interval:
+            spent.popleft()
+        return sum(requests for _, requests in spent)
+
+    def record_poll(self, symbols: Iterable[str], now: Optional[float] = None):
+        """The symbols were polled successfully: back their quiet interval off"""
+        now = time.monotonic() if now is None else now
+        for symbol in symbols:
+            schedule = self.schedules[symbol]
+            if schedule.last_poll:
+                schedule.interval = min(self.interval(symbol, now) * 1.5, self.ceiling(symbol))
+            schedule.last_poll = now
+
+    def record_failure(self, symbols: Iterable[str], now: Optional[float] = None):
+        """The poll failed: retry after a doubled interval"""
+        now = time.monotonic() if now is None else now
+        for symbol in symbols:
+            schedule = self.schedules[symbol]
+            schedule.interval = min(schedule.interval * 2, self.max_interval)
+            schedule.retry_at = now + schedule.interval
+
+    def seconds_until_due(self, now: Optional[float] = None) -> float:
+        """Time until the earliest symbol is due (0 if one is due now)"""
+        now = time.monotonic() if now is None else now
+        if not self.schedules:
+            return self.max_interval
+        return max(min(self.due_at(symbol, now) for symbol in self.schedules) - now, 0.0)
+
+    def get_status(self) -> dict:
+        now = time.monotonic()
+        return {
+            'symbols': {
+                symbol: {
+                    'interval': round(self.interval(symbol, now), 1),
+                    'heat': round(self.heat(symbol, now), 2),
+                    'tier': schedule.tier,
+                    'due_in': round(max(self.due_at(symbol, now) - now, 0.0), 1)
+                }
+                for symbol, schedule in self.schedules.items()
+            },
+            'requests_per_baseline_interval': {
+                exchange: {
+                    'spent': self._spent(self.spent[exchange], now),
+                    'budget': self.request_budgets[exchange],
+                    'listings_spent': self._spent(self.listing_spent[exchange], now),
+                    'listings_budget': self.listing_budgets[exchange]
+                }
+                for exchange in self.spent
+            },
+            **self.stats
+        }
@@ -0,0 +1,426 @@
+"""
+Streaming OI Collector - push feeds with adaptive REST fallback
+Bybit `tickers` topics and OKX `open-interest`/`tickers` channels give
+sub-minute exchange OI; every other exchange (and any feed that goes quiet)
+is covered by bulk REST polls scheduled per symbol by an OIPollScheduler
+Part of the Institutional Trading Intelligence System
+"""
+
+import asyncio
+import json
+import time
+import websockets
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+from shared.intelligence.oi_poll_scheduler import OIPollScheduler
+
+logger = logging.getLogger(__name__)
+
+# (symbol, exchange, oi_usd, unix timestamp) for one exchange-wide OI sample
+OISink = Callable[[str, str, float, int], Awaitable[None]]
+
+# symbols -> {symbol: {exchange: /multi_oi exchange_breakdown entry}}, None on failure
+OIPoll = Callable[[List[str]], Awaitable[Optional[Dict[str, Dict[str, Dict]]]]]
+
+
+class OIPushFeed(ABC):
+    """
+    One exchange websocket carrying per-market OI updates
+
+    Subclasses build the subscribe/ping frames and turn messages into
+    (market symbol, oi_usd) pairs. The socket reconnects with backoff and is
+    restarted whenever its market set changes.
+    """
+
+    exchange = ''
+    subscribe_batch = 10
+    ping_interval = 20
+
+    def __init__(self, collector: 'OIStreamCollector', url: str):
+        self.collector = collector
+        self.url = url
+        self.markets: Set[str] = set()
+        self.task: Optional[asyncio.Task] = None
+        self.connected = False
+        self.messages_received = 0
+        self.reconnects = 0
+
+    def set_markets(self, markets: Set[str]):
+        """Replace the subscribed markets, reconnecting if they changed"""
+        if markets == self.markets:
+            return
+        self.markets = set(markets)
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+        self.task = asyncio.create_task(self._run()) if self.markets and self.collector.running else None
+
+    async def stop(self):
+        if self.task and not self.task.done():
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+        self.task = None
+
+    @abstractmethod
+    def subscribe_frames(self, markets: List[str]) -> Iterable[str]:
+        """Frames subscribing to the markets' OI updates"""
+        pass
+
+    @abstractmethod
+    def ping_frame(self) -> str:
+        """Application-level keepalive frame"""
+        pass
+
+    @abstractmethod
+    def handle(self, message) -> Iterable[Tuple[str, float]]:
+        """(market symbol, oi_usd) updates carried by one message"""
+        pass
+
+    async def _heartbeat(self, websocket):
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            await websocket.send(self.ping_frame())
+
+    async def _run(self):
+        collector = self.collector
+        retry_count = 0
+        while collector.running and self.markets:
+            heartbeat = None
+            try:
+                async with websockets.connect(self.url, ping_interval=None) as websocket:
+                    markets = sorted(self.markets)
+                    for frame in self.subscribe_frames(markets):
+                        await websocket.send(frame)
+                    self.connected = True
+                    retry_count = 0
+                    logger.info(f"{self.exchange} OI stream connected ({len(markets)} markets)")
+                    heartbeat = asyncio.create_task(self._heartbeat(websocket))
+
+                    async for message in websocket:
+                        self.messages_received += 1
+                        try:
+                            updates = list(self.handle(message))
+                        except (ValueError, KeyError, TypeError) as e:
+                            logger.debug(f"{self.exchange} OI stream message skipped: {e}")
+                            continue
+                        for market, oi_usd in updates:
+                            await collector.on_market_oi(self.exchange, market, oi_usd)
+
+            except asyncio.CancelledError:
+                raise
+            except websockets.exceptions.ConnectionClosed:
+                logger.warning(f"{self.exchange} OI stream closed")
+            except Exception as e:
+                logger.error(f"{self.exchange} OI stream error: {e}")
+            finally:
+                self.connected = False
+                if heartbeat is not None:
+                    heartbeat.cancel()
+
+            if collector.running and self.markets:
+                delay = collector.reconnect_delays[min(retry_count, len(collector.reconnect_delays) - 1)]
+                logger.info(f"Reconnecting {self.exchange} OI stream in {delay}s...")
+                await asyncio.sleep(delay)
+                retry_count += 1
+                self.reconnects += 1
+
+
+class BybitOIFeed(OIPushFeed):
+    """
+    Bybit V5 public `tickers.{symbol}` topics for one category
+
+    Ticker pushes are a snapshot followed by deltas carrying only changed
+    fields, so rows are merged per symbol. OI USD matches the REST provider:
+    linear openInterest (coins) x lastPrice; inverse openInterest is already
+    USD contracts.
+    """
+
+    exchange = 'bybit'
+
+    def __init__(self, collector: 'OIStreamCollector', category: str):
+        super().__init__(collector, f"wss://stream.bybit.com/v5/public/{category}")
+        self.category = category
+        self.tickers: Dict[str, Dict] = {}
+
+    def subscribe_frames(self, markets: List[str]) -> Iterable[str]:
+        self.tickers.clear()
+        for i in range(0, len(markets), self.subscribe_batch):
+            args = [f"tickers.{market}" for market in markets[i:i + self.subscribe_batch]]
+            yield json.dumps({'op': 'subscribe', 'args': args})
+
+    def ping_frame(self) -> str:
+        return json.dumps({'op': 'ping'})
+
+    def handle(self, message) -> Iterable[Tuple[str, float]]:
+        payload = json.loads(message)
+        topic = payload.get('topic', '')
+        if not topic.startswith('tickers.'):
+            if payload.get('success') is False:
+                logger.warning(f"Bybit {self.category} subscribe failed: {payload.get('ret_msg')}")
+            return ()
+
+        data = payload['data']
+        market = data.get('symbol') or topic[len('tickers.'):]
+        if payload.get('type') == 'snapshot':
+            ticker = self.tickers[market] = dict(data)
+        else:
+            ticker = self.tickers.setdefault(market, {})
+            ticker.update(data)
+
+        if 'openInterest' not in ticker:
+            return ()
+        open_interest = float(ticker['openInterest'])
+        if self.category == 'inverse':
+            return ((market, open_interest),)
+        if 'lastPrice' not in ticker:
+            return ()
+        return ((market, open_interest * float(ticker['lastPrice'])),)
+
+
+class OKXOIFeed(OIPushFeed):
+    """
+    OKX V5 public `open-interest` + `tickers` channels per SWAP instrument
+
+    OI USD matches the REST provider: oiCcy (base coins) x the last trade price.
+    """
+
+    exchange = 'okx'
+
+    def __init__(self, collector: 'OIStreamCollector'):
+        super().__init__(collector, 'wss://ws.okx.com:8443/ws/v5/public')
+        self.oi_ccy: Dict[str, float] = {}
+        self.last_price: Dict[str, float] = {}
+
+    def subscribe_frames(self, markets: List[str]) -> Iterable[str]:
+        args = [{'channel': channel, 'instId': market}
+                for market in markets for channel in ('open-interest', 'tickers')]
+        for i in range(0, len(args), self.subscribe_batch * 2):
+            yield json.dumps({'op': 'subscribe', 'args': args[i:i + self.subscribe_batch * 2]})
+
+    def ping_frame(self) -> str:
+        return 'ping'
+
+    def handle(self, message) -> Iterable[Tuple[str, float]]:
+        if message == 'pong':
+            return ()
+        payload = json.loads(message)
+        if payload.get('event') == 'error':
+            logger.warning(f"OKX subscribe failed: {payload.get('msg')}")
+            return ()
+        channel = payload.get('arg', {}).get('channel')
+        if channel not in ('open-interest', 'tickers') or 'data' not in payload:
+            return ()
+
+        updates = []
+        for row in payload['data']:
+            market = row['instId']
+            if channel == 'open-interest':
+                self.oi_ccy[market] = float(row['oiCcy'])
+            else:
+                self.last_price[market] = float(row['last'])
+            if market in self.oi_ccy and market in self.last_price:
+                updates.append((market, self.oi_ccy[market] * self.last_price[market]))
+        return updates
+
+
+class OIStreamCollector:
+    """
+    Exchange-wide OI per symbol from push feeds, REST-polled where no feed is fresh
+
+    The bulk poll is also market discovery: the per-market breakdown it
+    returns decides which Bybit/OKX contracts are streamed, so a streamed
+    exchange total always covers the same markets as the polled one and
+    switching source never shows up as an OI jump. A streamed (symbol,
+    exchange) total is emitted once all of its markets have reported, at
+    most every `emit_interval` seconds. Which symbols each poll covers is
+    decided by `scheduler` (built from the interval arguments if not given),
+    fed with the OI velocity of every emitted sample - so a move seen on a
+    push feed brings the symbol's REST poll forward for the other exchanges.
+    """
+
+    STREAMED_EXCHANGES = ('bybit', 'okx')
+
+    def __init__(self, symbols: List[str], sink: OISink, poll: OIPoll,
+                 emit_interval: float = 15.0, stale_after: float = 60.0,
+                 min_poll_interval: float = 30.0, max_poll_interval: float = 600.0,
+                 fast_velocity_pct: float = 0.5, streaming: bool = True,
+                 scheduler: Optional[OIPollScheduler] = None):
+        self.symbols = list(symbols)
+        self.sink = sink
+        self.poll = poll
+        self.emit_interval = emit_interval
+        self.stale_after = stale_after
+        self.scheduler = scheduler or OIPollScheduler(
+            self.symbols,
+            min_interval=min_poll_interval,
+            max_interval=max_poll_interval,
+            fast_velocity_pct=fast_velocity_pct
+        )
+        self.reconnect_delays = [1, 2, 4, 8, 16, 30, 60]
+        self.running = False
+
+        self.feeds: Dict[str, OIPushFeed] = {}
+        if streaming:
+            self.feeds = {
+                'bybit:linear': BybitOIFeed(self, 'linear'),
+                'bybit:inverse': BybitOIFeed(self, 'inverse'),
+                'okx': OKXOIFeed(self),
+            }
+
+        # (exchange, symbol) -> streamed market symbols; (exchange, market) -> symbol
+        self.symbol_markets: Dict[Tuple[str, str], Set[str]] = {}
+        self.market_symbol: Dict[Tuple[str, str], str] = {}
+        self.market_types: Dict[Tuple[str, str], Optional[str]] = {}
+        # (exchange, market) -> (oi_usd, monotonic time of the update)
+        self.market_oi: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        # (symbol, exchange) -> last emitted (oi_usd, unix time)
+        self.last_emit: Dict[Tuple[str, str], Tuple[float, float]] = {}
+
+        self.stats = {'streamed': 0, 'polled': 0, 'polls': 0, 'poll_failures': 0}
+
+    async def run(self):
+        """Poll (and stream) until stop() is called"""
+        self.running = True
+        try:
+            while self.running:
+                symbols = self.scheduler.next_poll()
+                if symbols:
+                    await self._poll_once(symbols)
+                # Wake at least every emit interval so newly hot symbols are noticed
+                wait = self.scheduler.seconds_until_due()
+                await asyncio.sleep(min(max(wait, 1.0), self.emit_interval))
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        self.running = False
+        for feed in self.feeds.values():
+            await feed.stop()
+
+    async def _poll_once(self, symbols: List[str]):
+        self.stats['polls'] += 1
+        try:
+            data = await self.poll(symbols)
+        except Exception as e:
+            logger.error(f"OI poll error: {e}")
+            data = None
+
+        if data is None:
+            self.stats['poll_failures'] += 1
+            self.scheduler.record_failure(symbols)
+            return
+
+        self._discover_markets(data)
+
+        timestamp = int(time.time())
+        for symbol, exchanges in data.items():
+            for exchange, entry in exchanges.items():
+                if not isinstance(entry, dict) or 'oi_usd' not in entry:
+                    continue
+                if self._stream_fresh(exchange, symbol):
+                    continue  # The push feed is the source for this series
+                await self._emit(symbol, exchange, float(entry['oi_usd']), timestamp)
+                self.stats['polled'] += 1
+
+        self.scheduler.record_poll([symbol for symbol in symbols if symbol in data])
+        self.scheduler.record_failure([symbol for symbol in symbols if symbol not in data])
+
+    def _discover_markets(self, data: Dict[str, Dict[str, Dict]]):
+        """Point the push feeds at the markets the poll reported for streamed exchanges"""
+        if not self.feeds:
+            return
+
+        # A poll covers only the due symbols; the rest keep their known markets
+        for symbol, exchanges in data.items():
+            for exchange in self.STREAMED_EXCHANGES:
+                for market in self.symbol_markets.pop((exchange, symbol), ()):
+                    self.market_symbol.pop((exchange, market), None)
+                entry = exchanges.get(exchange)
+                if not isinstance(entry, dict):
+                    continue
+                markets = set()
+                for market in entry.get('market_breakdown', []):
+                    market_symbol = market['symbol']
+                    self.market_types[(exchange, market_symbol)] = market.get('type')
+                    markets.add(market_symbol)
+                    self.market_symbol[(exchange, market_symbol)] = symbol
+                self.symbol_markets[(exchange, symbol)] = markets
+
+        feed_markets: Dict[str, Set[str]] = {name: set() for name in self.feeds}
+        for (exchange, _), markets in self.symbol_markets.items():
+            for market in markets:
+                if exchange == 'bybit':
+                    inverse = self.market_types.get((exchange, market)) == 'USD'
+                    feed_markets['bybit:inverse' if inverse else 'bybit:linear'].add(market)
+                else:
+                    feed_markets['okx'].add(market)
+
+        for name, feed in self.feeds.items():
+            feed.set_markets(feed_markets[name])
+
+    def _stream_fresh(self, exchange: str, symbol: str) -> bool:
+        """True when every market of the series has a recent push update"""
+        markets = self.symbol_markets.get((exchange, symbol))
+        if not markets or not self.feeds:
+            return False
+        now = time.monotonic()
+        for market in markets:
+            value = self.market_oi.get((exchange, market))
+            if value is None or now - value[1] > self.stale_after:
+                return False
+        return True
+
+    async def on_market_oi(self, exchange: str, market: str, oi_usd: float):
+        """Push-feed update for one market; emits the exchange total when due"""
+        now = time.monotonic()
+        self.market_oi[(exchange, market)] = (oi_usd, now)
+
+        symbol = self.market_symbol.get((exchange, market))
+        if symbol is None:
+            return
+        last = self.last_emit.get((symbol, exchange))
+        timestamp = time.time()
+        if last is not None and timestamp - last[1] < self.emit_interval:
+            return
+
+        total = 0.0
+        for symbol_market in self.symbol_markets.get((exchange, symbol), ()):
+            value = self.market_oi.get((exchange, symbol_market))
+            if value is None or now - value[1] > self.stale_after:
+                return  # Partial totals would read as an OI jump
+            total += value[0]
+
+        await self._emit(symbol, exchange, total, int(timestamp))
+        self.stats['streamed'] += 1
+
+    async def _emit(self, symbol: str, exchange: str, oi_usd: float, timestamp: int):
+        key = (symbol, exchange)
+        last = self.last_emit.get(key)
+        if last is not None and last[0] > 0 and timestamp > last[1]:
+            minutes = (timestamp - last[1]) / 60
+            self.scheduler.observe_velocity(symbol, abs(oi_usd - last[0]) / last[0] * 100 / minutes)
+        self.last_emit[key] = (oi_usd, timestamp)
+
+        try:
+            await self.sink(symbol, exchange, oi_usd, timestamp)
+        except Exception as e:
+            logger.error(f"OI sink error for {symbol}/{exchange}: {e}")
+
+    def get_status(self) -> dict:
+        return {
+            'scheduler': self.scheduler.get_status(),
+            'streams': {
+                name: {
+                    'connected': feed.connected,
+                    'markets': len(feed.markets),
+                    'messages_received': feed.messages_received,
+                    'reconnects': feed.reconnects
+                }
+                for name, feed in self.feeds.items()
+            },
+            **self.stats
+        }
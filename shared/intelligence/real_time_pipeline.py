@@ -5,35 +5,59 @@ Part of the Institutional Trading Intelligence System
 """
 
 import asyncio
-import websockets
-import json
-from typing import Dict, List, Callable, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Callable, NamedTuple, Optional, Set
 from datetime import datetime, timedelta
 import logging
 from collections import deque
 import aiohttp
 from abc import ABC, abstractmethod
 
+try:
+    from .stream_multiplexer import CombinedStreamMultiplexer
+    from .ingestion_queue import ShardedIngestionQueue, DROP_OLDEST
+    from .message_decoder import get_decoder
+    from .dynamic_thresholds import ThresholdSnapshotCache
+except ImportError:
+    from stream_multiplexer import CombinedStreamMultiplexer
+    from ingestion_queue import ShardedIngestionQueue, DROP_OLDEST
+    from message_decoder import get_decoder
+    from dynamic_thresholds import ThresholdSnapshotCache
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class TradeEvent:
+# Compact side encodings (small ints instead of strings on the hot path)
+SIDE_BUY = 1     # Trade delta sign: +value for buys
+SIDE_SELL = -1   # -value for sells
+LIQUIDATION_LONG = 1   # Same values as shared.models.compact_liquidation.LiquidationSide
+LIQUIDATION_SHORT = 2
+
+SIDE_NAMES = {SIDE_BUY: 'BUY', SIDE_SELL: 'SELL'}
+LIQUIDATION_SIDE_NAMES = {LIQUIDATION_LONG: 'LONG', LIQUIDATION_SHORT: 'SHORT'}
+
+
+class TradeEvent(NamedTuple):
     """Real-time trade data structure"""
     symbol: str
     price: float
     quantity: float
     value_usd: float
-    side: str  # 'BUY' or 'SELL'
+    side: int  # SIDE_BUY or SIDE_SELL
     is_whale: bool
-    timestamp: datetime
+    timestamp_ms: int  # Exchange trade time, epoch milliseconds
     exchange: str
-    trade_id: str
+    trade_id: int
+    
+    @property
+    def side_name(self) -> str:
+        return SIDE_NAMES[self.side]
+    
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ms / 1000)
 
 
-@dataclass  
-class OrderBookSnapshot:
+class OrderBookSnapshot(NamedTuple):
     """Order book pressure data"""
     symbol: str
     bid_volume_usd: float
@@ -42,21 +66,32 @@ class OrderBookSnapshot:
     spread_bps: float
     best_bid: float
     best_ask: float
-    timestamp: datetime
+    timestamp_ms: int  # Exchange event time, epoch milliseconds
+    
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ms / 1000)
 
 
-@dataclass
-class LiquidationEvent:
+class LiquidationEvent(NamedTuple):
     """Enhanced liquidation event"""
     symbol: str
-    side: str
+    side: int  # LIQUIDATION_LONG or LIQUIDATION_SHORT
     price: float
     quantity: float
     value_usd: float
-    timestamp: datetime
+    timestamp_ms: int  # Exchange trade time, epoch milliseconds
     exchange: str
     estimated_leverage: Optional[float] = None
     cascade_potential: Optional[str] = None  # 'LOW', 'MEDIUM', 'HIGH'
+    
+    @property
+    def side_name(self) -> str:
+        return LIQUIDATION_SIDE_NAMES[self.side]
+    
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ms / 1000)
 
 
 class StreamProcessor(ABC):
@@ -78,6 +113,83 @@ class StreamProcessor(ABC):
         pass
 
 
+class RollingTradeWindow:
+    """
+    Time-bucketed rolling trade window with running sums
+    
+    Trades are folded into fixed-width buckets (duration / num_buckets) held in
+    a deque; buckets that fall out of the window are evicted from the left and
+    subtracted from the running totals, so each trade costs O(1) amortized
+    instead of a rebuild and re-sum of the whole window. Eviction happens at
+    bucket granularity, and the window clock is the newest trade timestamp.
+    """
+    
+    def __init__(self, duration: timedelta, num_buckets: int = 60):
+        self.duration = duration
+        self.bucket_ms = max(1, int(duration.total_seconds() * 1000) // num_buckets)
+        self.num_buckets = num_buckets
+        # Each bucket: [bucket_index, volume_usd, buy_volume_usd, whale_volume_usd, trade_count]
+        self.buckets: deque = deque()
+        self.volume_usd = 0.0
+        self.buy_volume_usd = 0.0
+        self.whale_volume_usd = 0.0
+        self.trade_count = 0
+    
+    def add(self, timestamp_ms: int, value_usd: float, is_buy: bool, is_whale: bool):
+        """Add one trade and evict buckets that have left the window"""
+        index = timestamp_ms // self.bucket_ms
+        buckets = self.buckets
+        
+        if buckets and buckets[-1][0] >= index:
+            # Same bucket (or a slightly late trade) - fold into the newest bucket
+            bucket = buckets[-1]
+        else:
+            bucket = [index, 0.0, 0.0, 0.0, 0]
+            buckets.append(bucket)
+            self._evict(index)
+        
+        bucket[1] += value_usd
+        bucket[4] += 1
+        self.volume_usd += value_usd
+        self.trade_count += 1
+        if is_buy:
+            bucket[2] += value_usd
+            self.buy_volume_usd += value_usd
+        if is_whale:
+            bucket[3] += value_usd
+            self.whale_volume_usd += value_usd
+    
+    def _evict(self, current_index: int):
+        oldest_allowed = current_index - self.num_buckets + 1
+        buckets = self.buckets
+        while buckets and buckets[0][0] < oldest_allowed:
+            _, volume, buy_volume, whale_volume, count = buckets.popleft()
+            self.volume_usd -= volume
+            self.buy_volume_usd -= buy_volume
+            self.whale_volume_usd -= whale_volume
+            self.trade_count -= count
+        
+        if not buckets:
+            # Reset to exact zero so float drift cannot accumulate across idle gaps
+            self.volume_usd = self.buy_volume_usd = self.whale_volume_usd = 0.0
+            self.trade_count = 0
+    
+    @property
+    def sell_volume_usd(self) -> float:
+        return self.volume_usd - self.buy_volume_usd
+    
+    @property
+    def buy_ratio(self) -> float:
+        return self.buy_volume_usd / self.volume_usd if self.volume_usd > 0 else 0.0
+    
+    @property
+    def whale_share(self) -> float:
+        return self.whale_volume_usd / self.volume_usd if self.volume_usd > 0 else 0.0
+    
+    def __len__(self) -> int:
+        return self.trade_count
+
+
 class VolumeIntelligenceProcessor(StreamProcessor):
     """Real-time volume and delta intelligence processor"""
     
@@ -86,6 +198,8 @@ class VolumeIntelligenceProcessor(StreamProcessor):
         self.volume_windows: Dict[str, Dict] = {}  # symbol -> time windows
         self.delta_accumulators: Dict[str, Dict] = {}  # symbol -> delta tracking
         self.whale_tracker = WhaleActivityTracker()
+        self.threshold_cache = ThresholdSnapshotCache(intelligence_engine) if intelligence_engine else None
+        self._alert_tasks: Set[asyncio.Task] = set()
         
         # Time windows for analysis
         self.time_windows = {
@@ -133,87 +247,66 @@ class VolumeIntelligenceProcessor(StreamProcessor):
     
     def _initialize_symbol_tracking(self, symbol: str):
         """Initialize tracking structures for a new symbol"""
-        self.volume_windows[symbol] = {}
-        for window_name, duration in self.time_windows.items():
-            self.volume_windows[symbol][window_name] = {
-                'trades': deque(maxlen=10000),
-                'duration': duration,
-                'last_volume': 0,
-                'baseline_volume': 0
-            }
+        self.volume_windows[symbol] = {
+            window_name: RollingTradeWindow(duration)
+            for window_name, duration in self.time_windows.items()
+        }
         
         self.delta_accumulators[symbol] = {
             'running_delta': 0.0,
-            'last_reset': datetime.now(),
-            'delta_history': deque(maxlen=1000),
+            'last_reset_ms': None,  # Trade time of the last session reset (set on first trade)
+            'delta_history': deque(maxlen=1000),  # (timestamp_ms, delta, cumulative, price)
             'session_delta': 0.0
         }
     
     async def _update_volume_tracking(self, symbol: str, trade: TradeEvent):
-        """Update rolling volume windows"""
-        windows = self.volume_windows[symbol]
-        
-        for window_name, window_data in windows.items():
-            # Add trade to window
-            window_data['trades'].append({
-                'value_usd': trade.value_usd,
-                'timestamp': trade.timestamp,
-                'is_whale': trade.is_whale,
-                'side': trade.side,
-                'price': trade.price,
-                'quantity': trade.quantity
-            })
-            
-            # Remove old trades outside window
-            cutoff_time = datetime.now() - window_data['duration']
-            window_data['trades'] = deque([
-                t for t in window_data['trades'] 
-                if t['timestamp'] > cutoff_time
-            ], maxlen=10000)
-            
-            # Update current volume
-            window_data['last_volume'] = sum(
-                t['value_usd'] for t in window_data['trades']
-            )
+        """Update rolling volume windows (O(1) amortized per window)"""
+        timestamp_ms = trade.timestamp_ms
+        value_usd = trade.value_usd
+        is_buy = trade.side == SIDE_BUY
+        is_whale = trade.is_whale
+        
+        for window in self.volume_windows[symbol].values():
+            window.add(timestamp_ms, value_usd, is_buy, is_whale)
     
     async def _update_delta_tracking(self, symbol: str, trade: TradeEvent):
         """Update real-time cumulative delta"""
         accumulator = self.delta_accumulators[symbol]
         
         # Calculate trade delta (positive for buy pressure, negative for sell)
-        trade_delta = trade.value_usd if trade.side == 'BUY' else -trade.value_usd
+        trade_delta = trade.side * trade.value_usd
         
         # Update running delta
         accumulator['running_delta'] += trade_delta
         accumulator['session_delta'] += trade_delta
-        accumulator['delta_history'].append({
-            'delta': trade_delta,
-            'timestamp': trade.timestamp,
-            'cumulative': accumulator['running_delta'],
-            'price': trade.price
-        })
+        accumulator['delta_history'].append(
+            (trade.timestamp_ms, trade_delta, accumulator['running_delta'], trade.price)
+        )
         
         # Reset session delta at session boundaries (every 8 hours)
-        if self._should_reset_session_delta(accumulator['last_reset']):
+        if accumulator['last_reset_ms'] is None:
+            accumulator['last_reset_ms'] = trade.timestamp_ms
+        elif self._should_reset_session_delta(accumulator['last_reset_ms'], trade.timestamp_ms):
             accumulator['session_delta'] = 0.0
-            accumulator['last_reset'] = datetime.now()
+            accumulator['last_reset_ms'] = trade.timestamp_ms
     
     async def _check_volume_alerts(self, symbol: str):
         """Check if volume spike thresholds are exceeded"""
         try:
-            if not self.intelligence_engine:
+            if not self.threshold_cache:
                 return
             
-            # Get dynamic thresholds
-            thresholds = await self.intelligence_engine.calculate_volume_threshold(symbol)
-            windows = self.volume_windows[symbol]
-            
             # Check 15-minute window for spikes
-            window_15m = windows.get('15m')
-            if not window_15m or len(window_15m['trades']) < 10:
+            window_15m = self.volume_windows[symbol].get('15m')
+            if not window_15m or window_15m.trade_count < 10:
                 return
             
-            current_volume = window_15m['last_volume']
+            # Dynamic thresholds from the precomputed snapshot (no I/O on the trade path)
+            thresholds = self.threshold_cache.get(symbol)
+            if thresholds is None:
+                return  # Queued for the next background refresh
+            
+            current_volume = window_15m.volume_usd
             baseline_volume = await self._get_baseline_volume(symbol, '15m')
             
             if baseline_volume > 0:
@@ -239,29 +332,25 @@ class VolumeIntelligenceProcessor(StreamProcessor):
                     'baseline_volume_usd': baseline_volume,
                     'timeframe': '15m',
                     'timestamp': datetime.now(),
-                    'dominant_side': self._calculate_dominant_side(window_15m['trades']),
-                    'whale_participation': self._calculate_whale_participation(window_15m['trades'])
+                    'dominant_side': self._calculate_dominant_side(window_15m),
+                    'whale_participation': self._calculate_whale_participation(window_15m)
                 }
                 
-                # Send alert through intelligence engine
+                # Send alert through intelligence engine without blocking trade processing
                 if hasattr(self.intelligence_engine, 'send_alert'):
-                    await self.intelligence_engine.send_alert(alert_data)
+                    task = asyncio.create_task(self.intelligence_engine.send_alert(alert_data))
+                    self._alert_tasks.add(task)
+                    task.add_done_callback(self._alert_tasks.discard)
                     
         except Exception as e:
             logger.error(f"Error checking volume alerts for {symbol}: {e}")
     
-    def _calculate_dominant_side(self, trades: deque) -> str:
+    def _calculate_dominant_side(self, window: 'RollingTradeWindow') -> str:
         """Calculate dominant trading side"""
-        if not trades:
-            return 'NEUTRAL'
-        
-        buy_volume = sum(t['value_usd'] for t in trades if t['side'] == 'BUY')
-        total_volume = sum(t['value_usd'] for t in trades)
-        
-        if total_volume == 0:
+        if window.volume_usd <= 0:
             return 'NEUTRAL'
         
-        buy_ratio = buy_volume / total_volume
+        buy_ratio = window.buy_ratio
         if buy_ratio > 0.6:
             return 'BUY_PRESSURE'
         elif buy_ratio < 0.4:
@@ -269,15 +358,9 @@ class VolumeIntelligenceProcessor(StreamProcessor):
         else:
             return 'BALANCED'
     
-    def _calculate_whale_participation(self, trades: deque) -> float:
+    def _calculate_whale_participation(self, window: 'RollingTradeWindow') -> float:
         """Calculate whale participation percentage"""
-        if not trades:
-            return 0.0
-        
-        whale_volume = sum(t['value_usd'] for t in trades if t.get('is_whale', False))
-        total_volume = sum(t['value_usd'] for t in trades)
-        
-        return whale_volume / total_volume if total_volume > 0 else 0.0
+        return window.whale_share
     
     async def _get_baseline_volume(self, symbol: str, timeframe: str) -> float:
         """Get baseline volume for comparison (7-day average)"""
@@ -287,13 +370,12 @@ class VolumeIntelligenceProcessor(StreamProcessor):
             return 0.0
         
         # Rough baseline estimation (would be replaced with historical data)
-        recent_volume = current_window['last_volume']
+        recent_volume = current_window.volume_usd
         return recent_volume * 0.4  # Assume current is 250% of baseline
     
-    def _should_reset_session_delta(self, last_reset: datetime) -> bool:
+    def _should_reset_session_delta(self, last_reset_ms: int, now_ms: int) -> bool:
         """Check if session delta should be reset"""
-        hours_elapsed = (datetime.now() - last_reset).total_seconds() / 3600
-        return hours_elapsed >= 8  # Reset every 8 hours
+        return now_ms - last_reset_ms >= 8 * 3600 * 1000  # Reset every 8 hours
     
     async def get_status(self) -> dict:
         """Get processor status"""
@@ -302,6 +384,7 @@ class VolumeIntelligenceProcessor(StreamProcessor):
             'processor_type': 'volume_intelligence',
             'symbols_tracked': len(self.volume_windows),
             'trades_processed': self.processed_count,
+            'threshold_cache': self.threshold_cache.get_status() if self.threshold_cache else None,
             'uptime_seconds': uptime.total_seconds(),
             'processing_rate': self.processed_count / uptime.total_seconds() if uptime.total_seconds() > 0 else 0
         }
@@ -329,265 +412,162 @@ class WhaleActivityTracker:
                 'last_update': datetime.now()
             }
         
-        # Add trade to history
-        self.whale_trades[symbol].append({
-            'value_usd': trade.value_usd,
-            'side': trade.side,
-            'price': trade.price,
-            'timestamp': trade.timestamp
-        })
+        # Add trade to history (the immutable event itself, no copy)
+        self.whale_trades[symbol].append(trade)
         
         # Update summary stats
-        await self._update_whale_summary(symbol)
+        await self._update_whale_summary(symbol, trade.timestamp_ms)
     
-    async def _update_whale_summary(self, symbol: str):
+    async def _update_whale_summary(self, symbol: str, now_ms: int):
         """Update 24h whale summary for a symbol"""
-        cutoff_time = datetime.now() - timedelta(hours=24)
+        cutoff_ms = now_ms - 24 * 3600 * 1000
         recent_trades = [
             trade for trade in self.whale_trades[symbol]
-            if trade['timestamp'] > cutoff_time
+            if trade.timestamp_ms > cutoff_ms
         ]
         
         if not recent_trades:
             return
         
         summary = self.whale_summary[symbol]
-        summary['total_volume_24h'] = sum(t['value_usd'] for t in recent_trades)
-        summary['buy_volume_24h'] = sum(t['value_usd'] for t in recent_trades if t['side'] == 'BUY')
-        summary['sell_volume_24h'] = sum(t['value_usd'] for t in recent_trades if t['side'] == 'SELL')
+        summary['total_volume_24h'] = sum(t.value_usd for t in recent_trades)
+        summary['buy_volume_24h'] = sum(t.value_usd for t in recent_trades if t.side == SIDE_BUY)
+        summary['sell_volume_24h'] = sum(t.value_usd for t in recent_trades if t.side == SIDE_SELL)
         summary['trade_count_24h'] = len(recent_trades)
-        summary['largest_trade_24h'] = max(t['value_usd'] for t in recent_trades)
+        summary['largest_trade_24h'] = max(t.value_usd for t in recent_trades)
         summary['last_update'] = datetime.now()
 
 
 class RealTimeDataPipeline:
-    """Manages multiple WebSocket streams for real-time intelligence"""
+    """Manages multiplexed WebSocket streams for real-time intelligence"""
     
     def __init__(self, intelligence_engine=None):
         self.intelligence_engine = intelligence_engine
-        self.active_streams: Dict[str, asyncio.Task] = {}
+        self.active_streams: Dict[str, str] = {}  # logical name -> Binance stream name
         self.processors: List[StreamProcessor] = []
         self.volume_processor = VolumeIntelligenceProcessor(intelligence_engine)
         
         # Add processors
         self.processors.append(self.volume_processor)
         
-        # Stream configurations
+        # All streams share a few combined-stream connections and one decoder
+        self.decoder = get_decoder()
+        self.multiplexer = CombinedStreamMultiplexer(decoder=self.decoder)
+        
+        # Readers parse and enqueue; per-shard workers drive the processors
+        self.ingestion_queue = ShardedIngestionQueue(self._dispatch_event, num_shards=8,
+                                                     max_queue_size=5000, overflow_policy=DROP_OLDEST)
+        
+        # Market-wide streams
         self.stream_configs = {
-            'binance_trades': 'wss://fstream.binance.com/ws/!ticker@arr',
-            'binance_liquidations': 'wss://fstream.binance.com/ws/!forceOrder@arr',
-            'binance_bookTicker': 'wss://fstream.binance.com/ws/!bookTicker'
+            'liquidations': '!forceOrder@arr',
+            'book_ticker': '!bookTicker'
         }
         
         self.running = False
-        self.reconnect_delays = [1, 2, 4, 8, 16]  # Exponential backoff
-        self.max_reconnect_delay = 60
     
     async def start_comprehensive_monitoring(self, symbols: List[str]):
         """Start all real-time streams for given symbols"""
         logger.info(f"Starting comprehensive monitoring for {len(symbols)} symbols")
         self.running = True
+        self.ingestion_queue.start()
         
-        tasks = []
-        
-        # Start individual symbol streams
-        for symbol in symbols:
-            # Trade stream for volume/delta analysis
-            task = asyncio.create_task(self._start_trade_stream(symbol))
-            self.active_streams[f"{symbol}_trades"] = task
-            tasks.append(task)
+        # Trade streams for volume/delta analysis
+        await self.add_symbols(symbols)
+        if self.volume_processor.threshold_cache:
+            await self.volume_processor.threshold_cache.warm_start(symbols)
+            self.volume_processor.threshold_cache.start(symbols)
         
         # Global streams (all symbols)
-        # Liquidation stream
-        task = asyncio.create_task(self._start_liquidation_stream())
-        self.active_streams['liquidations'] = task
-        tasks.append(task)
+        await self.multiplexer.subscribe([self.stream_configs['liquidations']], self._process_liquidation_message)
+        await self.multiplexer.subscribe([self.stream_configs['book_ticker']], self._process_book_ticker_message)
+        self.active_streams.update(self.stream_configs)
         
-        # Book ticker stream for order book analysis
-        task = asyncio.create_task(self._start_book_ticker_stream())
-        self.active_streams['book_ticker'] = task
-        tasks.append(task)
-        
-        logger.info(f"Started {len(tasks)} real-time streams")
+        tasks = await self.multiplexer.start()
+        logger.info(f"Started {len(self.active_streams)} real-time streams on {len(tasks)} connections")
         
         # Don't await - let streams run in background
         return tasks
     
+    async def add_symbols(self, symbols: List[str]):
+        """Subscribe trade streams at runtime without reconnecting"""
+        streams = [f"{symbol.lower()}@trade" for symbol in symbols]
+        await self.multiplexer.subscribe(streams, self._process_trade_message)
+        if self.volume_processor.threshold_cache:
+            self.volume_processor.threshold_cache.track(symbols)
+        for symbol, stream in zip(symbols, streams):
+            self.active_streams[f"{symbol}_trades"] = stream
+    
+    async def remove_symbols(self, symbols: List[str]):
+        """Unsubscribe trade streams at runtime without reconnecting"""
+        streams = [self.active_streams.pop(f"{symbol}_trades", f"{symbol.lower()}@trade") for symbol in symbols]
+        await self.multiplexer.unsubscribe(streams)
+        if self.volume_processor.threshold_cache:
+            self.volume_processor.threshold_cache.untrack(symbols)
+    
     async def stop_monitoring(self):
         """Stop all monitoring streams"""
         logger.info("Stopping real-time monitoring")
         self.running = False
         
-        # Cancel all active streams
-        for stream_name, task in self.active_streams.items():
-            if not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    logger.info(f"Stopped stream: {stream_name}")
-                except Exception as e:
-                    logger.error(f"Error stopping stream {stream_name}: {e}")
-        
+        await self.multiplexer.stop()
+        await self.multiplexer.unsubscribe(list(self.active_streams.values()))
         self.active_streams.clear()
+        await self.ingestion_queue.stop()
+        if self.volume_processor.threshold_cache:
+            await self.volume_processor.threshold_cache.stop()
     
-    async def _start_trade_stream(self, symbol: str):
-        """WebSocket stream for individual symbol trades"""
-        stream_name = f"{symbol.lower()}@trade"
-        url = f"wss://fstream.binance.com/ws/{stream_name}"
-        
-        retry_count = 0
-        while self.running:
-            try:
-                async with websockets.connect(url, ping_interval=20, ping_timeout=10) as websocket:
-                    logger.info(f"Connected to trade stream: {symbol}")
-                    retry_count = 0  # Reset on successful connection
-                    
-                    async for message in websocket:
-                        if not self.running:
-                            break
-                        
-                        try:
-                            data = json.loads(message)
-                            await self._process_trade_message(data)
-                        except json.JSONDecodeError:
-                            continue
-                        except Exception as e:
-                            logger.error(f"Error processing trade message for {symbol}: {e}")
-                            
-            except websockets.exceptions.ConnectionClosed:
-                logger.warning(f"Trade stream connection closed: {symbol}")
-            except Exception as e:
-                logger.error(f"Trade stream error for {symbol}: {e}")
-            
-            # Reconnect with exponential backoff
-            if self.running:
-                delay = min(self.reconnect_delays[min(retry_count, len(self.reconnect_delays)-1)], 
-                          self.max_reconnect_delay)
-                logger.info(f"Reconnecting trade stream for {symbol} in {delay}s...")
-                await asyncio.sleep(delay)
-                retry_count += 1
-    
-    async def _start_liquidation_stream(self):
-        """WebSocket stream for liquidations"""
-        url = "wss://fstream.binance.com/ws/!forceOrder@arr"
-        
-        retry_count = 0
-        while self.running:
-            try:
-                async with websockets.connect(url, ping_interval=20, ping_timeout=10) as websocket:
-                    logger.info("Connected to liquidation stream")
-                    retry_count = 0
-                    
-                    async for message in websocket:
-                        if not self.running:
-                            break
-                        
-                        try:
-                            data = json.loads(message)
-                            await self._process_liquidation_message(data)
-                        except json.JSONDecodeError:
-                            continue
-                        except Exception as e:
-                            logger.error(f"Error processing liquidation message: {e}")
-                            
-            except websockets.exceptions.ConnectionClosed:
-                logger.warning("Liquidation stream connection closed")
-            except Exception as e:
-                logger.error(f"Liquidation stream error: {e}")
-            
-            if self.running:
-                delay = min(self.reconnect_delays[min(retry_count, len(self.reconnect_delays)-1)], 
-                          self.max_reconnect_delay)
-                logger.info(f"Reconnecting liquidation stream in {delay}s...")
-                await asyncio.sleep(delay)
-                retry_count += 1
-    
-    async def _start_book_ticker_stream(self):
-        """WebSocket stream for order book tickers"""
-        url = "wss://fstream.binance.com/ws/!bookTicker"
-        
-        retry_count = 0
-        while self.running:
-            try:
-                async with websockets.connect(url, ping_interval=20, ping_timeout=10) as websocket:
-                    logger.info("Connected to book ticker stream")
-                    retry_count = 0
-                    
-                    async for message in websocket:
-                        if not self.running:
-                            break
-                        
-                        try:
-                            data = json.loads(message)
-                            await self._process_book_ticker_message(data)
-                        except json.JSONDecodeError:
-                            continue
-                        except Exception as e:
-                            logger.error(f"Error processing book ticker message: {e}")
-                            
-            except websockets.exceptions.ConnectionClosed:
-                logger.warning("Book ticker stream connection closed")
-            except Exception as e:
-                logger.error(f"Book ticker stream error: {e}")
-            
-            if self.running:
-                delay = min(self.reconnect_delays[min(retry_count, len(self.reconnect_delays)-1)], 
-                          self.max_reconnect_delay)
-                logger.info(f"Reconnecting book ticker stream in {delay}s...")
-                await asyncio.sleep(delay)
-                retry_count += 1
-    
-    async def _process_trade_message(self, data: dict):
+    async def _dispatch_event(self, event):
+        """Ingestion worker entry point: run one event through all processors"""
+        if isinstance(event, TradeEvent):
+            for processor in self.processors:
+                await processor.process_trade(event)
+        elif isinstance(event, LiquidationEvent):
+            for processor in self.processors:
+                await processor.process_liquidation(event)
+    
+    async def _process_trade_message(self, data):
         """Process individual trade message"""
         try:
-            # Binance trade stream format
-            symbol = data.get('s', '')
-            price = float(data.get('p', 0))
-            quantity = float(data.get('q', 0))
-            timestamp_ms = int(data.get('T', 0))
-            is_buyer_maker = data.get('m', False)
+            # Binance trade stream format, decoded straight into a typed struct
+            trade = self.decoder.decode_trade(data)
+            price = trade.price
+            quantity = trade.quantity
             
             # Calculate trade details
             value_usd = price * quantity
-            side = 'SELL' if is_buyer_maker else 'BUY'  # Buyer maker = sell pressure
+            side = SIDE_SELL if trade.is_buyer_maker else SIDE_BUY  # Buyer maker = sell pressure
             is_whale = value_usd > 500000  # >$500k = whale trade
             
             # Create trade event
             trade_event = TradeEvent(
-                symbol=symbol,
+                symbol=trade.symbol,
                 price=price,
                 quantity=quantity,
                 value_usd=value_usd,
                 side=side,
                 is_whale=is_whale,
-                timestamp=datetime.fromtimestamp(timestamp_ms / 1000),
+                timestamp_ms=trade.trade_time,
                 exchange='binance',
-                trade_id=data.get('t', '')
+                trade_id=trade.trade_id
             )
             
-            # Process through all processors
-            for processor in self.processors:
-                await processor.process_trade(trade_event)
+            # Hand off to the processor workers; the reader never waits on processing
+            await self.ingestion_queue.put(trade.symbol, trade_event)
                 
         except Exception as e:
             logger.error(f"Error processing trade message: {e}")
     
-    async def _process_liquidation_message(self, data: dict):
+    async def _process_liquidation_message(self, data):
         """Process liquidation message"""
         try:
-            order = data.get('o', {})
-            if not order:
-                return
-            
-            symbol = order.get('s', '')
-            side_str = order.get('S', '')  # SELL = long liquidation
-            price = float(order.get('ap', 0))
-            quantity = float(order.get('z', 0))
-            timestamp_ms = int(order.get('T', 0))
+            order = self.decoder.decode_force_order(data).order
+            symbol = order.symbol
+            price = order.avg_price
+            quantity = order.filled_quantity
             
-            # Convert side (Binance uses opposite logic)
-            side = 'LONG' if side_str == 'SELL' else 'SHORT'
+            # Convert side (Binance uses opposite logic: SELL = long liquidation)
+            side = LIQUIDATION_LONG if order.side == 'SELL' else LIQUIDATION_SHORT
             value_usd = price * quantity
             
             # Create liquidation event
@@ -597,25 +577,25 @@ class RealTimeDataPipeline:
                 price=price,
                 quantity=quantity,
                 value_usd=value_usd,
-                timestamp=datetime.fromtimestamp(timestamp_ms / 1000),
+                timestamp_ms=order.trade_time,
                 exchange='binance'
             )
             
-            # Process through all processors
-            for processor in self.processors:
-                await processor.process_liquidation(liquidation_event)
+            # Liquidations are rare and must not be dropped: the must-keep lane is never evicted
+            await self.ingestion_queue.put(symbol, liquidation_event, block=True)
                 
         except Exception as e:
             logger.error(f"Error processing liquidation message: {e}")
     
-    async def _process_book_ticker_message(self, data: dict):
+    async def _process_book_ticker_message(self, data):
         """Process book ticker message for order book analysis"""
         try:
-            symbol = data.get('s', '')
-            best_bid = float(data.get('b', 0))
-            best_ask = float(data.get('a', 0))
-            bid_qty = float(data.get('B', 0))
-            ask_qty = float(data.get('A', 0))
+            ticker = self.decoder.decode_book_ticker(data)
+            symbol = ticker.symbol
+            best_bid = ticker.best_bid
+            best_ask = ticker.best_ask
+            bid_qty = ticker.bid_quantity
+            ask_qty = ticker.ask_quantity
             
             if best_bid > 0 and best_ask > 0:
                 # Calculate order book metrics
@@ -636,7 +616,7 @@ class RealTimeDataPipeline:
                     spread_bps=spread_bps,
                     best_bid=best_bid,
                     best_ask=best_ask,
-                    timestamp=datetime.now()
+                    timestamp_ms=ticker.event_time
                 )
                 
                 # Process order book data (could add order book processor later)
@@ -659,5 +639,7 @@ class RealTimeDataPipeline:
             'active_streams': len(self.active_streams),
             'stream_names': list(self.active_streams.keys()),
             'processors': processor_status,
-            'total_symbols_monitored': len([s for s in self.active_streams.keys() if '_trades' in s])
+            'total_symbols_monitored': len([s for s in self.active_streams.keys() if '_trades' in s]),
+            'multiplexer': self.multiplexer.get_status(),
+            'ingestion': self.ingestion_queue.get_metrics()
         }
\ No newline at end of file
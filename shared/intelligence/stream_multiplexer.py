@@ -0,0 +1,244 @@
+"""
+Combined-Stream WebSocket Multiplexer - Binance futures
+Packs many streams onto a few `/stream?streams=a/b/...` connections,
+supports runtime SUBSCRIBE/UNSUBSCRIBE without reconnecting and routes
+each message to its handler by stream name
+Part of the Institutional Trading Intelligence System
+"""
+
+import asyncio
+import websockets
+import json
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+from datetime import datetime
+import logging
+
+try:
+    from .message_decoder import MessageDecoder, get_decoder
+except ImportError:
+    from message_decoder import MessageDecoder, get_decoder
+
+logger = logging.getLogger(__name__)
+
+StreamHandler = Callable[[dict], Awaitable[None]]
+
+
+class StreamConnection:
+    """One combined-stream websocket carrying up to max_streams_per_connection streams"""
+
+    def __init__(self, multiplexer: 'CombinedStreamMultiplexer', connection_id: int):
+        self.multiplexer = multiplexer
+        self.connection_id = connection_id
+        self.streams: Set[str] = set()
+        self.websocket = None
+        self.task: Optional[asyncio.Task] = None
+        self.next_request_id = 1
+        self.messages_received = 0
+        self.reconnects = 0
+        self.connected_at: Optional[datetime] = None
+
+    @property
+    def name(self) -> str:
+        return f"combined_{self.connection_id}"
+
+    @property
+    def free_slots(self) -> int:
+        return self.multiplexer.max_streams_per_connection - len(self.streams)
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task and not self.task.done():
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.error(f"Error stopping {self.name}: {e}")
+        self.task = None
+
+    async def send_method(self, method: str, streams: List[str]):
+        """Send SUBSCRIBE/UNSUBSCRIBE on the live socket (no-op while reconnecting)"""
+        if self.websocket is None or not streams:
+            return
+        request = {'method': method, 'params': streams, 'id': self.next_request_id}
+        self.next_request_id += 1
+        try:
+            await self.websocket.send(json.dumps(request))
+        except Exception as e:
+            # The reconnect path re-subscribes from self.streams, so nothing is lost
+            logger.warning(f"{self.name} {method} failed, will apply on reconnect: {e}")
+
+    async def _run(self):
+        mux = self.multiplexer
+        retry_count = 0
+        while mux.running and self.streams:
+            url_streams = sorted(self.streams)
+            url = f"{mux.base_url}?streams={'/'.join(url_streams)}"
+            try:
+                async with websockets.connect(url, ping_interval=20, ping_timeout=10) as websocket:
+                    self.websocket = websocket
+                    self.connected_at = datetime.now()
+                    retry_count = 0
+                    logger.info(f"Connected {self.name} with {len(self.streams)} streams")
+
+                    # Catch up on subscription changes made during the handshake
+                    await self.send_method('SUBSCRIBE', sorted(self.streams.difference(url_streams)))
+                    await self.send_method('UNSUBSCRIBE', sorted(set(url_streams).difference(self.streams)))
+
+                    async for message in websocket:
+                        if not mux.running:
+                            break
+                        self.messages_received += 1
+                        await mux._dispatch(message)
+
+            except asyncio.CancelledError:
+                raise
+            except websockets.exceptions.ConnectionClosed:
+                logger.warning(f"{self.name} connection closed")
+            except Exception as e:
+                logger.error(f"{self.name} stream error: {e}")
+            finally:
+                self.websocket = None
+
+            if mux.running and self.streams:
+                delay = min(mux.reconnect_delays[min(retry_count, len(mux.reconnect_delays) - 1)],
+                            mux.max_reconnect_delay)
+                logger.info(f"Reconnecting {self.name} in {delay}s...")
+                await asyncio.sleep(delay)
+                retry_count += 1
+                self.reconnects += 1
+
+
+class CombinedStreamMultiplexer:
+    """
+    Routes many Binance streams over a small pool of combined-stream sockets
+
+    Streams are assigned to the first connection with free capacity. While a
+    connection is live, subscription changes go out as SUBSCRIBE/UNSUBSCRIBE
+    frames on the open socket. A reconnect rebuilds the URL from the
+    connection's current stream set. Handlers receive the `data` part of each
+    frame as returned by MessageDecoder.decode_envelope and decode it with
+    the typed schema for their stream.
+    """
+
+    def __init__(self, base_url: str = 'wss://fstream.binance.com/stream',
+                 max_streams_per_connection: int = 200, decoder: Optional[MessageDecoder] = None):
+        self.base_url = base_url
+        self.decoder = decoder or get_decoder()
+        self.max_streams_per_connection = max_streams_per_connection
+        self.handlers: Dict[str, StreamHandler] = {}  # stream name -> handler
+        self.stream_connection: Dict[str, StreamConnection] = {}
+        self.connections: List[StreamConnection] = []
+        self.running = False
+        self.reconnect_delays = [1, 2, 4, 8, 16]  # Exponential backoff
+        self.max_reconnect_delay = 60
+        self.unrouted_messages = 0
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, streams: List[str], handler: StreamHandler):
+        """Route `streams` to `handler`, subscribing on live sockets where possible"""
+        async with self._lock:
+            pending: Dict[StreamConnection, List[str]] = {}
+            for stream in streams:
+                stream = self._normalize(stream)
+                self.handlers[stream] = handler
+                if stream in self.stream_connection:
+                    continue
+
+                connection = next((c for c in self.connections if c.free_slots > 0), None)
+                if connection is None:
+                    connection = StreamConnection(self, len(self.connections))
+                    self.connections.append(connection)
+                connection.streams.add(stream)
+                self.stream_connection[stream] = connection
+                pending.setdefault(connection, []).append(stream)
+
+            for connection, added in pending.items():
+                if connection.websocket is not None:
+                    await connection.send_method('SUBSCRIBE', added)
+                elif self.running:
+                    connection.start()
+
+    async def unsubscribe(self, streams: List[str]):
+        """Stop routing `streams`, unsubscribing on live sockets"""
+        async with self._lock:
+            pending: Dict[StreamConnection, List[str]] = {}
+            for stream in streams:
+                stream = self._normalize(stream)
+                self.handlers.pop(stream, None)
+                connection = self.stream_connection.pop(stream, None)
+                if connection is None:
+                    continue
+                connection.streams.discard(stream)
+                pending.setdefault(connection, []).append(stream)
+
+            for connection, removed in pending.items():
+                if connection.streams:
+                    await connection.send_method('UNSUBSCRIBE', removed)
+                else:
+                    await connection.stop()
+
+    async def start(self) -> List[asyncio.Task]:
+        """Open every connection that has streams assigned"""
+        self.running = True
+        for connection in self.connections:
+            if connection.streams:
+                connection.start()
+        return [c.task for c in self.connections if c.task is not None]
+
+    async def stop(self):
+        """Close all connections"""
+        self.running = False
+        for connection in self.connections:
+            await connection.stop()
+
+    async def _dispatch(self, message):
+        """Route one combined-stream frame to its handler"""
+        try:
+            stream, data = self.decoder.decode_envelope(message)
+        except self.decoder.decode_errors:
+            return
+
+        if stream is None:
+            # SUBSCRIBE/UNSUBSCRIBE acknowledgement: {"result": null, "id": n}
+            if isinstance(data, dict) and (data.get('result') is not None or 'error' in data):
+                logger.warning(f"Stream control response: {data}")
+            return
+
+        handler = self.handlers.get(stream)
+        if handler is None:
+            # Late frames after an unsubscribe
+            self.unrouted_messages += 1
+            return
+
+        try:
+            await handler(data)
+        except Exception as e:
+            logger.error(f"Error handling {stream} message: {e}")
+
+    @staticmethod
+    def _normalize(stream: str) -> str:
+        # Symbol streams are lowercase; market-wide streams keep their '!' prefix casing
+        return stream if stream.startswith('!') else stream.lower()
+
+    def get_status(self) -> dict:
+        """Connection and subscription status"""
+        return {
+            'connections': len([c for c in self.connections if c.streams]),
+            'streams': len(self.stream_connection),
+            'unrouted_messages': self.unrouted_messages,
+            'per_connection': [
+                {
+                    'name': c.name,
+                    'streams': len(c.streams),
+                    'connected': c.websocket is not None,
+                    'messages_received': c.messages_received,
+                    'reconnects': c.reconnects
+                }
+                for c in self.connections if c.streams
+            ]
+        }
@@ -1,14 +1,16 @@
 """
 Compact Liquidation Data Model
 Memory-optimized structure for liquidation events
-Target: 18 bytes per record
+Storage: 15 bytes per record in a packed NumPy structured ring buffer
+(18-byte budget)
 """
 
-import struct
-from typing import NamedTuple, Optional
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 from datetime import datetime
 from enum import IntEnum
 
+import numpy as np
+
 
 class LiquidationSide(IntEnum):
     """Liquidation side enumeration"""
@@ -16,23 +18,80 @@ class LiquidationSide(IntEnum):
     SHORT = 2
 
 
+# Packed record layout: 4 + 2 + 1 + 4 + 4 = 15 bytes (USD value is price * quantity)
+LIQUIDATION_DTYPE = np.dtype([
+    ('timestamp', '<u4'),   # Unix timestamp (seconds)
+    ('symbol_id', '<u2'),   # SymbolTable id
+    ('side', 'u1'),         # 1=long, 2=short
+    ('price', '<f4'),       # Average fill price
+    ('quantity', '<f4'),    # Filled quantity
+])
+
+
+class SymbolTable:
+    """
+    Stable symbol <-> uint16 id mapping
+
+    Ids are assigned in first-seen order and never reused, so they stay valid
+    for the lifetime of the table. Seeding a table with the same symbol list
+    (e.g. a persisted `to_list()`) reproduces the same ids after a restart,
+    unlike the process-salted built-in hash() of a str.
+    """
+
+    MAX_SYMBOLS = 1 << 16
+
+    def __init__(self, symbols: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        for symbol in symbols:
+            self.id_for(symbol)
+
+    def id_for(self, symbol: str) -> int:
+        """Id for `symbol`, assigning the next free one if it is new"""
+        symbol = symbol.upper()
+        symbol_id = self._ids.get(symbol)
+        if symbol_id is None:
+            if len(self._symbols) >= self.MAX_SYMBOLS:
+                raise ValueError(f"Symbol table full ({self.MAX_SYMBOLS} symbols)")
+            symbol_id = len(self._symbols)
+            self._ids[symbol] = symbol_id
+            self._symbols.append(symbol)
+        return symbol_id
+
+    def lookup(self, symbol: str) -> Optional[int]:
+        """Id for `symbol` without assigning one"""
+        return self._ids.get(symbol.upper())
+
+    def symbol_for(self, symbol_id: int) -> str:
+        return self._symbols[symbol_id]
+
+    def to_list(self) -> List[str]:
+        """Symbols in id order, for persisting the table"""
+        return list(self._symbols)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+
+# Process-wide table; the majors are seeded so their ids never change
+SYMBOL_TABLE = SymbolTable(['BTCUSDT', 'ETHUSDT', 'SOLUSDT'])
+
+
 class CompactLiquidation(NamedTuple):
     """
-    Memory-optimized liquidation record
-    Total size: 18 bytes
+    Single liquidation record (row view of a LiquidationBuffer entry)
     """
-    timestamp: int  # Unix timestamp (4 bytes)
-    symbol_hash: int  # Hash of symbol (4 bytes)
-    side: int  # 1=long, 2=short (1 byte)
-    price: int  # Price * 100 (4 bytes)
-    quantity: int  # Quantity * 1000000 (4 bytes)
-    value_usd: int  # USD value (1 byte for scaling factor, stored as value/1000)
-    
+    timestamp: int  # Unix timestamp (seconds)
+    symbol_id: int  # SymbolTable id
+    side: int  # 1=long, 2=short
+    price: float  # Average fill price
+    quantity: float  # Filled quantity
+
     @classmethod
-    def from_binance_data(cls, data: dict) -> 'CompactLiquidation':
+    def from_binance_data(cls, data: dict, symbols: SymbolTable = SYMBOL_TABLE) -> 'CompactLiquidation':
         """
         Create compact liquidation from Binance WebSocket data
-        
+
         Expected Binance format:
         {
             "o": {
@@ -43,57 +102,49 @@ class CompactLiquidation(NamedTuple):
                 "p": "43811.36",
                 "ap": "43811.36",
                 "X": "FILLED",
-                "l": "0.162", 
+                "l": "0.162",
                 "z": "0.162",
                 "T": 1640995200000
             }
         }
         """
         order = data.get('o', {})
-        
-        # Extract values
-        symbol = order.get('s', '')
-        side_str = order.get('S', '')
-        price = float(order.get('ap', 0))  # Average price
-        quantity = float(order.get('z', 0))  # Filled quantity
-        timestamp = int(order.get('T', 0)) // 1000  # Convert to seconds
-        
-        # Calculate USD value
-        value_usd = price * quantity
-        
+
         # Convert side (Binance uses opposite logic)
-        side = LiquidationSide.LONG if side_str == 'SELL' else LiquidationSide.SHORT
-        
-        # Create compact representation
+        side = LiquidationSide.LONG if order.get('S', '') == 'SELL' else LiquidationSide.SHORT
+
         return cls(
-            timestamp=timestamp,
-            symbol_hash=hash(symbol) & 0xFFFFFFFF,  # 4 bytes
+            timestamp=int(order.get('T', 0)) // 1000,  # Convert to seconds
+            symbol_id=symbols.id_for(order.get('s', '')),
             side=side.value,
-            price=int(price * 100),  # Store with 2 decimal precision
-            quantity=int(quantity * 1000000),  # Store with 6 decimal precision
-            value_usd=int(value_usd / 1000)  # Store in thousands
+            price=float(order.get('ap', 0)),  # Average price
+            quantity=float(order.get('z', 0))  # Filled quantity
         )
-    
+
     @property
     def actual_price(self) -> float:
-        """Get actual price with decimal precision"""
-        return self.price / 100.0
-    
+        """Get actual price"""
+        return self.price
+
     @property
     def actual_quantity(self) -> float:
-        """Get actual quantity with decimal precision"""
-        return self.quantity / 1000000.0
-    
+        """Get actual quantity"""
+        return self.quantity
+
     @property
     def actual_value_usd(self) -> float:
         """Get actual USD value"""
-        return self.actual_price * self.actual_quantity
-    
+        return self.price * self.quantity
+
     @property
     def side_str(self) -> str:
         """Get human-readable side"""
         return "LONG" if self.side == LiquidationSide.LONG else "SHORT"
-    
+
+    def symbol(self, symbols: SymbolTable = SYMBOL_TABLE) -> str:
+        """Resolve the symbol id"""
+        return symbols.symbol_for(self.symbol_id)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
         return {
@@ -103,64 +154,96 @@ class CompactLiquidation(NamedTuple):
             'quantity': self.actual_quantity,
             'value_usd': self.actual_value_usd
         }
-    
+
     def __sizeof__(self) -> int:
-        """Return memory size in bytes"""
-        return 18  # 4+4+1+4+4+1 bytes
+        """Return packed storage size in bytes"""
+        return LIQUIDATION_DTYPE.itemsize
 
 
 class LiquidationBuffer:
     """
-    Ring buffer for liquidations with memory constraints
-    Max 1000 liquidations = ~18KB memory usage
+    Ring buffer for liquidations backed by one packed structured array
+    Max 1000 liquidations = ~15KB memory usage
+
+    Queries return structured arrays with LIQUIDATION_DTYPE fields, oldest
+    first; use `to_liquidations` for CompactLiquidation rows.
     """
-    
-    def __init__(self, max_size: int = 1000):
+
+    def __init__(self, max_size: int = 1000, symbols: SymbolTable = SYMBOL_TABLE):
         self.max_size = max_size
-        self.buffer: list[CompactLiquidation] = []
-        self.head = 0
+        self.symbols = symbols
+        self.records = np.zeros(max_size, dtype=LIQUIDATION_DTYPE)
+        self.head = 0  # Next slot to write; the oldest entry once the ring is full
         self.count = 0
-    
+
     def add(self, liquidation: CompactLiquidation) -> None:
-        """Add liquidation to buffer"""
+        """Add liquidation to buffer, overwriting the oldest entry when full"""
+        self.records[self.head] = liquidation
+        self.head = (self.head + 1) % self.max_size
         if self.count < self.max_size:
-            self.buffer.append(liquidation)
             self.count += 1
-        else:
-            # Overwrite oldest entry
-            self.buffer[self.head] = liquidation
-            self.head = (self.head + 1) % self.max_size
-    
-    def get_recent(self, seconds: int = 30) -> list[CompactLiquidation]:
-        """Get liquidations from last N seconds"""
-        current_time = int(datetime.now().timestamp())
-        cutoff_time = current_time - seconds
-        
-        recent = []
-        for liq in self.buffer:
-            if liq.timestamp >= cutoff_time:
-                recent.append(liq)
-        
-        return recent
-    
-    def get_cascade_data(self, seconds: int = 30) -> tuple[list[CompactLiquidation], float]:
+
+    def _ordered(self) -> np.ndarray:
+        """Entries oldest first (a view until the ring wraps)"""
+        if self.count < self.max_size:
+            return self.records[:self.count]
+        return np.concatenate((self.records[self.head:], self.records[:self.head]))
+
+    def get_recent(self, seconds: int = 30, symbol: Optional[str] = None) -> np.ndarray:
+        """Get liquidations from last N seconds, optionally for one symbol"""
+        cutoff_time = int(datetime.now().timestamp()) - seconds
+
+        ordered = self._ordered()
+        mask = ordered['timestamp'] >= cutoff_time
+        if symbol is not None:
+            symbol_id = self.symbols.lookup(symbol)
+            if symbol_id is None:
+                return ordered[:0]
+            mask &= ordered['symbol_id'] == symbol_id
+
+        return ordered[mask]
+
+    @staticmethod
+    def values_usd(records: np.ndarray) -> np.ndarray:
+        """USD value per record, computed in float64"""
+        return records['price'].astype(np.float64) * records['quantity']
+
+    def get_cascade_data(self, seconds: int = 30, symbol: Optional[str] = None) -> Tuple[np.ndarray, float]:
         """Get cascade liquidations and total value"""
+        recent = self.get_recent(seconds, symbol)
+        return recent, float(self.values_usd(recent).sum())
+
+    def get_symbol_totals(self, seconds: int = 30) -> Dict[str, Tuple[int, float]]:
+        """Count and total USD value per symbol over the last N seconds"""
         recent = self.get_recent(seconds)
-        total_value = sum(liq.actual_value_usd for liq in recent)
-        return recent, total_value
-    
+        if not len(recent):
+            return {}
+
+        symbol_ids = recent['symbol_id']
+        counts = np.bincount(symbol_ids)
+        totals = np.bincount(symbol_ids, weights=self.values_usd(recent))
+        return {
+            self.symbols.symbol_for(symbol_id): (int(counts[symbol_id]), float(totals[symbol_id]))
+            for symbol_id in np.flatnonzero(counts)
+        }
+
+    def to_liquidations(self, records: np.ndarray) -> List[CompactLiquidation]:
+        """Materialize structured records as CompactLiquidation rows"""
+        return [CompactLiquidation(*row) for row in records.tolist()]
+
     def clear_old(self, seconds: int = 300) -> None:
         """Clear liquidations older than N seconds"""
-        current_time = int(datetime.now().timestamp())
-        cutoff_time = current_time - seconds
-        
-        self.buffer = [liq for liq in self.buffer if liq.timestamp >= cutoff_time]
-        self.count = len(self.buffer)
-        self.head = 0
-    
+        cutoff_time = int(datetime.now().timestamp()) - seconds
+
+        ordered = self._ordered()
+        kept = ordered[ordered['timestamp'] >= cutoff_time]
+        self.records[:len(kept)] = kept
+        self.count = len(kept)
+        self.head = self.count % self.max_size
+
     def memory_usage(self) -> int:
-        """Get current memory usage in bytes"""
-        return len(self.buffer) * 18
-    
+        """Get current memory usage in bytes (allocated record storage)"""
+        return self.records.nbytes
+
     def __len__(self) -> int:
-        return len(self.buffer)
\ No newline at end of file
+        return self.count
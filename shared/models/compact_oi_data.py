@@ -4,11 +4,10 @@ Memory-optimized structure for OI monitoring
 Target: 24-hour rolling window with minimal memory usage
 """
 
-import struct
-from typing import NamedTuple, Dict, List, Optional
-from datetime import datetime, timedelta
+from array import array
+from typing import Dict, List, Optional
+from datetime import datetime
 from dataclasses import dataclass
-from collections import defaultdict
 
 
 @dataclass
@@ -25,20 +24,116 @@ class OISnapshot:
         self.symbol = self.symbol.upper().replace("USDT", "").replace("USDC", "")
 
 
+class OITimeSeries:
+    """
+    Fixed-capacity ring of (timestamp, oi_usd) points kept in time order
+    
+    Timestamps live in an int64 array and OI values in a float64 array,
+    preallocated to `capacity` (16 bytes per point). Appends and evictions
+    are O(1); a late point is placed by binary search and the newer points
+    are shifted right by one. Window lookups are binary searches.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = array('q', [0]) * capacity
+        self.values = array('d', [0.0]) * capacity
+        self.start = 0  # Physical slot of the oldest point
+        self.size = 0
+    
+    def _slot(self, index: int) -> int:
+        return (self.start + index) % self.capacity
+    
+    def timestamp_at(self, index: int) -> int:
+        return self.timestamps[self._slot(index)]
+    
+    def value_at(self, index: int) -> float:
+        return self.values[self._slot(index)]
+    
+    def bisect_left(self, timestamp: int) -> int:
+        """Index of the first point with timestamp >= `timestamp`"""
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.timestamps[(self.start + mid) % self.capacity] < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+    
+    def bisect_right(self, timestamp: int) -> int:
+        """Index after the last point with timestamp <= `timestamp`"""
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if timestamp < self.timestamps[(self.start + mid) % self.capacity]:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+    
+    def add(self, timestamp: int, value: float) -> None:
+        """Insert a point, evicting the oldest one when full"""
+        position = self.size
+        if self.size and timestamp < self.timestamp_at(self.size - 1):
+            position = self.bisect_right(timestamp)
+        
+        if self.size == self.capacity:
+            if position == 0:
+                return  # Older than everything retained
+            self.start = (self.start + 1) % self.capacity
+            self.size -= 1
+            position -= 1
+        
+        # Shift points newer than a late arrival one slot to the right
+        for index in range(self.size, position, -1):
+            src, dst = self._slot(index - 1), self._slot(index)
+            self.timestamps[dst] = self.timestamps[src]
+            self.values[dst] = self.values[src]
+        
+        slot = self._slot(position)
+        self.timestamps[slot] = timestamp
+        self.values[slot] = value
+        self.size += 1
+    
+    def drop_before(self, timestamp: int) -> None:
+        """Evict every point older than `timestamp`"""
+        dropped = self.bisect_left(timestamp)
+        self.start = self._slot(dropped)
+        self.size -= dropped
+    
+    def since(self, timestamp: int) -> List[tuple[int, float]]:
+        """Points with timestamp >= `timestamp`, oldest first"""
+        return [(self.timestamp_at(i), self.value_at(i)) for i in range(self.bisect_left(timestamp), self.size)]
+    
+    def last_value(self) -> Optional[float]:
+        return self.value_at(self.size - 1) if self.size else None
+    
+    @property
+    def nbytes(self) -> int:
+        return self.timestamps.itemsize * self.capacity + self.values.itemsize * self.capacity
+    
+    def __len__(self) -> int:
+        return self.size
+
+
 class CompactOIData:
     """
     Memory-optimized OI data storage
-    Stores 24 hours of OI data with 5-minute granularity
-    Max: 288 data points per symbol per exchange = ~7KB per symbol
+    Stores 24 hours of OI data at `resolution_seconds` granularity
+    5-minute polling: 288 data points per exchange = ~4.6KB per exchange
+    15-second streaming: 5760 data points per exchange = ~92KB per exchange
     """
     
-    def __init__(self, symbol: str, max_hours: int = 24):
+    def __init__(self, symbol: str, max_hours: int = 24, resolution_seconds: int = 300):
         self.symbol = symbol.upper()
         self.max_hours = max_hours
-        self.max_data_points = (max_hours * 60) // 5  # 5-minute intervals
+        self.resolution_seconds = resolution_seconds
+        self.max_data_points = (max_hours * 3600) // resolution_seconds
+        self.points_per_hour = max(1, 3600 // resolution_seconds)
         
-        # Exchange data: exchange -> [(timestamp, oi_usd), ...]
-        self.exchange_data: Dict[str, List[tuple[int, float]]] = defaultdict(list)
+        # Exchange data: exchange -> time-ordered ring of (timestamp, oi_usd)
+        self.exchange_data: Dict[str, OITimeSeries] = {}
         
         # Baseline OI values for percentage calculations
         self.baseline_oi: Dict[str, float] = {}
@@ -46,41 +141,42 @@ class CompactOIData:
     def add_snapshot(self, snapshot: OISnapshot) -> None:
         """Add new OI snapshot"""
         exchange = snapshot.exchange.lower()
-        timestamp = snapshot.timestamp
-        oi_usd = snapshot.oi_usd
-        
-        # Add to exchange data
-        self.exchange_data[exchange].append((timestamp, oi_usd))
         
-        # Sort by timestamp and limit size
-        self.exchange_data[exchange].sort(key=lambda x: x[0])
-        if len(self.exchange_data[exchange]) > self.max_data_points:
-            self.exchange_data[exchange] = self.exchange_data[exchange][-self.max_data_points:]
+        series = self.exchange_data.get(exchange)
+        if series is None:
+            series = OITimeSeries(self.max_data_points)
+            self.exchange_data[exchange] = series
+        series.add(snapshot.timestamp, snapshot.oi_usd)
         
         # Update baseline if needed
-        if exchange not in self.baseline_oi or len(self.exchange_data[exchange]) < 12:  # First hour
-            self.baseline_oi[exchange] = oi_usd
+        if exchange not in self.baseline_oi or len(series) < self.points_per_hour:  # First hour
+            self.baseline_oi[exchange] = snapshot.oi_usd
     
     def get_recent_data(self, exchange: str, minutes: int = 15) -> List[tuple[int, float]]:
         """Get OI data from last N minutes"""
         current_time = int(datetime.now().timestamp())
         cutoff_time = current_time - (minutes * 60)
         
-        exchange = exchange.lower()
-        if exchange not in self.exchange_data:
+        series = self.exchange_data.get(exchange.lower())
+        if series is None:
             return []
         
-        return [(ts, oi) for ts, oi in self.exchange_data[exchange] if ts >= cutoff_time]
+        return series.since(cutoff_time)
     
     def calculate_change_percentage(self, exchange: str, minutes: int = 15) -> Optional[float]:
         """Calculate OI change percentage over time window"""
-        recent_data = self.get_recent_data(exchange, minutes)
-        if len(recent_data) < 2:
+        series = self.exchange_data.get(exchange.lower())
+        if series is None:
+            return None
+        
+        cutoff_time = int(datetime.now().timestamp()) - (minutes * 60)
+        first = series.bisect_left(cutoff_time)
+        if series.size - first < 2:
             return None
         
         # Use oldest and newest in window
-        old_oi = recent_data[0][1]
-        new_oi = recent_data[-1][1]
+        old_oi = series.value_at(first)
+        new_oi = series.value_at(series.size - 1)
         
         if old_oi == 0:
             return None
@@ -89,11 +185,11 @@ class CompactOIData:
     
     def get_current_oi(self, exchange: str) -> Optional[float]:
         """Get most recent OI value"""
-        exchange = exchange.lower()
-        if exchange not in self.exchange_data or not self.exchange_data[exchange]:
+        series = self.exchange_data.get(exchange.lower())
+        if series is None:
             return None
         
-        return self.exchange_data[exchange][-1][1]
+        return series.last_value()
     
     def get_cross_exchange_confirmation(self, minutes: int = 15, min_exchanges: int = 2) -> Dict[str, float]:
         """Get cross-exchange OI change confirmation"""
@@ -148,15 +244,12 @@ class CompactOIData:
         current_time = int(datetime.now().timestamp())
         cutoff_time = current_time - (self.max_hours * 3600)
         
-        for exchange in self.exchange_data:
-            self.exchange_data[exchange] = [
-                (ts, oi) for ts, oi in self.exchange_data[exchange] if ts >= cutoff_time
-            ]
+        for series in self.exchange_data.values():
+            series.drop_before(cutoff_time)
     
     def memory_usage_bytes(self) -> int:
-        """Estimate memory usage in bytes"""
-        total_points = sum(len(data) for data in self.exchange_data.values())
-        return total_points * 16  # 8 bytes timestamp + 8 bytes float
+        """Memory allocated for the OI series in bytes"""
+        return sum(series.nbytes for series in self.exchange_data.values())
 
 
 class OIDataManager:
@@ -165,8 +258,9 @@ class OIDataManager:
     Memory-optimized with automatic cleanup
     """
     
-    def __init__(self, target_memory_mb: int = 40):
+    def __init__(self, target_memory_mb: int = 40, resolution_seconds: int = 300):
         self.target_memory_mb = target_memory_mb
+        self.resolution_seconds = resolution_seconds  # Expected spacing of snapshots
         self.target_memory_bytes = target_memory_mb * 1024 * 1024
         
         # Symbol -> CompactOIData
@@ -181,7 +275,7 @@ class OIDataManager:
         
         if symbol not in self.symbol_data:
             if symbol in self.monitored_symbols:
-                self.symbol_data[symbol] = CompactOIData(symbol)
+                self.symbol_data[symbol] = CompactOIData(symbol, resolution_seconds=self.resolution_seconds)
             else:
                 return  # Skip unmonitored symbols
         
@@ -216,7 +310,7 @@ class OIDataManager:
         if total_memory > self.target_memory_bytes:
             # Remove least active symbols
             symbol_activity = {
-                symbol: sum(len(data.exchange_data[ex]) for ex in data.exchange_data)
+                symbol: sum(len(series) for series in data.exchange_data.values())
                 for symbol, data in self.symbol_data.items()
             }
             
@@ -0,0 +1,182 @@
+"""
+Rolling Liquidation Windows
+Per-symbol time-ordered liquidation rings with aggregates maintained on
+insert/evict, so cascade checks read counts, totals and price moments in
+constant time instead of rescanning recent history
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Optional, Tuple
+import math
+import time
+
+INSTITUTIONAL_LIQUIDATION_USD = 500_000
+
+
+class LiquidationWindow:
+    """
+    Liquidations for one symbol within the last `duration` seconds
+
+    Events must arrive in (roughly) time order - they are appended to the
+    right and evicted from the left, each in O(1). The running max uses a
+    monotonic deque (amortized O(1)). Price moments are kept relative to a
+    reference price so the variance does not lose precision to cancellation
+    at BTC-sized prices.
+    """
+
+    __slots__ = ('duration_ms', 'institutional_usd', 'events', '_max_values',
+                 'count', 'long_count', 'total_usd', 'total_quantity', 'institutional_count',
+                 '_price_ref', '_price_sum', '_price_sq_sum')
+
+    def __init__(self, duration: float, institutional_usd: float = INSTITUTIONAL_LIQUIDATION_USD):
+        self.duration_ms = int(duration * 1000)
+        self.institutional_usd = institutional_usd
+        self.events: deque = deque()  # (timestamp_ms, is_long, price, quantity, value_usd)
+        self._max_values: deque = deque()  # (timestamp_ms, value_usd), values decreasing
+        self._reset()
+
+    def _reset(self):
+        self.count = 0
+        self.long_count = 0
+        self.total_usd = 0.0
+        self.total_quantity = 0.0
+        self.institutional_count = 0
+        self._price_ref = 0.0
+        self._price_sum = 0.0
+        self._price_sq_sum = 0.0
+
+    def add(self, timestamp_ms: int, is_long: bool, price: float, quantity: float, value_usd: float):
+        """Insert one liquidation and evict everything that fell out of the window"""
+        self.evict(timestamp_ms)
+
+        if not self.events:
+            self._price_ref = price
+        self.events.append((timestamp_ms, is_long, price, quantity, value_usd))
+
+        self.count += 1
+        self.long_count += is_long
+        self.total_usd += value_usd
+        self.total_quantity += quantity
+        self.institutional_count += value_usd >= self.institutional_usd
+        offset = price - self._price_ref
+        self._price_sum += offset
+        self._price_sq_sum += offset * offset
+
+        max_values = self._max_values
+        while max_values and max_values[-1][1] <= value_usd:
+            max_values.pop()
+        max_values.append((timestamp_ms, value_usd))
+
+    def evict(self, now_ms: int):
+        """Drop liquidations older than the window, relative to `now_ms`"""
+        cutoff = now_ms - self.duration_ms
+        events = self.events
+        while events and events[0][0] < cutoff:
+            _, is_long, price, quantity, value_usd = events.popleft()
+            self.count -= 1
+            self.long_count -= is_long
+            self.total_usd -= value_usd
+            self.total_quantity -= quantity
+            self.institutional_count -= value_usd >= self.institutional_usd
+            offset = price - self._price_ref
+            self._price_sum -= offset
+            self._price_sq_sum -= offset * offset
+
+        max_values = self._max_values
+        while max_values and max_values[0][0] < cutoff:
+            max_values.popleft()
+
+        if not events:
+            # Zero the sums so float drift never outlives the window
+            self._reset()
+
+    @property
+    def short_count(self) -> int:
+        return self.count - self.long_count
+
+    @property
+    def max_value_usd(self) -> float:
+        return self._max_values[0][1] if self._max_values else 0.0
+
+    @property
+    def avg_value_usd(self) -> float:
+        return self.total_usd / self.count if self.count else 0.0
+
+    @property
+    def avg_price(self) -> float:
+        return self._price_ref + self._price_sum / self.count if self.count else 0.0
+
+    @property
+    def price_std(self) -> float:
+        """Population standard deviation of liquidation prices"""
+        if self.count < 2:
+            return 0.0
+        mean_offset = self._price_sum / self.count
+        variance = self._price_sq_sum / self.count - mean_offset * mean_offset
+        return math.sqrt(variance) if variance > 0 else 0.0
+
+    @property
+    def first_timestamp_ms(self) -> Optional[int]:
+        return self.events[0][0] if self.events else None
+
+    @property
+    def last_timestamp_ms(self) -> Optional[int]:
+        return self.events[-1][0] if self.events else None
+
+    @property
+    def time_span_seconds(self) -> float:
+        if not self.events:
+            return 0.0
+        return (self.events[-1][0] - self.events[0][0]) / 1000.0
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class SymbolLiquidationWindows:
+    """
+    Rolling liquidation windows per symbol for a fixed set of durations
+
+    Every insert updates all of a symbol's windows; reads evict against the
+    wall clock first so an idle symbol's aggregates decay to zero.
+    """
+
+    def __init__(self, durations: Iterable[float] = (30, 60),
+                 institutional_usd: float = INSTITUTIONAL_LIQUIDATION_USD):
+        self.durations: Tuple[float, ...] = tuple(durations)
+        self.institutional_usd = institutional_usd
+        self.windows: Dict[str, Dict[float, LiquidationWindow]] = {}
+
+    def add(self, symbol: str, timestamp_ms: int, is_long: bool, price: float,
+            quantity: float, value_usd: float):
+        windows = self.windows.get(symbol)
+        if windows is None:
+            windows = {d: LiquidationWindow(d, self.institutional_usd) for d in self.durations}
+            self.windows[symbol] = windows
+        for window in windows.values():
+            window.add(timestamp_ms, is_long, price, quantity, value_usd)
+
+    def get(self, symbol: str, duration: float, now_ms: Optional[int] = None) -> Optional[LiquidationWindow]:
+        """The symbol's window for `duration` after evicting against `now_ms` (default: now)"""
+        windows = self.windows.get(symbol)
+        if windows is None:
+            return None
+        window = windows[duration]
+        window.evict(int(time.time() * 1000) if now_ms is None else now_ms)
+        return window
+
+    def prune(self, now_ms: Optional[int] = None) -> int:
+        """Forget symbols with no liquidations left in any window; returns how many were removed"""
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+        idle = []
+        for symbol, windows in self.windows.items():
+            for window in windows.values():
+                window.evict(now_ms)
+            if not any(windows.values()):
+                idle.append(symbol)
+        for symbol in idle:
+            del self.windows[symbol]
+        return len(idle)
+
+    def __len__(self) -> int:
+        return len(self.windows)
@@ -0,0 +1,38 @@
+"""Tests for which thresholds DynamicThresholdEngine treats as calibrated"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from shared.intelligence.dynamic_thresholds import DynamicThresholdEngine, MarketDataProvider
+
+
+class StubProvider(MarketDataProvider):
+    def __init__(self, volumes):
+        self.volumes = volumes
+
+    async def get_24h_volume(self, symbol):
+        return self.volumes.get(symbol)
+
+    async def get_market_cap(self, symbol):
+        volume = self.volumes.get(symbol)
+        return volume * 10 if volume else None
+
+    async def get_volatility(self, symbol, period_hours=24):
+        return 0.05
+
+    async def get_average_trade_size(self, symbol):
+        return 1000.0
+
+
+def test_thresholds_from_missing_provider_data_are_not_exported():
+    engine = DynamicThresholdEngine(StubProvider({'BTC-USDT': 20e9}))
+
+    asyncio.run(engine.calculate_thresholds(['BTC-USDT', 'NEW-USDT']))
+    state = engine.export_state()
+
+    assert set(state['data']) == {'BTC-USDT'}
+    assert set(state['profiles']) == {'BTC-USDT'}
+    assert all('NEW-USDT' not in results for results in engine.computed.values())
@@ -0,0 +1,33 @@
+"""Tests for the sharded ingestion queue overflow handling"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared', 'intelligence'))
+
+from ingestion_queue import ShardedIngestionQueue, DROP_OLDEST
+
+
+def test_drop_oldest_never_evicts_must_keep_events():
+    async def scenario():
+        delivered = []
+
+        async def consumer(event):
+            delivered.append(event)
+
+        queue = ShardedIngestionQueue(consumer, num_shards=1, max_queue_size=4, overflow_policy=DROP_OLDEST)
+        await queue.put('BTCUSDT', 'liquidation', block=True)
+        for i in range(20):
+            await queue.put('BTCUSDT', f'trade-{i}')
+
+        queue.start()
+        await queue.stop(drain=True)
+        return delivered, queue.get_metrics()
+
+    delivered, metrics = asyncio.run(scenario())
+
+    assert 'liquidation' in delivered
+    assert delivered[1:] == [f'trade-{i}' for i in range(16, 20)]
+    assert metrics['dropped'] == 16
+    assert metrics['processed'] == 5
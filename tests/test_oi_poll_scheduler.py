@@ -0,0 +1,47 @@
+"""Tests for the adaptive OI poll scheduler budgets"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from shared.intelligence.oi_poll_scheduler import OIPollScheduler
+
+
+def simulate(scheduler, duration, tick=1.0):
+    """Drive the scheduler like OIStreamCollector.run; returns symbol -> poll times"""
+    polls = {symbol: [] for symbol in scheduler.schedules}
+    now = 1000.0
+    end = now + duration
+    while now < end:
+        symbols = scheduler.next_poll(now)
+        scheduler.record_poll(symbols, now)
+        for symbol in symbols:
+            polls[symbol].append(now)
+        now += tick
+    return polls
+
+
+def test_hot_symbol_reaches_min_interval():
+    symbols = ['BTC-USDT', 'ETH-USDT', 'SOL-USDT', 'ADA-USDT', 'DOT-USDT']
+    scheduler = OIPollScheduler(
+        symbols, min_interval=30, max_interval=600, baseline_interval=300,
+        liquidation_activity=lambda symbol: 1.0 if symbol == 'SOL-USDT' else 0.0
+    )
+
+    polls = simulate(scheduler, duration=1800)
+
+    hot_gaps = [b - a for a, b in zip(polls['SOL-USDT'], polls['SOL-USDT'][1:])]
+    assert hot_gaps and max(hot_gaps) <= 31
+    quiet_gaps = [b - a for a, b in zip(polls['BTC-USDT'], polls['BTC-USDT'][1:])]
+    assert quiet_gaps and min(quiet_gaps) >= 270
+
+
+def test_quiet_market_spends_one_bulk_poll_per_baseline_interval():
+    symbols = ['BTC-USDT', 'ETH-USDT', 'SOL-USDT']
+    scheduler = OIPollScheduler(symbols, min_interval=30, max_interval=600, baseline_interval=300)
+
+    polls = simulate(scheduler, duration=1200)
+
+    assert scheduler.stats['polls'] == 4
+    assert all(len(times) == 4 for times in polls.values())
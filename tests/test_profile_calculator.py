@@ -0,0 +1,46 @@
+"""Tests that incremental session profiles match a full recompute"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'services', 'market-data'))
+
+from profile_calculator import CandleBatch, ProfileCalculator, SessionProfileAccumulator
+
+MINUTE_MS = 60_000
+
+
+def random_session(rng, num_candles, spread):
+    """BTC-scale 1m candles; small `spread` gives a narrow-range session"""
+    closes = 60000 + np.cumsum(rng.normal(0, spread, num_candles))
+    opens = np.concatenate(([closes[0]], closes[:-1]))
+    highs = np.maximum(opens, closes) + rng.uniform(0, spread, num_candles)
+    lows = np.minimum(opens, closes) - rng.uniform(0, spread, num_candles)
+    volumes = rng.uniform(1, 50, num_candles)
+    timestamps = np.arange(num_candles, dtype=np.int64) * MINUTE_MS
+    return CandleBatch(timestamps, opens, highs, lows, closes, volumes)
+
+
+@pytest.mark.parametrize('num_candles', [5, 15, 30, 60, 200])
+@pytest.mark.parametrize('spread', [0.5, 5.0, 50.0])
+def test_session_profile_matches_full_recompute(num_candles, spread):
+    rng = np.random.default_rng(num_candles * 1000 + int(spread * 10))
+    calculator = ProfileCalculator()
+
+    for _ in range(40):
+        candles = random_session(rng, num_candles, spread)
+        accumulator = SessionProfileAccumulator(0, MINUTE_MS)
+        # Fold in across several updates; the last candle is still forming
+        now_ms = num_candles * MINUTE_MS - 1
+        for chunk in np.array_split(np.arange(num_candles), 3):
+            accumulator.update(CandleBatch(*(getattr(candles, f)[:chunk[-1] + 1]
+                                             for f in CandleBatch.__dataclass_fields__)), now_ms)
+
+        assert accumulator.closed_count == num_candles - 1
+        assert calculator._session_volume_profile(accumulator, num_bins=24) == \
+            calculator.calculate_volume_profile(candles, num_bins=24)
+        assert calculator._session_tpo_profile(accumulator) == calculator.calculate_tpo_profile(candles, '1m')
+        assert accumulator.vwap() == calculator.calculate_vwap(candles)